@@ -0,0 +1,71 @@
+"""Parseia em lote as páginas do cache HTML com um pool de processos e mede a vazão."""
+
+import argparse
+import json
+from pathlib import Path
+import shutil
+import tempfile
+from time import perf_counter
+
+import pathfix  # noqa: F401
+
+from src.common.errors.errors import ProjectError
+from src.config.constants import HTML_DIR
+from src.infrastructure.datasources.goodreads_batch_parser import GoodreadsBatchParser
+from src.infrastructure.datasources.goodreads_parser import ParserOptions
+
+
+def main() -> None:
+    """Executa o parsing em lote e exibe um resumo."""
+    # Lê os parâmetros do lote pela linha de comando
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument("--html-dir", default=str(HTML_DIR), help="Diretório com as páginas.")
+    arguments.add_argument("--engine", default="lxml", help="Engine: beautifulsoup ou lxml.")
+    arguments.add_argument("--workers", type=int, default=None, help="Processos do pool.")
+    arguments.add_argument(
+        "--repeat", type=int, default=1, help="Cópias de cada página, para simular um corpus."
+    )
+    arguments.add_argument(
+        "--metrics", default=None, help="Grava o relatório de métricas do parser neste JSON."
+    )
+    options = arguments.parse_args()
+
+    try:
+        batch_parser = GoodreadsBatchParser(
+            options=ParserOptions(engine=options.engine, metrics=options.metrics is not None),
+            max_workers=options.workers,
+        )
+        pages = list(batch_parser.html_paths(Path(options.html_dir)))
+
+        with tempfile.TemporaryDirectory() as corpus_dir:
+            # Replica as páginas em um diretório temporário quando `--repeat` > 1
+            if options.repeat > 1:
+                for page in pages:
+                    for copy in range(options.repeat):
+                        shutil.copyfile(page, Path(corpus_dir) / f"{copy}-{page.name}")
+                pages = list(batch_parser.html_paths(Path(corpus_dir)))
+
+            started = perf_counter()
+            failures = [result for result in batch_parser.parse(pages) if result.error]
+            elapsed = perf_counter() - started
+
+        summary = {
+            "pages": len(pages),
+            "failed": len(failures),
+            "workers": batch_parser.max_workers,
+            "engine": options.engine,
+            "elapsed_seconds": round(elapsed, 2),
+            "pages_per_second": round(len(pages) / elapsed, 1) if elapsed else None,
+            "errors": [f"{result.path.name}: {result.error}" for result in failures[:5]],
+        }
+        if batch_parser.metrics is not None:
+            summary["metrics"] = str(batch_parser.metrics.export(Path(options.metrics)))
+            summary["failing_fields"] = batch_parser.metrics.failing_fields()
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+
+    except ProjectError as e:
+        print(f"Erro ao executar o parsing em lote: {e}")
+
+
+if __name__ == "__main__":
+    main()
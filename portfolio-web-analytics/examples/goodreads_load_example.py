@@ -0,0 +1,58 @@
+"""Teste de carga do GoodreadsScraper contra o substituto offline do Goodreads."""
+
+import argparse
+from dataclasses import asdict
+import json
+
+import pathfix  # noqa: F401
+
+from src.common.errors.errors import ProjectError
+from src.config.settings_manager import SettingsManager
+from src.pipeline.scraper_load_test import ScraperLoadTest
+
+# Lê os parâmetros do teste pela linha de comando
+arguments = argparse.ArgumentParser(description=__doc__)
+arguments.add_argument("--titles", type=int, default=200, help="Títulos baixados no teste.")
+arguments.add_argument("--concurrency", type=int, default=None, help="Requisições simultâneas.")
+arguments.add_argument("--latency-ms", type=float, default=None, help="Latência simulada.")
+arguments.add_argument("--error-rate", type=float, default=None, help="Fração de erros (0 a 1).")
+arguments.add_argument(
+    "--requests-per-second",
+    type=float,
+    default=None,
+    help="Token bucket por host (padrão do teste: 0, desativado).",
+)
+arguments.add_argument(
+    "--max-attempts",
+    type=int,
+    default=None,
+    help="Tentativas por requisição (padrão do teste: 1, sem novas tentativas).",
+)
+options = arguments.parse_args()
+
+try:
+    # Adicionando a classe de configuração do projeto
+    config_repository = SettingsManager()
+
+    # Sobrescreve apenas os parâmetros informados, por seção das configurações
+    overrides = {
+        section: {key: value for key, value in values if value is not None}
+        for section, values in (
+            ("offline", (("latency_ms", options.latency_ms), ("error_rate", options.error_rate))),
+            ("rate_limit", (("requests_per_second", options.requests_per_second),)),
+            ("retry", (("max_attempts", options.max_attempts),)),
+        )
+    }
+
+    # Executa o teste de carga e exibe o relatório
+    load_test = ScraperLoadTest(
+        config_repository.goodreads_settings,
+        titles=options.titles,
+        concurrency=options.concurrency,
+        overrides=overrides,
+    )
+    report = load_test.run()
+    print(json.dumps(asdict(report), indent=2, ensure_ascii=False))
+
+except ProjectError as e:
+    print(f"Erro ao executar o teste de carga: {e}")
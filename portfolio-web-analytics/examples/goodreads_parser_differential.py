@@ -0,0 +1,30 @@
+"""Compara, campo a campo, todos os engines do GoodreadsParser sobre as páginas salvas."""
+
+import argparse
+from dataclasses import asdict
+import json
+from pathlib import Path
+import sys
+
+import pathfix  # noqa: F401
+
+from src.common.errors.errors import ProjectError
+from src.config.constants import HTML_DIR
+from src.pipeline.parser_differential import ParserDifferentialTest
+
+# Lê os parâmetros do teste pela linha de comando
+arguments = argparse.ArgumentParser(description=__doc__)
+arguments.add_argument("--html-dir", default=str(HTML_DIR), help="Diretório com as páginas.")
+options = arguments.parse_args()
+
+try:
+    differential = ParserDifferentialTest()
+    report = differential.run(differential.corpus(Path(options.html_dir)))
+    print(json.dumps({**asdict(report), "passed": report.passed}, indent=2, ensure_ascii=False))
+
+    # Sai com erro quando algum engine diverge da referência
+    if not report.passed:
+        sys.exit(1)
+
+except ProjectError as e:
+    print(f"Erro ao executar o teste diferencial: {e}")
@@ -0,0 +1,34 @@
+"""Verifica que um GoodreadsParser reutilizado mantém a memória estável ao longo de um lote."""
+
+import argparse
+from dataclasses import asdict
+import json
+from pathlib import Path
+import sys
+
+import pathfix  # noqa: F401
+
+from src.common.errors.errors import ProjectError
+from src.config.constants import HTML_DIR
+from src.infrastructure.datasources.goodreads_parser_engines import PARSER_ENGINES
+from src.pipeline.parser_memory_check import ParserMemoryCheck
+
+# Lê os parâmetros da verificação pela linha de comando
+arguments = argparse.ArgumentParser(description=__doc__)
+arguments.add_argument("--source", default=str(HTML_DIR), help="Diretório ou página HTML.")
+arguments.add_argument("--pages", type=int, default=2000, help="Páginas processadas no lote.")
+arguments.add_argument("--engine", default="beautifulsoup", choices=sorted(PARSER_ENGINES))
+arguments.add_argument("--tolerance-kib", type=float, default=256, help="Crescimento aceito.")
+options = arguments.parse_args()
+
+try:
+    check = ParserMemoryCheck(options.engine, options.tolerance_kib)
+    report = check.run(check.corpus(Path(options.source), options.pages))
+    print(json.dumps({**asdict(report), "flat": report.flat}, indent=2, ensure_ascii=False))
+
+    # Sai com erro quando a memória retida cresce além da tolerância
+    if not report.flat:
+        sys.exit(1)
+
+except ProjectError as e:
+    print(f"Erro ao executar a verificação de memória do parser: {e}")
@@ -0,0 +1,74 @@
+"""Compara memória e tempo do parsing completo, do parcial e do JSON embutido no GoodreadsParser."""
+
+import argparse
+import json
+from time import perf_counter
+import tracemalloc
+from typing import Any
+
+import pathfix  # noqa: F401
+
+from src.common.errors.errors import ProjectError
+from src.config.constants import PARSER_FILE
+from src.infrastructure.datasources.goodreads_parser import GoodreadsParser
+from src.infrastructure.datasources.goodreads_parser_engines import BeautifulSoupEngine
+
+# Lê os parâmetros do relatório pela linha de comando
+arguments = argparse.ArgumentParser(description=__doc__)
+arguments.add_argument("--html", default=None, help="Página HTML do livro (padrão do parser).")
+arguments.add_argument("--rounds", type=int, default=10, help="Repetições para medir o tempo.")
+options = arguments.parse_args()
+
+
+def profile(
+    *, partial_parse: bool, structured_data: bool = False
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Mede o tempo médio e a memória de carregar a página e extrair os campos."""
+
+    def build_parser() -> GoodreadsParser:
+        engine = BeautifulSoupEngine(partial_parse=partial_parse)
+        return GoodreadsParser(options.html, engine=engine, structured_data=structured_data)
+
+    started = perf_counter()
+    for _ in range(options.rounds):
+        build_parser().run_full_extraction(PARSER_FILE)
+    elapsed_ms = (perf_counter() - started) / options.rounds * 1000
+
+    tracemalloc.start()
+    parser = build_parser()
+    result = parser.run_full_extraction(PARSER_FILE)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    metrics = {
+        "elapsed_ms": round(elapsed_ms, 2),
+        "peak_kib": round(peak / 1024, 1),
+        "retained_kib": round(retained / 1024, 1),
+        "tags": len(parser.soup.find_all()) if parser.soup is not None else 0,
+    }
+    return metrics, result
+
+
+try:
+    full, full_result = profile(partial_parse=False)
+    partial, partial_result = profile(partial_parse=True)
+    structured, structured_result = profile(partial_parse=True, structured_data=True)
+    for mode_result in (partial_result, structured_result):
+        if full_result != mode_result:
+            differences = sorted(key for key in full_result if full_result[key] != mode_result[key])
+            msg = f"Resultados divergentes nos campos: {differences}"
+            raise SystemExit(msg)
+
+    report = {
+        "full": full,
+        "partial": partial,
+        "time_reduction": f"{1 - partial['elapsed_ms'] / full['elapsed_ms']:.0%}",
+        "peak_memory_reduction": f"{1 - partial['peak_kib'] / full['peak_kib']:.0%}",
+        "structured_data": structured,
+        "structured_time_reduction": f"{1 - structured['elapsed_ms'] / full['elapsed_ms']:.0%}",
+        "identical_output": True,
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+except ProjectError as e:
+    print(f"Erro ao executar o relatório de parsing parcial: {e}")
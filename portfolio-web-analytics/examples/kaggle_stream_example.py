@@ -0,0 +1,153 @@
+"""Compara o pico de memória da leitura completa do CSV com a leitura em lotes do Kaggle.
+
+Cada etapa informa o pico do processo (`peak_mib`) e quanto ele subiu durante a etapa
+(`overhead_mib`), medido após inicializar o DuckDB. O pico inclui um custo fixo de ~120 MiB
+(pandas e DuckDB carregados) que não depende de `chunk_rows` e domina em arquivos pequenos:
+abaixo de algumas dezenas de MiB, o `pd.read_csv` completo fica abaixo desse piso. Por isso
+a verificação é sobre o acréscimo: a ingestão e a leitura em lotes somam uma quantidade
+limitada de memória, qualquer que seja o tamanho do CSV.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+from pathlib import Path
+import resource
+import sys
+import tempfile
+from time import perf_counter
+
+import duckdb
+import pandas as pd
+import pathfix  # noqa: F401
+
+from src.common.errors.errors import ProjectError
+from src.config.constants import DATASETS_DIR
+from src.infrastructure.cache.dataset_columnar_cache import DatasetQuery
+from src.infrastructure.datasources.kaggle_dataset_provider import KaggleDatasetProvider
+
+OVERHEAD_LIMIT_MIB = 64
+"""Acréscimo máximo de memória aceito na ingestão e na leitura em lotes, em MiB."""
+
+
+def peak_rss_mib() -> float:
+    """Pico de memória residente do processo, em MiB."""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def warm_up() -> float:
+    """Inicializa o DuckDB (custo fixo, sem dados) e retorna o pico antes da etapa."""
+    with duckdb.connect() as connection:
+        connection.execute("SELECT 1").fetchall()
+    return peak_rss_mib()
+
+
+def measured(started: float, baseline: float, **values: int) -> dict[str, float]:
+    """Resultado da etapa: valores, duração, pico e acréscimo sobre o pico inicial."""
+    peak = peak_rss_mib()
+    return {
+        **values,
+        "seconds": round(perf_counter() - started, 2),
+        "peak_mib": peak,
+        "overhead_mib": round(peak - baseline, 1),
+    }
+
+
+def read_full(csv_path: Path) -> dict[str, float]:
+    """Carrega o CSV inteiro com o pandas."""
+    baseline, started = warm_up(), perf_counter()
+    dataframe = pd.read_csv(csv_path)
+    rows = int((dataframe["Score"] >= 8.5).sum())  # noqa: PLR2004
+    return measured(started, baseline, rows=rows)
+
+
+def build_provider(csv_path: Path) -> KaggleDatasetProvider:
+    """Provider apontado para o diretório do CSV ampliado."""
+    provider = KaggleDatasetProvider(
+        {
+            "manga_name": "",
+            "dataset_name": "",
+            "dataset_files": [csv_path.name],
+            "force_download": False,
+            "memory_limit": "256MB",
+        }
+    )
+    provider.datasets_path = csv_path.parent
+    return provider
+
+
+def ingest(csv_path: Path) -> dict[str, float]:
+    """Converte o CSV em Parquet tipado (feito uma vez, antes das leituras)."""
+    provider = build_provider(csv_path)
+    baseline, started = warm_up(), perf_counter()
+    provider.dataset_cache.ingest(csv_path)
+    return measured(started, baseline)
+
+
+def read_chunks(csv_path: Path, chunk_rows: int) -> dict[str, float]:
+    """Lê em lotes com projeção e filtro aplicados pelo DuckDB."""
+    provider = build_provider(csv_path)
+    baseline, started = warm_up(), perf_counter()
+    query = DatasetQuery(("Title", "Score", "Members", "Genres"), "Score >= ?", (8.5,))
+    rows = sum(len(chunk) for chunk in provider.iter_dataframe(csv_path.name, query, chunk_rows))
+    return measured(started, baseline, rows=rows)
+
+
+def main() -> None:
+    """Gera um CSV ampliado e mede cada modo de leitura em um processo separado."""
+    # Lê os parâmetros da comparação pela linha de comando
+    arguments = argparse.ArgumentParser(description=__doc__)
+    arguments.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Cópias das linhas do CSV (cerca de 1,9 MiB cada).",
+    )
+    arguments.add_argument("--chunk-rows", type=int, default=50_000, help="Linhas por lote.")
+    options = arguments.parse_args()
+
+    try:
+        source = (DATASETS_DIR / "manga.csv").read_text(encoding="utf-8")
+        header, _, body = source.partition("\n")
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = Path(directory) / "manga.csv"
+            with csv_path.open("w", encoding="utf-8") as file:
+                file.write(f"{header}\n")
+                for _ in range(options.repeat):
+                    file.write(body)
+
+            # Cada etapa roda em um processo novo, para que os picos de memória não se somem
+            results = {}
+            for name, function, arguments_ in (
+                ("ingest", ingest, (csv_path,)),
+                ("chunked_read", read_chunks, (csv_path, options.chunk_rows)),
+                ("full_read", read_full, (csv_path,)),
+            ):
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    results[name] = executor.submit(function, *arguments_).result()
+
+        def overhead(step: str) -> float:
+            return results[step]["overhead_mib"]
+
+        report = {
+            "csv_mib": round(len(source.encode()) * options.repeat / 1024**2, 1),
+            **results,
+            "checks": {
+                "same_rows": results["full_read"]["rows"] == results["chunked_read"]["rows"],
+                # A ingestão (feita na primeira leitura) e a leitura em lotes somam memória
+                # limitada; o pico absoluto inclui o custo fixo das bibliotecas (ver acima)
+                "ingest_bounded": overhead("ingest") <= OVERHEAD_LIMIT_MIB,
+                "chunked_bounded": overhead("chunked_read") <= OVERHEAD_LIMIT_MIB,
+            },
+        }
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        if not all(report["checks"].values()):
+            sys.exit(1)
+
+    except ProjectError as e:
+        print(f"Erro ao executar a leitura em lotes: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,10 @@ class GoodreadsScraperError(ProjectError):
     """Exceção para erros relacionados ao scraping do Goodreads."""
 
 
+class HtmlCacheError(ProjectError):
+    """Exceção para erros relacionados ao armazenamento em cache das páginas HTML."""
+
+
 class KaggleDatasetProviderError(ProjectError):
     """Exceção para erros relacionados ao download de datasets do Kaggle."""
 
@@ -18,11 +18,32 @@ PARSER_FILE: Path = Path("./src/config/files/parser.yaml")
 DATASETS_DIR: Path = Path("./data/datasets")
 """Diretório para datasets: `./data/datasets`"""
 
+KAGGLE_CATALOG_FILE: Path = DATASETS_DIR / "kaggle_catalog.duckdb"
+"""Banco DuckDB com a tabela `manga` indexada por título: `./data/datasets/kaggle_catalog.duckdb`"""
+
 HTML_DIR: Path = Path("./data/html")
 """Diretório para arquivos HTML: `./data/html`"""
 
+CACHE_DIR: Path = Path("./data/cache")
+"""Diretório para metadados e índices de cache: `./data/cache`"""
+
+HTTP_CACHE_FILE: Path = CACHE_DIR / "http_cache.json"
+"""Arquivo de metadados do cache HTTP das páginas: `./data/cache/http_cache.json`"""
+
+SEARCH_INDEX_FILE: Path = CACHE_DIR / "search_index.json"
+"""Índice de buscas resolvidas (título → URL do livro): `./data/cache/search_index.json`"""
+
+CRAWL_FRONTIER_FILE: Path = CACHE_DIR / "crawl_frontier.sqlite3"
+"""Fronteira persistente do crawler do Goodreads: `./data/cache/crawl_frontier.sqlite3`"""
+
+PARSE_RESULTS_DIR: Path = CACHE_DIR / "parse_results"
+"""Resultados do parsing por conteúdo do HTML e versão do parser: `./data/cache/parse_results`"""
+
 OUTPUT_DIR: Path = Path("./data/output")
 """Diretório para resultados do pipeline: `./data/output`"""
 
+PARSER_METRICS_FILE: Path = OUTPUT_DIR / "parser_metrics.json"
+"""Relatório de tempos e acertos dos seletores do parser: `./data/output/parser_metrics.json`"""
+
 BRT: ZoneInfo = ZoneInfo("America/Sao_Paulo")
 """Define o objeto de fuso horário para o horário de Brasília:  `America/Sao_Paulo`"""
@@ -0,0 +1 @@
+"""Módulo de armazenamento em cache das páginas e metadados HTTP baixados."""
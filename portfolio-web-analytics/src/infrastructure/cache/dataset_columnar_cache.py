@@ -0,0 +1,263 @@
+"""Cache colunar (Parquet) dos CSVs do Kaggle, com os tipos convertidos uma única vez.
+
+O CSV do Kaggle guarda tudo como texto: contagens com separador de milhar (`"670,559"`),
+`Unknown` em colunas numéricas e listas como literais Python (`"['Action', 'Drama']"`). A
+ingestão converte as colunas com o DuckDB e grava um Parquet ao lado do CSV; um manifesto
+com o tamanho e a data de modificação do CSV indica quando a ingestão precisa ser refeita.
+"""
+
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+import json
+from math import ceil
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+import pandas as pd
+
+from src.common.base.base_class import BaseClass
+from src.common.errors.errors import KaggleDatasetProviderError
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+COLUMNAR_CACHE_VERSION = "2"
+"""Versão do esquema do cache; alterá-la força a reingestão dos CSVs."""
+
+MANGA_STATUS = ("Publishing", "Finished", "On Hiatus", "Discontinued")
+"""Categorias da coluna `Status` do `manga.csv`."""
+
+MANGA_COLUMNS = """
+    Title,
+    CAST(Score AS DOUBLE) AS Score,
+    CAST(Vote AS BIGINT) AS Vote,
+    CAST(Ranked AS INTEGER) AS Ranked,
+    CAST(Popularity AS INTEGER) AS Popularity,
+    CAST(replace(Members, ',', '') AS BIGINT) AS Members,
+    CAST(replace(Favorite, ',', '') AS BIGINT) AS Favorite,
+    TRY_CAST(Volumes AS INTEGER) AS Volumes,
+    TRY_CAST(Chapters AS INTEGER) AS Chapters,
+    Status,
+    Published,
+    CAST(Genres AS VARCHAR[]) AS Genres,
+    CAST(Themes AS VARCHAR[]) AS Themes,
+    CAST(Demographics AS VARCHAR[]) AS Demographics,
+    NULLIF(Serialization, 'None') AS Serialization,
+    NULLIF(Author, 'None') AS Author
+"""
+"""Conversão das colunas do `manga.csv`: contagens, `Unknown`/`None` como nulo e listas."""
+
+LIST_ITEM_PATTERN = r"'([^']*)'"
+"""Item de uma lista em literal Python no CSV. Ex.: `'Slice of Life'` em `['Drama', ...]`"""
+
+TYPED_COLUMNS: dict[str, str] = {"manga.csv": MANGA_COLUMNS}
+"""Projeção tipada por arquivo; os demais CSVs usam os tipos detectados pelo DuckDB."""
+
+STREAM_VECTOR_ROWS = 2048
+"""Linhas por vetor do DuckDB; os lotes do streaming são múltiplos desse tamanho."""
+
+DEFAULT_CHUNK_ROWS = 100_000
+"""Linhas por lote no streaming, quando não informado."""
+
+INGEST_THREADS = 1
+"""Threads do DuckDB na ingestão: limita os buffers em voo e mantém a ordem das linhas do CSV."""
+
+INGEST_ROW_GROUP_SIZE = 16_384
+"""Linhas por row group do Parquet; o escritor mantém um row group por thread em memória."""
+
+INGEST_BUFFER_BYTES = 1024 * 1024
+"""Buffer do leitor de CSV do DuckDB na ingestão (padrão: 16 MiB); deve caber a maior linha."""
+
+CATEGORICAL_COLUMNS: dict[str, dict[str, tuple[str, ...]]] = {"manga.csv": {"Status": MANGA_STATUS}}
+"""Colunas convertidas para `category` na leitura, com as categorias conhecidas."""
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    """Identificação do CSV de origem gravada no manifesto do cache."""
+
+    size: int
+    """Tamanho do CSV em bytes."""
+
+    modified_ns: int
+    """Data de modificação do CSV, em nanossegundos."""
+
+    version: str = COLUMNAR_CACHE_VERSION
+    """Versão do esquema usada na ingestão."""
+
+    @classmethod
+    def of(cls, csv_path: Path) -> "SourceFingerprint":
+        """Lê o tamanho e a data de modificação do CSV."""
+        stat = csv_path.stat()
+        return cls(stat.st_size, stat.st_mtime_ns)
+
+
+@dataclass(frozen=True)
+class DatasetQuery:
+    """Projeção e filtro aplicados na leitura do Parquet, antes de qualquer linha chegar ao pandas.
+
+    O filtro é SQL do DuckDB com parâmetros posicionais (`?`), usado apenas com expressões
+    definidas no código. Ex.: `DatasetQuery(("Title", "Score"), "Score >= ?", (8.5,))`
+    """
+
+    columns: tuple[str, ...] | None = None
+    """Colunas lidas; None lê todas."""
+
+    where: str | None = None
+    """Condição SQL aplicada no scan do Parquet. Ex.: `Status = ?`"""
+
+    parameters: tuple[Any, ...] = ()
+    """Valores dos parâmetros `?` da condição."""
+
+    def sql(self) -> str:
+        """Consulta sobre `read_parquet(?)` com a projeção e o filtro."""
+        projection = (
+            ", ".join('"' + column.replace('"', '""') + '"' for column in self.columns)
+            if self.columns
+            else "*"
+        )
+        where = f" WHERE {self.where}" if self.where else ""
+        return f"SELECT {projection} FROM read_parquet(?){where}"
+
+
+class DatasetColumnarCache(BaseClass):
+    """Converte cada CSV em um Parquet tipado e o lê no lugar do CSV enquanto estiver atual."""
+
+    def __init__(self, memory_limit: str | None = None) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.memory_limit: str | None = memory_limit
+        """Limite de memória do DuckDB na ingestão e nas leituras (ex.: `512MB`); None: padrão."""
+
+    def _connect(self, **config: Any) -> duckdb.DuckDBPyConnection:
+        """Conexão DuckDB em memória com o limite configurado e as opções informadas."""
+        if self.memory_limit:
+            config["memory_limit"] = self.memory_limit
+        return duckdb.connect(config=config)
+
+    @staticmethod
+    def cache_path(csv_path: Path) -> Path:
+        """Parquet gravado ao lado do CSV (ex.: `./data/datasets/manga.parquet`)."""
+        return Path(csv_path).with_suffix(".parquet")
+
+    @staticmethod
+    def manifest_path(csv_path: Path) -> Path:
+        """Manifesto com a identificação do CSV (ex.: `manga.parquet.json`)."""
+        return Path(csv_path).with_suffix(".parquet.json")
+
+    def is_fresh(self, csv_path: Path) -> bool:
+        """Indica se o Parquet existe e foi gerado a partir da versão atual do CSV."""
+        csv_path = Path(csv_path)
+        manifest_path = self.manifest_path(csv_path)
+        if not self.cache_path(csv_path).exists() or not manifest_path.exists():
+            return False
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return False
+        return manifest == asdict(SourceFingerprint.of(csv_path))
+
+    def ingest(self, csv_path: Path, *, force: bool = False) -> Path:
+        """Converte o CSV em Parquet tipado, se o cache estiver ausente ou desatualizado."""
+        csv_path = Path(csv_path)
+        target = self.cache_path(csv_path)
+        if not force and self.is_fresh(csv_path):
+            return target
+
+        fingerprint = SourceFingerprint.of(csv_path)
+        columns = TYPED_COLUMNS.get(csv_path.name)
+        buffer = f"buffer_size = {INGEST_BUFFER_BYTES}"
+        if columns is None:
+            source = f"read_csv_auto($1, {buffer})"
+            columns = "*"
+        else:
+            source = f"read_csv($1, all_varchar = true, header = true, {buffer})"
+
+        # Grava em arquivo temporário e substitui, para que leitores nunca vejam um Parquet parcial.
+        # O `COPY` em uma thread, sem preservar a ordem global, grava cada row group assim que ele
+        # fica pronto; com o buffer do leitor e os row groups pequenos, a ingestão soma poucas
+        # dezenas de MiB ao processo, independentemente do tamanho do CSV.
+        descriptor, temporary = tempfile.mkstemp(suffix=".parquet", dir=target.parent)
+        os.close(descriptor)
+        try:
+            with self._connect(
+                threads=INGEST_THREADS, preserve_insertion_order=False
+            ) as connection:
+                connection.execute(
+                    f"""
+                    COPY (SELECT {columns} FROM {source}) TO $2
+                    (FORMAT parquet, COMPRESSION zstd, ROW_GROUP_SIZE {INGEST_ROW_GROUP_SIZE})
+                    """,
+                    [str(csv_path), temporary],
+                )
+            Path(temporary).replace(target)
+        except (duckdb.Error, OSError) as e:
+            Path(temporary).unlink(missing_ok=True)
+            msg = f"Erro ao converter '{csv_path.name}' para Parquet."
+            self.logger.exception(msg)
+            raise KaggleDatasetProviderError(msg) from e
+
+        self.manifest_path(csv_path).write_text(json.dumps(asdict(fingerprint)), encoding="utf-8")
+        self.logger.info(f"Cache colunar gerado: '{target}'")
+        return target
+
+    def read(self, csv_path: Path) -> pd.DataFrame:
+        """Lê o DataFrame tipado do Parquet, (re)gerando-o quando o CSV mudou."""
+        csv_path = Path(csv_path)
+        parquet_path = self.ingest(csv_path)
+        try:
+            with self._connect() as connection:
+                dataframe = connection.sql(
+                    "SELECT * FROM read_parquet(?)", params=[str(parquet_path)]
+                ).df()
+        except duckdb.Error as e:
+            msg = f"Erro ao ler o cache colunar '{parquet_path}'."
+            self.logger.exception(msg)
+            raise KaggleDatasetProviderError(msg) from e
+
+        return self._categorize(csv_path, dataframe)
+
+    @staticmethod
+    def _categorize(csv_path: Path, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Converte as colunas categóricas conhecidas presentes no DataFrame."""
+        for column, categories in CATEGORICAL_COLUMNS.get(csv_path.name, {}).items():
+            if column in dataframe:
+                dataframe[column] = pd.Categorical(dataframe[column], categories=categories)
+        return dataframe
+
+    def iter_chunks(
+        self,
+        csv_path: Path,
+        query: DatasetQuery | None = None,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        """Lê o Parquet tipado em lotes de até `chunk_rows` linhas.
+
+        A projeção e o filtro são aplicados pelo DuckDB no scan do Parquet, e cada lote é
+        materializado só quando pedido; a memória fica limitada ao tamanho do lote (e ao
+        `memory_limit` do DuckDB), não ao do arquivo. Na primeira leitura (ou se o CSV mudou),
+        o Parquet é gerado antes: essa ingestão tem pico próprio, limitado mas maior que o lote.
+        """
+        csv_path = Path(csv_path)
+        query = query or DatasetQuery()
+        parquet_path = self.ingest(csv_path)
+        vectors = max(1, ceil(chunk_rows / STREAM_VECTOR_ROWS))
+
+        with self._connect() as connection:
+            try:
+                result = connection.execute(query.sql(), [str(parquet_path), *query.parameters])
+            except duckdb.Error as e:
+                msg = f"Erro ao consultar o cache colunar '{parquet_path}': {query.sql()}"
+                self.logger.exception(msg)
+                raise KaggleDatasetProviderError(msg) from e
+
+            while True:
+                chunk = result.fetch_df_chunk(vectors)
+                if chunk.empty:
+                    break
+                yield self._categorize(csv_path, chunk)
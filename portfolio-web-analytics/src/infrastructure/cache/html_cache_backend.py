@@ -0,0 +1,352 @@
+"""Backends de armazenamento das páginas HTML baixadas (texto puro ou comprimido com LRU)."""
+
+from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
+import gzip
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, ClassVar, Self
+
+from src.common.errors.errors import HtmlCacheError
+from src.config.constants import HTML_DIR
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+GZIP_SUFFIX: str = ".gz"
+"""Sufixo dos arquivos HTML comprimidos com gzip: `.gz`"""
+
+ASYNC_WRITE_BUFFER_BYTES: int = 64 * 1024
+"""Bytes acumulados antes de cada escrita em thread no gravador assíncrono: `64 KiB`"""
+
+
+class AtomicHtmlWriter:
+    """Grava uma página em blocos num arquivo temporário e o renomeia atomicamente ao final.
+
+    Um download interrompido nunca deixa um arquivo parcial no caminho final, que seria
+    tratado como cache válido. O tamanho e o hash SHA-256 são calculados sobre o HTML
+    original (antes da compressão) e conferidos com os valores esperados, se informados.
+    """
+
+    def __init__(
+        self,
+        backend: "HtmlCacheBackend",
+        path: Path,
+        expected_length: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> None:
+        self.backend = backend
+        """Backend responsável pela codificação e pelo registro de uso da página."""
+
+        self.path = path
+        """Caminho final da página no cache."""
+
+        self.expected_length = expected_length
+        """Tamanho esperado em bytes (ex.: cabeçalho `Content-Length`), ou `None`."""
+
+        self.expected_sha256 = expected_sha256
+        """Hash SHA-256 esperado do conteúdo, ou `None`."""
+
+        self.size: int = 0
+        """Total de bytes do HTML recebidos até o momento."""
+
+        self._hash = hashlib.sha256()
+        """Hash incremental do conteúdo recebido."""
+
+        self._temp_path: Path | None = None
+        """Caminho do arquivo temporário, no mesmo diretório do destino."""
+
+        self._raw_file: IO[bytes] | None = None
+        """Arquivo temporário aberto para escrita."""
+
+        self._stream: IO[bytes] | None = None
+        """Fluxo de escrita (com ou sem compressão) sobre o arquivo temporário."""
+
+    @property
+    def sha256(self) -> str:
+        """Hash SHA-256 (hexadecimal) do conteúdo gravado."""
+        return self._hash.hexdigest()
+
+    def __enter__(self) -> Self:
+        """Abre o arquivo temporário ao lado do destino."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".part"
+        )
+        self._temp_path = Path(temp_name)
+        self._raw_file = os.fdopen(file_descriptor, "wb")
+        self._stream = self.backend._open_stream(self._raw_file)  # noqa: SLF001
+        return self
+
+    def write(self, chunk: bytes) -> None:
+        """Grava um bloco do HTML e atualiza o tamanho e o hash."""
+        self._stream.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def _verify(self) -> None:
+        """Confere o tamanho e o hash do conteúdo recebido com os valores esperados."""
+        if self.expected_length is not None and self.size != self.expected_length:
+            msg = (
+                f"Download incompleto para '{self.path}': "
+                f"{self.size} de {self.expected_length} bytes recebidos."
+            )
+            raise HtmlCacheError(msg)
+        if self.expected_sha256 is not None and self.sha256 != self.expected_sha256:
+            msg = f"Hash SHA-256 divergente para '{self.path}'."
+            raise HtmlCacheError(msg)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Valida e publica o arquivo, ou descarta o temporário em caso de erro."""
+        try:
+            if self._stream is not self._raw_file:
+                self._stream.close()
+            if exc_type is None:
+                self._verify()
+                self._raw_file.flush()
+                os.fsync(self._raw_file.fileno())
+            self._raw_file.close()
+            if exc_type is None:
+                self._temp_path.replace(self.path)
+                # Só páginas publicadas entram no registro de uso (e no limite LRU)
+                self.backend.mark_used(self.path)
+        finally:
+            if not self._raw_file.closed:
+                self._raw_file.close()
+            self._temp_path.unlink(missing_ok=True)
+
+
+class AsyncAtomicHtmlWriter:
+    """Adapta o `AtomicHtmlWriter` ao event loop: toda a E/S de arquivo roda em threads.
+
+    A abertura, a escrita (com a compressão gzip) e o `fsync` são bloqueantes; executá-los no
+    event loop travaria os demais downloads simultâneos. Os blocos recebidos são acumulados até
+    `ASYNC_WRITE_BUFFER_BYTES` para não criar uma tarefa em thread por bloco da rede.
+    """
+
+    def __init__(self, writer: AtomicHtmlWriter) -> None:
+        self.writer = writer
+        """Gravador síncrono que faz a escrita atômica."""
+
+        self._buffer = bytearray()
+        """Blocos recebidos e ainda não gravados."""
+
+    @property
+    def sha256(self) -> str:
+        """Hash SHA-256 (hexadecimal) do conteúdo gravado."""
+        return self.writer.sha256
+
+    async def __aenter__(self) -> Self:
+        """Abre o arquivo temporário em uma thread."""
+        await asyncio.to_thread(self.writer.__enter__)
+        return self
+
+    async def write(self, chunk: bytes) -> None:
+        """Acumula o bloco e grava em uma thread quando o buffer enche."""
+        self._buffer += chunk
+        if len(self._buffer) >= ASYNC_WRITE_BUFFER_BYTES:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Grava o conteúdo acumulado em uma thread."""
+        if self._buffer:
+            data, self._buffer = bytes(self._buffer), bytearray()
+            await asyncio.to_thread(self.writer.write, data)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Grava o restante e publica (ou descarta) o arquivo em uma thread."""
+        if exc_type is None:
+            try:
+                await self._flush()
+            except BaseException as error:
+                await asyncio.to_thread(
+                    self.writer.__exit__, type(error), error, error.__traceback__
+                )
+                raise
+        await asyncio.to_thread(self.writer.__exit__, exc_type, exc_value, traceback)
+
+
+class HtmlCacheBackend(ABC):
+    """Interface de armazenamento das páginas HTML usada pelo scraper e pelo parser."""
+
+    suffix: ClassVar[str] = ""
+    """Sufixo adicionado ao nome do arquivo HTML no disco."""
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.directory: Path = directory or HTML_DIR
+        """Diretório onde as páginas são armazenadas: `./data/html/`"""
+
+    def path_for(self, filename: str) -> Path:
+        """Retorna o caminho em disco para o nome de arquivo HTML informado."""
+        return self.directory / f"{filename}{self.suffix}"
+
+    @abstractmethod
+    def _open_stream(self, raw_file: IO[bytes]) -> IO[bytes]:
+        """Retorna o fluxo que codifica o HTML no formato armazenado em disco."""
+
+    def atomic_writer(
+        self,
+        path: Path,
+        expected_length: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> AtomicHtmlWriter:
+        """Cria um gravador em blocos com renomeação atômica para o caminho informado."""
+        return AtomicHtmlWriter(self, path, expected_length, expected_sha256)
+
+    def async_atomic_writer(
+        self,
+        path: Path,
+        expected_length: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> AsyncAtomicHtmlWriter:
+        """Cria um gravador atômico para uso no event loop, com a E/S de arquivo em threads."""
+        return AsyncAtomicHtmlWriter(self.atomic_writer(path, expected_length, expected_sha256))
+
+    def write_stream(
+        self,
+        path: Path,
+        chunks: Iterable[bytes],
+        expected_length: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> str:
+        """Grava os blocos do HTML de forma atômica e retorna o hash SHA-256 do conteúdo."""
+        with self.atomic_writer(path, expected_length, expected_sha256) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        return writer.sha256
+
+    def write_bytes(self, path: Path, content: bytes) -> Path:
+        """Grava o conteúdo HTML no caminho informado."""
+        self.write_stream(path, [content])
+        return path
+
+    def read_text(self, path: Path) -> str:
+        """Lê a página HTML, descomprimindo de forma transparente quando necessário."""
+        data = path.read_bytes()
+        if path.suffix == GZIP_SUFFIX:
+            data = gzip.decompress(data)
+        self.mark_used(path)
+        return data.decode("utf-8")
+
+    def mark_used(self, path: Path) -> None:  # noqa: B027
+        """Registra o acesso à página (sem efeito no backend sem limite de tamanho)."""
+
+
+class PlainHtmlCache(HtmlCacheBackend):
+    """Armazena as páginas como HTML UTF-8 sem compressão e sem limite de tamanho."""
+
+    def _open_stream(self, raw_file: IO[bytes]) -> IO[bytes]:
+        """Grava o conteúdo original, sem codificação."""
+        return raw_file
+
+
+class CompressedHtmlCache(HtmlCacheBackend):
+    """Armazena as páginas comprimidas com gzip e aplica um limite de bytes com despejo LRU."""
+
+    suffix: ClassVar[str] = f".html{GZIP_SUFFIX}"
+
+    def __init__(
+        self, directory: Path | None = None, max_bytes: int = 0, compression_level: int = 6
+    ) -> None:
+        super().__init__(directory)
+
+        self.max_bytes: int = max_bytes
+        """Orçamento máximo de bytes em disco (`0` desativa o limite). Ex.: `104857600`"""
+
+        self.compression_level: int = compression_level
+        """Nível de compressão do gzip (1 a 9). Ex.: `6`"""
+
+        self._lock = threading.Lock()
+        """Protege o índice LRU contra escritas simultâneas (download em lote)."""
+
+        self._entries: OrderedDict[Path, int] = self._scan_directory()
+        """Índice LRU (do menos para o mais recente) com o tamanho de cada arquivo."""
+
+    def path_for(self, filename: str) -> Path:
+        """Retorna o caminho comprimido, substituindo a extensão `.html`."""
+        return self.directory / f"{filename.removesuffix('.html')}{self.suffix}"
+
+    def _scan_directory(self) -> OrderedDict[Path, int]:
+        """Reconstrói o índice LRU a partir do horário de acesso dos arquivos em disco."""
+        if not self.directory.exists():
+            return OrderedDict()
+        stats = [(path, path.stat()) for path in self.directory.glob(f"*{self.suffix}")]
+        stats.sort(key=lambda item: item[1].st_atime)
+        return OrderedDict((path, stat.st_size) for path, stat in stats)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total de bytes ocupados pelas páginas comprimidas."""
+        return sum(self._entries.values())
+
+    def _open_stream(self, raw_file: IO[bytes]) -> IO[bytes]:
+        """Comprime o conteúdo com gzip à medida que os blocos são gravados."""
+        return gzip.GzipFile(fileobj=raw_file, mode="wb", compresslevel=self.compression_level)
+
+    def mark_used(self, path: Path) -> None:
+        """Move a página para o fim da fila LRU e persiste o acesso no `atime` do arquivo."""
+        if not path.exists():
+            return
+        # O `atime` é gravado explicitamente para não depender das opções de montagem
+        # (noatime/relatime) e preserva o `mtime`, usado na validade do cache.
+        os.utime(path, (time.time(), path.stat().st_mtime))
+        with self._lock:
+            self._entries[path] = path.stat().st_size
+            self._entries.move_to_end(path)
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        """Remove as páginas menos usadas até respeitar o orçamento de bytes."""
+        if self.max_bytes <= 0:
+            return
+        with self._lock:
+            total = sum(self._entries.values())
+            for path in list(self._entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                total -= self._entries.pop(path)
+                path.unlink(missing_ok=True)
+                self.logger.info(f"Página removida do cache (LRU): '{path}'")
+
+
+def build_html_cache_backend(
+    cache_config: dict[str, Any] | None, directory: Path | None = None
+) -> HtmlCacheBackend:
+    """Cria o backend de cache HTML configurado em `goodreads.cache` no `settings.yaml`."""
+    cache_config = cache_config or {}
+    backend = cache_config.get("backend", "plain")
+
+    if backend == "plain":
+        return PlainHtmlCache(directory)
+    if backend == "gzip":
+        return CompressedHtmlCache(
+            directory,
+            max_bytes=cache_config.get("max_bytes", 0),
+            compression_level=cache_config.get("compression_level", 6),
+        )
+    msg = f"Backend de cache HTML desconhecido: '{backend}'"
+    raise HtmlCacheError(msg)
@@ -0,0 +1,125 @@
+"""Armazena metadados HTTP (ETag, Last-Modified e hash) das páginas baixadas."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from src.config.constants import BRT, HTTP_CACHE_FILE
+from src.infrastructure.cache.json_index_store import JsonIndexStore
+
+
+@dataclass
+class HttpCacheEntry:
+    """Metadados HTTP de uma URL armazenada em cache."""
+
+    url: str
+    """URL canônica da página. Ex.: `https://www.goodreads.com/book/show/25986929`"""
+
+    path: str
+    """Caminho do arquivo HTML em disco."""
+
+    fetched_at: float
+    """Momento (timestamp) do último download ou revalidação bem-sucedida."""
+
+    content_hash: str
+    """Hash SHA-256 do corpo da resposta."""
+
+    etag: str | None = None
+    """Valor do cabeçalho `ETag` retornado pelo servidor."""
+
+    last_modified: str | None = None
+    """Valor do cabeçalho `Last-Modified` retornado pelo servidor."""
+
+
+@dataclass
+class HttpCacheStats:
+    """Contadores de uso do cache HTTP."""
+
+    hits: int = 0
+    """Páginas servidas do cache sem nenhuma requisição."""
+
+    revalidations: int = 0
+    """Páginas revalidadas com resposta `304 Not Modified`."""
+
+    downloads: int = 0
+    """Páginas baixadas por completo."""
+
+
+class HttpCacheStore(JsonIndexStore[HttpCacheEntry]):
+    """Persiste os metadados HTTP das páginas, indexados pela URL, ao lado do cache HTML."""
+
+    entry_type = HttpCacheEntry
+    """Entradas do índice: metadados HTTP de cada URL."""
+
+    def __init__(self, index_path: Path | None = None) -> None:
+        # Caminho padrão do arquivo de metadados: `./data/cache/http_cache.json`
+        super().__init__(index_path or HTTP_CACHE_FILE)
+
+        self.stats: HttpCacheStats = HttpCacheStats()
+        """Contadores de acertos, revalidações e downloads completos."""
+
+    def get(self, url: str) -> HttpCacheEntry | None:
+        """Retorna os metadados da URL, se existirem."""
+        return self._entries.get(url)
+
+    def is_fresh(self, url: str, max_age_seconds: float) -> bool | None:
+        """Indica se a entrada está dentro do TTL, ou `None` se não houver metadados."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        age = datetime.now(tz=BRT).timestamp() - entry.fetched_at
+        return age < max_age_seconds
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Monta os cabeçalhos `If-None-Match` e `If-Modified-Since` para revalidação."""
+        entry = self._entries.get(url)
+        headers: dict[str, str] = {}
+        if entry is None or not Path(entry.path).exists():
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def record_download(
+        self, url: str, path: Path, response: httpx.Response, content_hash: str
+    ) -> HttpCacheEntry:
+        """Registra um download completo com os cabeçalhos de validação e o hash do corpo.
+
+        O hash é o SHA-256 calculado durante a escrita em blocos (`HtmlCacheBackend`), sem
+        reler o corpo da resposta.
+        """
+        entry = HttpCacheEntry(
+            url=url,
+            path=str(path),
+            fetched_at=datetime.now(tz=BRT).timestamp(),
+            content_hash=content_hash,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._entries[url] = entry
+            self.stats.downloads += 1
+            self._dirty = True
+        return entry
+
+    def record_revalidation(self, url: str, response: httpx.Response) -> HttpCacheEntry | None:
+        """Renova o TTL de uma entrada após `304 Not Modified`, sem reescrever o corpo."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            entry.fetched_at = datetime.now(tz=BRT).timestamp()
+            entry.etag = response.headers.get("ETag", entry.etag)
+            entry.last_modified = response.headers.get("Last-Modified", entry.last_modified)
+            self.stats.revalidations += 1
+            self._dirty = True
+        return entry
+
+    def record_hit(self) -> None:
+        """Contabiliza uma página servida diretamente do cache."""
+        with self._lock:
+            self.stats.hits += 1
@@ -0,0 +1,72 @@
+"""Base dos índices JSON do cache: carga tolerante, gravação atômica e `flush` único."""
+
+from dataclasses import asdict
+import json
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from _typeshed import DataclassInstance
+
+
+class JsonIndexStore[EntryT: DataclassInstance](BaseClass):
+    """Mantém entradas (dataclasses) em memória e as grava em um arquivo JSON sob demanda.
+
+    As alterações apenas marcam o índice como pendente; o arquivo é regravado uma única vez
+    por `flush` (ao fim de cada download, lote ou crawl, e em `close`), não a cada entrada.
+    """
+
+    entry_type: ClassVar[type[Any]]
+    """Dataclass das entradas do índice, definida por cada subclasse."""
+
+    def __init__(self, index_path: Path) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.index_path: Path = index_path
+        """Caminho do arquivo JSON do índice."""
+
+        self._lock = threading.Lock()
+        """Protege o índice contra escritas simultâneas (download em lote)."""
+
+        self._entries: dict[str, EntryT] = self._load_index()
+        """Entradas indexadas pela chave de cada subclasse (URL ou busca normalizada)."""
+
+        self._dirty: bool = False
+        """Indica se há alterações ainda não gravadas no arquivo."""
+
+    def _load_index(self) -> dict[str, EntryT]:
+        """Carrega o índice do disco, ignorando arquivos corrompidos."""
+        if not self.index_path.exists():
+            return {}
+        try:
+            raw: dict[str, dict] = json.loads(self.index_path.read_text(encoding="utf-8"))
+            return {key: self.entry_type(**data) for key, data in raw.items()}
+        except (OSError, ValueError, TypeError):
+            self.logger.warning(f"Índice inválido, recriando: '{self.index_path}'")
+            return {}
+
+    def _save_index(self) -> None:
+        """Grava o índice de forma atômica."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.index_path.with_suffix(".tmp")
+        payload = {key: asdict(entry) for key, entry in self._entries.items()}
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        temp_path.replace(self.index_path)
+
+    def flush(self) -> None:
+        """Grava o índice se houver alterações desde a última gravação."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+                self._dirty = False
+
+    def close(self) -> None:
+        """Grava as alterações pendentes."""
+        self.flush()
@@ -0,0 +1,117 @@
+"""Cache dos resultados do parsing, indexado pelo conteúdo do HTML, pelas opções e pela versão."""
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import PARSE_RESULTS_DIR
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+@dataclass
+class ParseResultStats:
+    """Contadores de uso do cache de resultados do parsing."""
+
+    hits: int = 0
+    """Páginas servidas do cache, sem parsing."""
+
+    misses: int = 0
+    """Páginas parseadas por não haver resultado para a chave."""
+
+
+class ParseResultStore(BaseClass):
+    """Armazena o dicionário do `run_full_extraction` em um arquivo JSON por chave.
+
+    A chave combina o hash do HTML com o hash do `parser.yaml`, das opções do parser e da
+    versão, de modo que editar os seletores, trocar as opções (engine, JSON embutido, parsing
+    parcial) ou a lógica de extração invalida as entradas automaticamente.
+    Cada entrada é um arquivo próprio gravado de forma atômica, o que permite o uso simultâneo
+    pelos processos do parsing em lote.
+    """
+
+    def __init__(
+        self, parser_version: str, options_key: str = "", directory: Path | None = None
+    ) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.parser_version: str = parser_version
+        """Versão da lógica de extração, parte da chave. Ex.: `2`"""
+
+        self.options_key: str = options_key
+        """Opções do parser que alteram o resultado, parte da chave. Ex.: `engine=lxml;...`"""
+
+        self.directory: Path = directory or PARSE_RESULTS_DIR
+        """Diretório das entradas: `./data/cache/parse_results`"""
+
+        self.stats = ParseResultStats()
+        """Contadores de acertos e faltas do cache."""
+
+        self._config_hashes: dict[Path, str] = {}
+        """Hash de cada `parser.yaml`, calculado uma única vez por instância."""
+
+    def config_hash(self, yaml_path: Path) -> str:
+        """Hash do `parser.yaml` combinado com as opções e a versão do parser."""
+        yaml_path = Path(yaml_path)
+        if yaml_path not in self._config_hashes:
+            digest = hashlib.sha256(yaml_path.read_bytes())
+            digest.update(f"\0{self.options_key}\0{self.parser_version}".encode())
+            self._config_hashes[yaml_path] = digest.hexdigest()[:16]
+        return self._config_hashes[yaml_path]
+
+    def key_for(self, html: str, yaml_path: Path) -> str:
+        """Chave da entrada: `<hash do HTML>.<hash do parser.yaml + opções + versão>`."""
+        html_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        return f"{html_hash}.{self.config_hash(yaml_path)}"
+
+    def _path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Retorna o resultado armazenado para a chave, se houver."""
+        path = self._path_for(key)
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except (OSError, ValueError):
+            self.logger.warning(f"Resultado de parsing inválido, ignorando: '{path}'")
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Grava o resultado de forma atômica (arquivo temporário + `replace`)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_name = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                json.dump(result, file, ensure_ascii=False)
+            Path(temp_name).replace(self._path_for(key))
+        except OSError:
+            Path(temp_name).unlink(missing_ok=True)
+            self.logger.warning(f"Não foi possível gravar o resultado do parsing: '{key}'")
+
+    def prune(self, yaml_path: Path) -> int:
+        """Remove as entradas de outras versões do `parser.yaml`, das opções ou do parser."""
+        if not self.directory.exists():
+            return 0
+        suffix = f".{self.config_hash(yaml_path)}.json"
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            if not path.name.endswith(suffix):
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            self.logger.info(f"Removidos {removed} resultados de parsing obsoletos.")
+        return removed
@@ -0,0 +1,60 @@
+"""Índice persistente das buscas resolvidas no Goodreads (título pesquisado → URL do livro)."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from src.config.constants import BRT, SEARCH_INDEX_FILE
+from src.infrastructure.cache.json_index_store import JsonIndexStore
+
+
+@dataclass
+class SearchIndexEntry:
+    """URL canônica do livro resolvida para uma busca."""
+
+    query: str
+    """Título pesquisado, como informado. Ex.: `PunPun`"""
+
+    book_url: str
+    """URL canônica do livro. Ex.: `https://www.goodreads.com/book/show/25986929-...`"""
+
+    resolved_at: float
+    """Momento (timestamp) em que a busca foi resolvida."""
+
+
+class SearchIndexStore(JsonIndexStore[SearchIndexEntry]):
+    """Persiste o mapeamento `busca → URL do livro` em JSON, com validade (TTL) por entrada."""
+
+    entry_type = SearchIndexEntry
+    """Entradas do índice: URL do livro de cada busca."""
+
+    def __init__(self, ttl_seconds: float, index_path: Path | None = None) -> None:
+        # Caminho padrão do índice: `./data/cache/search_index.json`
+        super().__init__(index_path or SEARCH_INDEX_FILE)
+
+        self.ttl_seconds: float = ttl_seconds
+        """Validade de cada entrada em segundos. Ex.: `604800`"""
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normaliza a busca (caixa e espaços) para que variações simples compartilhem a entrada."""
+        return " ".join(query.casefold().split())
+
+    def get(self, query: str) -> str | None:
+        """Retorna a URL do livro para a busca, se houver uma entrada dentro do TTL."""
+        entry = self._entries.get(self.normalize_query(query))
+        if entry is None:
+            return None
+        if datetime.now(tz=BRT).timestamp() - entry.resolved_at >= self.ttl_seconds:
+            self.logger.info(f"Busca expirada no índice: '{query}'")
+            return None
+        return entry.book_url
+
+    def put(self, query: str, book_url: str) -> None:
+        """Registra a URL do livro resolvida para a busca."""
+        entry = SearchIndexEntry(
+            query=query, book_url=book_url, resolved_at=datetime.now(tz=BRT).timestamp()
+        )
+        with self._lock:
+            self._entries[self.normalize_query(query)] = entry
+            self._dirty = True
@@ -0,0 +1,206 @@
+"""Fronteira persistente (SQLite) do crawler do Goodreads, com prioridade e deduplicação."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+import re
+import sqlite3
+import threading
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import CRAWL_FRONTIER_FILE
+from src.infrastructure.datasources.goodreads_search_parser import canonical_goodreads_url
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+CRAWL_LINK_PATTERN: re.Pattern[str] = re.compile(
+    r"""href=["'](?:https://www\.goodreads\.com)?/(?P<kind>book|author)/show/(?P<slug>[^/"'?#]+)(?=["'?#])"""
+)
+"""Captura links de livros e autores (`/book/show/{id}`), ignorando subpáginas (`/reviews`)."""
+
+
+def extract_crawl_links(html: str) -> list[tuple[str, str]]:
+    """Extrai os links canônicos de livros e autores de uma página, sem duplicatas."""
+    links: dict[str, str] = {}
+    for match in CRAWL_LINK_PATTERN.finditer(html):
+        url = canonical_goodreads_url(f"/{match['kind']}/show/{match['slug']}")
+        links.setdefault(url, match["kind"])
+    return list(links.items())
+
+
+@dataclass
+class FrontierItem:
+    """URL pendente na fronteira do crawler."""
+
+    url: str
+    """URL canônica da página."""
+
+    kind: str
+    """Tipo da página: `book` ou `author`."""
+
+    priority: int
+    """Prioridade (menor valor é processado primeiro)."""
+
+    depth: int
+    """Distância, em links, das URLs iniciais."""
+
+    attempts: int = 0
+    """Tentativas de download já realizadas."""
+
+
+class CrawlFrontier(BaseClass):
+    """Fila de URLs persistida em SQLite, retomável após uma interrupção do processo.
+
+    Cada URL canônica é inserida uma única vez (chave primária), de modo que páginas já
+    processadas não voltam à fila. Itens `in_progress` de uma execução interrompida
+    voltam a `pending` ao abrir a fronteira. Uma URL que falhou mantém a prioridade (o
+    nível e o tipo) e vai para depois das URLs do mesmo nível com menos tentativas.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS frontier (
+            url TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            depth INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            html_path TEXT,
+            error TEXT,
+            discovered_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        DROP INDEX IF EXISTS idx_frontier_next;
+        CREATE INDEX IF NOT EXISTS idx_frontier_queue
+            ON frontier (status, priority, attempts, discovered_at);
+    """
+
+    def __init__(self, database_path: Path | None = None, max_attempts: int = 3) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.database_path: Path = database_path or CRAWL_FRONTIER_FILE
+        """Caminho do banco SQLite: `./data/cache/crawl_frontier.sqlite3`"""
+
+        self.max_attempts: int = max_attempts
+        """Tentativas antes de marcar a URL como `failed`. Ex.: `3`"""
+
+        self._lock = threading.Lock()
+        """Serializa o acesso à conexão SQLite."""
+
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.database_path, isolation_level=None, check_same_thread=False
+        )
+        """Conexão em modo autocommit: cada transição de estado é gravada imediatamente."""
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(self._SCHEMA)
+        self._requeue_in_progress()
+
+    def __enter__(self) -> Self:
+        """Permite o uso da classe como gerenciador de contexto."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Fecha a conexão ao sair do gerenciador de contexto."""
+        self.close()
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._connection.close()
+
+    def _requeue_in_progress(self) -> None:
+        """Devolve à fila os itens que estavam em processamento quando o processo parou."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE frontier SET status = 'pending' WHERE status = 'in_progress'"
+            )
+        if cursor.rowcount:
+            self.logger.info(f"Retomando {cursor.rowcount} URL(s) interrompida(s) do crawler.")
+
+    def add(self, url: str, kind: str, priority: int = 0, depth: int = 0) -> bool:
+        """Adiciona a URL canônica à fronteira; retorna `False` se ela já era conhecida."""
+        return self.add_many([(url, kind)], priority, depth) == 1
+
+    def add_many(self, links: Iterable[tuple[str, str]], priority: int, depth: int) -> int:
+        """Adiciona várias URLs de uma vez e retorna quantas eram novas."""
+        now = time.time()
+        rows = [
+            (canonical_goodreads_url(url), kind, priority, depth, now, now) for url, kind in links
+        ]
+        with self._lock:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                """
+                INSERT OR IGNORE INTO frontier
+                    (url, kind, priority, depth, discovered_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            return self._connection.total_changes - before
+
+    def pop_next(self) -> FrontierItem | None:
+        """Retira a próxima URL pendente (menor prioridade, menos tentativas, mais antiga)."""
+        with self._lock:
+            row = self._connection.execute(
+                """
+                UPDATE frontier SET status = 'in_progress', updated_at = ?
+                WHERE url = (
+                    SELECT url FROM frontier WHERE status = 'pending'
+                    ORDER BY priority, attempts, discovered_at LIMIT 1
+                )
+                RETURNING url, kind, priority, depth, attempts
+                """,
+                (time.time(),),
+            ).fetchone()
+        return FrontierItem(*row) if row else None
+
+    def mark_done(self, url: str, html_path: Path | None = None) -> None:
+        """Marca a URL como processada."""
+        with self._lock:
+            self._connection.execute(
+                """
+                UPDATE frontier SET status = 'done', html_path = ?, error = NULL, updated_at = ?
+                WHERE url = ?
+                """,
+                (str(html_path) if html_path else None, time.time(), url),
+            )
+
+    def mark_failed(self, url: str, error: str) -> None:
+        """Registra a falha; a URL volta ao fim do seu nível até atingir o limite de tentativas.
+
+        A prioridade não muda: alterá-la trocaria o nível ou o tipo codificado nela
+        (`depth * 2 + tipo`); a ordem das novas tentativas vem da coluna `attempts`.
+        """
+        with self._lock:
+            self._connection.execute(
+                """
+                UPDATE frontier
+                SET attempts = attempts + 1,
+                    status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END,
+                    error = ?, updated_at = ?
+                WHERE url = ?
+                """,
+                (self.max_attempts, error, time.time(), url),
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Retorna a quantidade de URLs por status."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM frontier GROUP BY status"
+            ).fetchall()
+        return dict(rows)
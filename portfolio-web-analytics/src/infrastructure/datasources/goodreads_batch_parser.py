@@ -0,0 +1,163 @@
+"""Parsing em lote das páginas do cache HTML do Goodreads com um pool de processos."""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+import os
+from pathlib import Path
+import re
+from typing import TYPE_CHECKING, Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import PARSER_FILE
+from src.config.constypes import PathLike
+from src.infrastructure.datasources.goodreads_extraction_plan import load_extraction_plan
+from src.infrastructure.datasources.goodreads_parser import GoodreadsParser, ParserOptions
+from src.infrastructure.datasources.goodreads_parser_metrics import ParserMetrics
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+BOOK_PAGE_PATTERN = re.compile(r"^\d+.*\.html(\.gz)?$")
+"""Nome dos arquivos de páginas de livro no cache. Ex.: `25986929-goodnight-punpun.html.gz`"""
+
+
+@dataclass(frozen=True)
+class BatchParseResult:
+    """Resultado do parsing de uma página do lote."""
+
+    path: Path
+    """Página HTML parseada."""
+
+    record: dict[str, Any] | None = None
+    """Campos extraídos e formatados, ou None em caso de erro."""
+
+    error: str | None = None
+    """Mensagem do erro da página, se houver."""
+
+    metrics: ParserMetrics | None = None
+    """Métricas do parsing da página, quando ativas nas opções."""
+
+
+@dataclass
+class _WorkerState:
+    """Estado de cada processo do pool, criado uma única vez pelo inicializador."""
+
+    yaml_path: Path
+    parser: GoodreadsParser
+
+
+_worker_state: _WorkerState | None = None
+"""Estado do processo atual do pool."""
+
+
+def _initialize_worker(yaml_path: Path, options: ParserOptions) -> None:
+    """Compila o `parser.yaml` e cria o engine do processo antes da primeira página."""
+    global _worker_state  # noqa: PLW0603
+    load_extraction_plan(yaml_path)
+    _worker_state = _WorkerState(yaml_path, options.build_parser())
+
+
+def _parse_page(path: Path) -> BatchParseResult:
+    """Extrai os campos de uma página reaproveitando o plano e o parser do processo."""
+    state = _worker_state
+    if state is None:
+        return BatchParseResult(path, error="Processo do pool não inicializado.")
+    # A página é liberada ao sair do bloco, mantendo a memória do processo estável
+    try:
+        with state.parser.load_document(path) as parser:
+            # Cada página leva as próprias métricas; o processo principal as agrega
+            if parser.metrics is not None:
+                parser.metrics = ParserMetrics()
+            record = parser.run_full_extraction(state.yaml_path)
+            return BatchParseResult(path, record=record, metrics=parser.metrics)
+    # Qualquer erro de uma página (ex.: marcação inesperada) fica no resultado dela, sem
+    # interromper o lote
+    except Exception as e:  # noqa: BLE001
+        return BatchParseResult(path, error=f"{type(e).__name__}: {e}")
+
+
+class GoodreadsBatchParser(BaseClass):
+    """Distribui as páginas de um diretório (ou lista de caminhos) entre processos."""
+
+    def __init__(
+        self,
+        yaml_path: Path = PARSER_FILE,
+        options: ParserOptions | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        # Registra a inicialização da classe
+        self.logger.info(super()._inicialize_class())
+
+        self.yaml_path: Path = Path(yaml_path)
+        """Arquivo de seletores usado pelos processos. Ex.: `./src/config/files/parser.yaml`"""
+
+        self.options: ParserOptions = options or ParserOptions()
+        """Opções do parser (engine, JSON embutido, cache) usadas em cada processo."""
+
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        """Quantidade de processos do pool; por padrão, um por núcleo."""
+
+        self.metrics: ParserMetrics | None = ParserMetrics() if self.options.metrics else None
+        """Métricas agregadas das páginas parseadas, quando ativas nas opções."""
+
+    @staticmethod
+    def html_paths(source: PathLike | Iterable[PathLike]) -> Iterator[Path]:
+        """Lista as páginas de livro de um diretório, ou normaliza uma coleção de caminhos."""
+        if isinstance(source, (str, Path)) and Path(source).is_dir():
+            for path in sorted(Path(source).iterdir()):
+                if BOOK_PAGE_PATTERN.match(path.name):
+                    yield path
+            return
+        if isinstance(source, (str, Path)):
+            yield Path(source)
+            return
+        for path in source:
+            yield Path(path)
+
+    def parse(self, source: PathLike | Iterable[PathLike]) -> Iterator[BatchParseResult]:
+        """Parseia as páginas em paralelo e entrega cada resultado assim que fica pronto.
+
+        As páginas são enviadas aos poucos (algumas por processo), para que diretórios com
+        dezenas de milhares de arquivos não criem todas as tarefas de uma vez.
+        """
+        paths = self.html_paths(source)
+        max_pending = self.max_workers * 4
+        parsed = failed = 0
+
+        # Descarta os resultados de outros seletores, opções ou versões antes do lote
+        result_store = self.options.build_result_store()
+        if result_store is not None:
+            result_store.prune(self.yaml_path)
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_initialize_worker,
+            initargs=(self.yaml_path, self.options),
+        ) as executor:
+            pending: set[Future[BatchParseResult]] = set()
+            while True:
+                for path in islice(paths, max_pending - len(pending)):
+                    pending.add(executor.submit(_parse_page, path))
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    parsed += 1
+                    failed += result.error is not None
+                    if self.metrics is not None and result.metrics is not None:
+                        self.metrics.merge(result.metrics)
+                    yield result
+
+        self.logger.info(
+            f"Parsing em lote concluído: {parsed} páginas ({failed} com erro), "
+            f"{self.max_workers} processos."
+        )
@@ -0,0 +1,330 @@
+"""Plano de extração compilado a partir do `parser.yaml`, executado em uma única varredura.
+
+Em vez de um `find_all` sobre a árvore inteira para cada campo, o plano agrupa todos os
+seletores por nome de tag e percorre o documento uma só vez, coletando as ocorrências de
+cada seletor. Os campos são resolvidos em seguida a partir dessas ocorrências, com a mesma
+semântica do `GoodreadsParser.extract_from_yaml_by_field`.
+
+Os seletores de cada campo também definem as regiões do parsing parcial (`RegionStrainer`):
+apenas essas subárvores são construídas, como em `CleanRepository.keep_only_main_content`,
+mas derivadas do próprio `parser.yaml`.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+import yaml
+
+from src.common.errors.errors import GoodreadsHTMLParserError
+
+if TYPE_CHECKING:
+    from src.infrastructure.datasources.goodreads_parser_metrics import ParserMetrics
+
+MULTI_VALUED_ATTRIBUTES = frozenset(
+    {"class", "rel", "rev", "accept-charset", "headers", "accesskey", "dropzone"}
+)
+"""Atributos que o BeautifulSoup trata como listas de tokens separados por espaço."""
+
+
+@dataclass(frozen=True)
+class Selector:
+    """Seletor compilado equivalente a `find_all(name, attrs)` do BeautifulSoup."""
+
+    name: str
+    """Nome da tag. Ex.: `span`"""
+
+    attrs: tuple[tuple[str, Any], ...] = ()
+    """Pares (atributo, valor esperado) a conferir."""
+
+    @classmethod
+    def from_args(cls, find_args: dict[str, Any]) -> "Selector":
+        """Cria o seletor a partir de um bloco `name`/`attrs` do YAML."""
+        name = find_args.get("name")
+        attrs = find_args.get("attrs", {})
+        if not isinstance(name, str) or not isinstance(attrs, dict):
+            msg = f"Seletor inválido no parser.yaml: {find_args}"
+            raise GoodreadsHTMLParserError(msg)
+        return cls(name, tuple(attrs.items()))
+
+    def matches(self, tag: Tag) -> bool:
+        """Confere os atributos da tag com as mesmas regras do BeautifulSoup."""
+        return self.matches_attrs(tag.attrs)
+
+    def matches_attrs(self, attrs: dict[str, Any]) -> bool:
+        """Confere atributos já processados (listas) ou brutos do parser (strings)."""
+        for attr, expected in self.attrs:
+            value = attrs.get(attr)
+            if isinstance(value, str) and attr in MULTI_VALUED_ATTRIBUTES:
+                value = value.split()
+            if expected is True:
+                if value is None:
+                    return False
+            elif isinstance(value, list):
+                # Atributos multivalorados (ex.: `class`) aceitam um token ou a string inteira
+                if expected not in value and expected != " ".join(value):
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    @property
+    def xpath(self) -> str:
+        """Expressão XPath relativa equivalente ao seletor, com as mesmas regras de atributo."""
+        conditions: list[str] = []
+        for attr, expected in self.attrs:
+            if expected is True:
+                conditions.append(f"@{attr}")
+            elif attr in MULTI_VALUED_ATTRIBUTES and " " not in expected:
+                token = _xpath_literal(f" {expected} ")
+                conditions.append(f'contains(concat(" ", normalize-space(@{attr}), " "), {token})')
+            elif attr in MULTI_VALUED_ATTRIBUTES:
+                conditions.append(f"normalize-space(@{attr}) = {_xpath_literal(expected)}")
+            else:
+                conditions.append(f"@{attr} = {_xpath_literal(expected)}")
+        predicate = f"[{' and '.join(conditions)}]" if conditions else ""
+        return f".//{self.name}{predicate}"
+
+
+def _xpath_literal(value: str) -> str:
+    """Escreve uma string como literal XPath, escolhendo as aspas conforme o conteúdo."""
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    parts = ", '\"', ".join(f'"{part}"' for part in value.split('"'))
+    return f"concat({parts})"
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    """Campo do `parser.yaml` compilado."""
+
+    name: str
+    """Nome do campo no resultado. Ex.: `autor_stats`"""
+
+    selector: Selector
+    """Seletor do elemento com o valor."""
+
+    parents: tuple[Selector, ...] = ()
+    """Cadeia de escopos (`parent` aninhados), do mais externo ao mais interno."""
+
+    index: int | None = None
+    """Índice da ocorrência desejada (`index`), se houver."""
+
+    any_parent: bool = False
+    """Com `scope: all`, usa o primeiro escopo cujo elemento tenha texto (ex.: `author_bio`)."""
+
+    attribute: str | None = None
+    """Atributo lido no lugar do texto (`attr`), se houver. Ex.: `href`"""
+
+
+def field_value(element: Tag, attribute: str | None, separator: str = "") -> str | None:
+    """Retorna o atributo pedido (`attr`) ou, sem ele, o texto do elemento."""
+    if attribute is None:
+        return element.get_text(separator=separator, strip=True)
+    value = element.get(attribute)
+    return " ".join(value) if isinstance(value, list) else value
+
+
+class RegionStrainer(SoupStrainer):
+    """Filtro de parsing que mantém apenas as regiões do documento usadas pelo plano."""
+
+    def __init__(self, regions: list[Selector]) -> None:
+        super().__init__()
+        self.regions_by_tag: dict[str, list[Selector]] = {}
+        """Seletores das regiões agrupados pelo nome da tag."""
+
+        for region in regions:
+            self.regions_by_tag.setdefault(region.name, []).append(region)
+
+    def allow_tag_creation(
+        self, nsprefix: str | None, name: str, attrs: dict[str, Any] | None
+    ) -> bool:
+        """Cria a tag (e sua subárvore) apenas se ela iniciar uma das regiões."""
+        del nsprefix
+        regions = self.regions_by_tag.get(name)
+        return bool(regions) and any(region.matches_attrs(attrs or {}) for region in regions)
+
+    def allow_string_creation(self, string: str) -> bool:
+        """Descarta textos fora das regiões."""
+        del string
+        return False
+
+
+@dataclass
+class ExtractionPlan:
+    """Conjunto de campos compilados, indexados por nome de tag para a varredura única."""
+
+    fields: list[CompiledField]
+    """Campos na ordem do `parser.yaml`."""
+
+    skipped: list[str] = field(default_factory=list)
+    """Campos sem configuração válida (ignorados, como no parsing por campo)."""
+
+    selectors_by_tag: dict[str, list[Selector]] = field(init=False)
+    """Seletores distintos agrupados pelo nome da tag."""
+
+    _subsets: dict[frozenset[str], "ExtractionPlan"] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Subplanos já criados, reutilizados para manter o parsing parcial em cache."""
+
+    def __post_init__(self) -> None:
+        self.selectors_by_tag = {}
+        for compiled in self.fields:
+            for selector in (*compiled.parents, compiled.selector):
+                selectors = self.selectors_by_tag.setdefault(selector.name, [])
+                if selector not in selectors:
+                    selectors.append(selector)
+
+    @classmethod
+    def compile(cls, config: dict[str, Any]) -> "ExtractionPlan":
+        """Compila o conteúdo do `parser.yaml` em um plano de extração."""
+        fields: list[CompiledField] = []
+        skipped: list[str] = []
+        for name, find_args in config.items():
+            if not isinstance(find_args, dict):
+                skipped.append(name)
+                continue
+            parents: list[Selector] = []
+            parent_args = find_args.get("parent")
+            while isinstance(parent_args, dict):
+                parents.insert(0, Selector.from_args(parent_args))
+                parent_args = parent_args.get("parent")
+            index = find_args.get("index")
+            fields.append(
+                CompiledField(
+                    name=name,
+                    selector=Selector.from_args(find_args),
+                    parents=tuple(parents),
+                    index=index if isinstance(index, int) else None,
+                    any_parent=find_args.get("scope") == "all",
+                    attribute=find_args.get("attr"),
+                )
+            )
+        return cls(fields, skipped)
+
+    def subset(self, names: list[str]) -> "ExtractionPlan":
+        """Retorna o plano restrito aos campos informados (ex.: os ausentes no JSON)."""
+        key = frozenset(names)
+        if key not in self._subsets:
+            self._subsets[key] = ExtractionPlan([f for f in self.fields if f.name in key])
+        return self._subsets[key]
+
+    @property
+    def regions(self) -> list[Selector]:
+        """Seletores que podem ser buscados a partir da raiz: as regiões que o documento mantém.
+
+        Além do escopo mais externo, os seletores internos entram como regiões porque, sem o
+        escopo no documento, a busca volta para o documento inteiro.
+        """
+        regions: list[Selector] = []
+        for compiled in self.fields:
+            for region in (*compiled.parents, compiled.selector):
+                if region not in regions:
+                    regions.append(region)
+        return regions
+
+    def strainer(self) -> RegionStrainer:
+        """Cria o filtro de parsing parcial com as regiões do plano."""
+        return RegionStrainer(self.regions)
+
+    def _collect(self, soup: BeautifulSoup) -> dict[Selector, list[Tag]]:
+        """Percorre o documento uma única vez e agrupa as ocorrências de cada seletor."""
+        matches: dict[Selector, list[Tag]] = {
+            selector: [] for selectors in self.selectors_by_tag.values() for selector in selectors
+        }
+        selectors_by_tag = self.selectors_by_tag
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            selectors = selectors_by_tag.get(element.name)
+            if not selectors:
+                continue
+            for selector in selectors:
+                if selector.matches(element):
+                    matches[selector].append(element)
+        return matches
+
+    @staticmethod
+    def _within(elements: list[Tag], scope: Tag) -> list[Tag]:
+        """Filtra os elementos descendentes do escopo, mantendo a ordem do documento."""
+        return [element for element in elements if any(p is scope for p in element.parents)]
+
+    def _scope(
+        self, parents: tuple[Selector, ...], matches: dict[Selector, list[Tag]]
+    ) -> Tag | None:
+        """Resolve a cadeia de escopos; sem um elo no documento, mantém o mais interno achado."""
+        scope: Tag | None = None
+        for parent in parents:
+            candidates = matches[parent]
+            if scope is not None:
+                candidates = self._within(candidates, scope)
+            if not candidates:
+                break
+            scope = candidates[0]
+        return scope
+
+    def _resolve(self, compiled: CompiledField, matches: dict[Selector, list[Tag]]) -> Any:
+        """Resolve o valor de um campo a partir das ocorrências coletadas."""
+        elements = matches[compiled.selector]
+
+        if compiled.parents and compiled.any_parent:
+            blocks = matches[compiled.parents[-1]]
+            outer_scope = self._scope(compiled.parents[:-1], matches)
+            if outer_scope is not None:
+                blocks = self._within(blocks, outer_scope)
+            for block in blocks:
+                scoped = self._within(elements, block)
+                value = field_value(scoped[0], compiled.attribute, " ") if scoped else None
+                if value:
+                    return value
+            return None
+
+        scope = self._scope(compiled.parents, matches)
+        if scope is not None:
+            elements = self._within(elements, scope)
+
+        if not elements:
+            return None
+        index = compiled.index
+        selected = elements[index] if index is not None and index < len(elements) else elements[0]
+        return field_value(selected, compiled.attribute)
+
+    def execute(
+        self, soup: BeautifulSoup, metrics: "ParserMetrics | None" = None
+    ) -> dict[str, Any]:
+        """Executa o plano sobre o documento e retorna o valor de cada campo.
+
+        Com `metrics`, registra os acertos de cada seletor na varredura e o tempo de cada campo.
+        """
+        matches = self._collect(soup)
+        if metrics is None:
+            return {compiled.name: self._resolve(compiled, matches) for compiled in self.fields}
+
+        for selector, elements in matches.items():
+            metrics.record_selector(selector, hit=bool(elements))
+        result: dict[str, Any] = {}
+        for compiled in self.fields:
+            started = perf_counter()
+            value = result[compiled.name] = self._resolve(compiled, matches)
+            metrics.record_field(compiled.name, perf_counter() - started, hit=value is not None)
+        return result
+
+
+@lru_cache(maxsize=8)
+def _load_plan(yaml_path: str, modified_at: float) -> ExtractionPlan:  # noqa: ARG001
+    """Compila o YAML; a data de modificação na chave invalida o cache ao editar o arquivo."""
+    with Path(yaml_path).open("r", encoding="utf-8") as file:
+        return ExtractionPlan.compile(yaml.safe_load(file))
+
+
+def load_extraction_plan(yaml_path: Path) -> ExtractionPlan:
+    """Retorna o plano compilado do `parser.yaml`, compilando-o apenas uma vez por versão."""
+    yaml_path = Path(yaml_path)
+    return _load_plan(str(yaml_path.resolve()), yaml_path.stat().st_mtime)
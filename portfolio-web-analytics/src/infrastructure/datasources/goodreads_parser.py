@@ -1,22 +1,52 @@
 """Lógica de scraping específica para buscas e detalhes de livros no Goodreads."""
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from time import perf_counter
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
 
 from bs4 import BeautifulSoup
+from bs4.element import Tag
 
 from src.common.base.base_class import BaseClass
 from src.common.errors.errors import GoodreadsHTMLParserError
+from src.config.constypes import PathLike
+from src.infrastructure.cache.html_cache_backend import HtmlCacheBackend, PlainHtmlCache
+from src.infrastructure.cache.parse_result_store import ParseResultStore
+from src.infrastructure.datasources.goodreads_extraction_plan import (
+    ExtractionPlan,
+    field_value,
+    load_extraction_plan,
+)
+from src.infrastructure.datasources.goodreads_parser_engines import (
+    BeautifulSoupEngine,
+    ParserEngine,
+    build_parser_engine,
+)
+from src.infrastructure.datasources.goodreads_parser_metrics import ParserMetrics
+from src.infrastructure.datasources.goodreads_structured_data import GoodreadsStructuredData
 from src.infrastructure.logger import LoggerSingleton
 
 if TYPE_CHECKING:
     from logging import Logger
 
+PARSER_VERSION = "3"
+"""Versão da lógica de extração; alterá-la invalida o cache de resultados do parsing."""
+
 
 class GoodreadsParser(BaseClass):
     """Realiza o parsing de arquivos HTML do Goodreads e extrai elementos."""
 
-    def __init__(self, html_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        html_path: Path | None = None,
+        cache_backend: HtmlCacheBackend | None = None,
+        *,
+        engine: ParserEngine | None = None,
+        structured_data: bool = False,
+        result_store: ParseResultStore | None = None,
+    ) -> None:
         self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
         """Logger singleton para registrar eventos e erros."""
 
@@ -29,14 +59,81 @@ class GoodreadsParser(BaseClass):
         )
         """Caminho do arquivo HTML a ser carregado."""
 
-        self.soup: BeautifulSoup | None = None
+        self.cache_backend: HtmlCacheBackend = cache_backend or PlainHtmlCache()
+        """Backend do cache HTML, responsável por descomprimir as páginas armazenadas."""
+
+        self.engine: ParserEngine = engine or BeautifulSoupEngine()
+        """Engine de parsing do plano compilado; sem engine, usa o BeautifulSoup."""
+
+        self._reference_engine: BeautifulSoupEngine = (
+            self.engine if isinstance(self.engine, BeautifulSoupEngine) else BeautifulSoupEngine()
+        )
+        """Engine BeautifulSoup do `soup`, usado pela extração por campo (referência)."""
+
+        self.structured_data = structured_data
+        """Se True, lê os campos do JSON-LD/`__NEXT_DATA__` e usa o DOM só para os ausentes."""
+
+        self.result_store: ParseResultStore | None = result_store
+        """Cache dos resultados por hash do HTML e do `parser.yaml`; None desativa."""
+
+        self.metrics: ParserMetrics | None = None
+        """Coletor de tempos e acertos por campo/seletor; None (padrão) desativa a medição."""
+
+        self._html: str | None = None
+        """Conteúdo HTML lido do cache, compartilhado entre o JSON e o DOM."""
+
+    def _read_html(self) -> str:
+        """Lê o HTML pelo backend de cache uma única vez."""
+        if self._html is None:
+            started = perf_counter()
+            self._html = self.cache_backend.read_text(Path(self.html_path))
+            if self.metrics is not None:
+                self.metrics.record_stage("read", perf_counter() - started)
+        return self._html
+
+    @property
+    def soup(self) -> BeautifulSoup | None:
         """BeautifulSoup será inicializado apenas quando necessário."""
+        return self._reference_engine.document
+
+    def _ensure_document(self, engine: ParserEngine, plan: ExtractionPlan | None) -> None:
+        """Garante que o engine parseou o HTML correto para executar o plano."""
+        if engine.needs_parse(plan):
+            html = self._read_html()
+            started = perf_counter()
+            engine.load(html, plan)
+            if self.metrics is not None:
+                self.metrics.record_stage("parse", perf_counter() - started)
+            self.logger.info(f"HTML carregado de: '{self.html_path}' ({engine.name})")
 
-    def _ensure_soup(self) -> None:
+    def _ensure_soup(self, plan: ExtractionPlan | None = None) -> None:
         """Garante que o BeautifulSoup foi inicializado com o HTML correto."""
-        if self.soup is None:
-            self.soup = super()._load_html(self.html_path)
-            self.logger.info(f"HTML carregado de: '{self.html_path}'")
+        self._ensure_document(self._reference_engine, plan)
+
+    def __enter__(self) -> Self:
+        """Permite o uso da classe como gerenciador de contexto."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Libera a página carregada ao sair do gerenciador de contexto."""
+        self.release()
+
+    def release(self) -> None:
+        """Descarta as árvores e o HTML da página atual; o parser continua reutilizável."""
+        self.engine.release()
+        self._reference_engine.release()
+        self._html = None
+
+    def load_document(self, html_path: PathLike) -> Self:
+        """Aponta o parser para outra página, liberando a anterior. Ex.: em lotes."""
+        self.release()
+        self.html_path = Path(html_path)
+        return self
 
     def _log_and_raise_exception(
         self, error_message: str, exception_class: type[Exception]
@@ -45,10 +142,64 @@ class GoodreadsParser(BaseClass):
         self.logger.exception(error_message)
         raise exception_class(error_message)
 
+    def _extract_structured_data(self, plan: ExtractionPlan) -> dict[str, Any]:
+        """Lê os campos do plano no JSON embutido; os ausentes ficam como None."""
+        html = self._read_html()
+        started = perf_counter()
+        structured = GoodreadsStructuredData.from_html(html).fields()
+        result = {compiled.name: structured.get(compiled.name) for compiled in plan.fields}
+        if self.metrics is not None:
+            self.metrics.record_stage("structured_data", perf_counter() - started)
+            for name, value in result.items():
+                if value is not None:
+                    self.metrics.record_structured_field(name)
+        return result
+
     def extract_from_yaml(self, yaml_path: Path) -> dict[str, Any]:
-        """Extrai dados de um arquivo YAML e busca elementos no HTML carregado."""
+        """Extrai os campos do YAML com o plano compilado, em uma única varredura do HTML.
+
+        Com `structured_data`, os campos disponíveis no JSON embutido dispensam o DOM, que é
+        parseado apenas para os campos ausentes.
+        """
         try:
-            self._ensure_soup()
+            plan = load_extraction_plan(yaml_path)
+            for field in plan.skipped:
+                self.logger.warning(f"Configuração para o campo '{field}' não encontrada.")
+
+            dom_plan = plan
+            result: dict[str, Any] = {}
+            if self.structured_data:
+                result = self._extract_structured_data(plan)
+                dom_plan = plan.subset([name for name, value in result.items() if value is None])
+                self.logger.debug(
+                    f"Campos lidos do JSON embutido: {len(plan.fields) - len(dom_plan.fields)}"
+                    f"/{len(plan.fields)}"
+                )
+
+            if dom_plan.fields:
+                self._ensure_document(self.engine, dom_plan)
+                started = perf_counter()
+                result.update(self.engine.execute(dom_plan, self.metrics))
+                if self.metrics is not None:
+                    self.metrics.record_stage("extraction", perf_counter() - started)
+
+        except GoodreadsHTMLParserError:
+            self._log_and_raise_exception(
+                "Erro ao extrair dados do arquivo YAML.", GoodreadsHTMLParserError
+            )
+        else:
+            # O texto bruto não é mais necessário; a árvore (se houver) já foi construída
+            self._html = None
+            missing = [field for field, value in result.items() if value is None]
+            if missing:
+                self.logger.warning(f"Nenhum elemento encontrado para os campos: {missing}")
+            self.logger.info("Dados extraídos com sucesso do arquivo YAML.")
+            return result
+
+    def extract_from_yaml_by_field(self, yaml_path: Path) -> dict[str, Any]:
+        """Extrai os campos do YAML com um `find_all` por campo (implementação de referência)."""
+        try:
+            self._ensure_soup(load_extraction_plan(yaml_path))
             config: dict[str, Any] = self._load_yaml(yaml_path)
             result: dict[str, Any] = {}
 
@@ -69,24 +220,40 @@ class GoodreadsParser(BaseClass):
             self.logger.info("Dados extraídos com sucesso do arquivo YAML.")
             return result
 
-    def _get_search_scope(self, find_args: dict[str, Any]) -> BeautifulSoup:
+    @staticmethod
+    def _parent_chain(find_args: dict[str, Any]) -> list[dict[str, Any]]:
+        """Retorna a cadeia de `parent` aninhados, do escopo mais externo ao mais interno."""
+        chain: list[dict[str, Any]] = []
+        parent_args = find_args.get("parent")
+        while isinstance(parent_args, dict):
+            chain.append(parent_args)
+            parent_args = parent_args.get("parent")
+        chain.reverse()
+        return chain
+
+    def _resolve_scope(self, parent_chain: list[dict[str, Any]]) -> BeautifulSoup | Tag:
+        """Percorre a cadeia de escopos sobre a própria árvore, sem copiar ou reparsear."""
+        search_scope: BeautifulSoup | Tag = self.soup
+        for parent_args in parent_chain:
+            parent_name = parent_args.get("name")
+            parent_attrs = parent_args.get("attrs")
+
+            if not isinstance(parent_name, str) or not isinstance(parent_attrs, dict):
+                self.logger.warning("Atributos inválidos para o escopo de busca.")
+                break
+
+            # Sem o escopo no documento, mantém o escopo mais interno já encontrado
+            parent_element = search_scope.find(parent_name, parent_attrs)
+            if parent_element is None:
+                break
+            search_scope = parent_element
+        return search_scope
+
+    def _get_search_scope(self, find_args: dict[str, Any]) -> BeautifulSoup | Tag:
         """Determina o escopo de busca baseado nos argumentos do YAML."""
         try:
             self._ensure_soup()
-            parent_args: dict[str, Any] | None = find_args.get("parent")
-            search_scope = self.soup
-
-            if parent_args:
-                parent_name = parent_args.get("name")
-                parent_attrs = parent_args.get("attrs")
-
-                if isinstance(parent_name, str) and isinstance(parent_attrs, dict):
-                    parent_element = self.soup.find(parent_name, parent_attrs)
-                    search_scope = (
-                        BeautifulSoup(str(parent_element), "lxml") if parent_element else self.soup
-                    )
-                else:
-                    self.logger.warning("Atributos inválidos para o escopo de busca.")
+            search_scope = self._resolve_scope(self._parent_chain(find_args))
 
         except GoodreadsHTMLParserError:
             self._log_and_raise_exception(
@@ -96,27 +263,29 @@ class GoodreadsParser(BaseClass):
             return search_scope
 
     def _extract_field_data(
-        self, search_scope: BeautifulSoup, field: str, find_args: dict[str, Any]
+        self, search_scope: BeautifulSoup | Tag, field: str, find_args: dict[str, Any]
     ) -> Any:
         """Extrai os dados de um campo específico baseado nos argumentos do YAML."""
         try:
             name = find_args.get("name")
             attrs = find_args.get("attrs", {})
             index = find_args.get("index")
+            attribute = find_args.get("attr")
 
-            # Lógica especial para author_bio:
-            # busca global por todos os divs corretos e pega o primeiro span.Formatted não vazio
-            if field == "author_bio":
-                parent_args = find_args.get("parent")
-                if parent_args:
-                    parent_name = parent_args.get("name")
-                    parent_attrs = parent_args.get("attrs", {})
-                    # Busca global por todos os divs
-                    parent_blocks = self.soup.find_all(parent_name, parent_attrs)
+            # Com `scope: all` (ex.: author_bio), busca em todos os escopos do documento
+            # e retorna o primeiro elemento com texto não vazio
+            if find_args.get("scope") == "all":
+                parent_chain = self._parent_chain(find_args)
+                if parent_chain:
+                    parent_name = parent_chain[-1].get("name")
+                    parent_attrs = parent_chain[-1].get("attrs", {})
+                    # Busca todos os blocos do parent mais interno dentro dos escopos externos
+                    outer_scope = self._resolve_scope(parent_chain[:-1])
+                    parent_blocks = outer_scope.find_all(parent_name, parent_attrs)
                     for block in parent_blocks:
                         span = block.find(name, attrs)
                         if span:
-                            text = span.get_text(separator=" ", strip=True)
+                            text = field_value(span, attribute, " ")
                             if text:
                                 self.logger.info(
                                     f"Dados extraídos com sucesso para o campo '{field}'."
@@ -134,7 +303,7 @@ class GoodreadsParser(BaseClass):
                         else elements[0]
                     )
                     self.logger.info(f"Dados extraídos com sucesso para o campo '{field}'.")
-                    return selected_element.get_text(strip=True) if selected_element else None
+                    return field_value(selected_element, attribute) if selected_element else None
                 self.logger.warning(f"Nenhum elemento encontrado para o campo '{field}'.")
                 return None
             self.logger.warning(f"Atributos inválidos para o campo '{field}'.")
@@ -156,6 +325,89 @@ class GoodreadsParser(BaseClass):
         return formatted
 
     def run_full_extraction(self, yaml_path: Path) -> dict[str, Any]:
-        """Executa o processo completo de extração e formatação dos dados do HTML."""
-        extracted = self.extract_from_yaml(yaml_path)
-        return self.format_extracted_data(extracted)
+        """Executa o processo completo de extração e formatação dos dados do HTML.
+
+        Com `result_store`, páginas cujo conteúdo e `parser.yaml` não mudaram são servidas do
+        cache sem nenhum parsing.
+        """
+        if self.metrics is not None:
+            self.metrics.pages += 1
+        if self.result_store is None:
+            return self.format_extracted_data(self.extract_from_yaml(yaml_path))
+
+        key = self.result_store.key_for(self._read_html(), yaml_path)
+        cached = self.result_store.get(key)
+        if cached is not None:
+            self._html = None
+            if self.metrics is not None:
+                self.metrics.cache_hits += 1
+            self.logger.info(f"Resultado do parsing obtido do cache: '{self.html_path}'")
+            return cached
+
+        result = self.format_extracted_data(self.extract_from_yaml(yaml_path))
+        self.result_store.put(key, result)
+        return result
+
+
+@dataclass(frozen=True)
+class ParserOptions:
+    """Opções do `GoodreadsParser` lidas do `settings.yaml`, serializáveis entre processos."""
+
+    engine: str = BeautifulSoupEngine.name
+    """Engine de parsing (`goodreads.parser_engine`). Ex.: `lxml`"""
+
+    partial_parse: bool = False
+    """Parsing parcial das regiões do `parser.yaml` (`goodreads.partial_parse`)."""
+
+    structured_data: bool = False
+    """Leitura do JSON embutido antes do DOM (`goodreads.structured_data`)."""
+
+    parse_cache: bool = False
+    """Cache dos resultados por hash do HTML e do `parser.yaml` (`goodreads.parse_cache`)."""
+
+    metrics: bool = False
+    """Tempo por campo e acertos dos seletores (`goodreads.parser_metrics`)."""
+
+    @classmethod
+    def from_settings(cls, goodreads_settings: dict[str, Any]) -> "ParserOptions":
+        """Cria as opções a partir da seção `goodreads` do `settings.yaml`."""
+        return cls(
+            engine=goodreads_settings.get("parser_engine", BeautifulSoupEngine.name),
+            partial_parse=goodreads_settings.get("partial_parse", False),
+            structured_data=goodreads_settings.get("structured_data", False),
+            parse_cache=goodreads_settings.get("parse_cache", False),
+            metrics=goodreads_settings.get("parser_metrics", False),
+        )
+
+    @property
+    def result_key(self) -> str:
+        """Opções que alteram o resultado da extração, usadas na chave do cache de resultados."""
+        return (
+            f"engine={self.engine};partial_parse={int(self.partial_parse)};"
+            f"structured_data={int(self.structured_data)}"
+        )
+
+    def build_result_store(self) -> ParseResultStore | None:
+        """Cria o cache de resultados destas opções, ou None se `parse_cache` estiver desativado."""
+        return ParseResultStore(PARSER_VERSION, self.result_key) if self.parse_cache else None
+
+    def build_engine(self) -> ParserEngine:
+        """Cria o engine configurado."""
+        return build_parser_engine(self.engine, partial_parse=self.partial_parse)
+
+    def build_parser(
+        self,
+        html_path: Path | None = None,
+        cache_backend: HtmlCacheBackend | None = None,
+        engine: ParserEngine | None = None,
+    ) -> GoodreadsParser:
+        """Cria o parser da página com as opções (e, se informado, um engine reaproveitado)."""
+        parser = GoodreadsParser(
+            html_path,
+            cache_backend,
+            engine=engine or self.build_engine(),
+            structured_data=self.structured_data,
+            result_store=self.build_result_store(),
+        )
+        parser.metrics = ParserMetrics() if self.metrics else None
+        return parser
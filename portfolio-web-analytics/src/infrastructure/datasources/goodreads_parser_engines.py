@@ -0,0 +1,211 @@
+"""Engines de parsing do GoodreadsParser: BeautifulSoup (referência) e lxml com XPath.
+
+Cada engine parseia o HTML em seu próprio documento e executa o `ExtractionPlan` compilado
+do `parser.yaml`, retornando os mesmos valores campo a campo. O engine usado pelo parser é
+escolhido pela chave `goodreads.parser_engine` do `settings.yaml`.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+from src.common.errors.errors import GoodreadsHTMLParserError
+from src.infrastructure.datasources.goodreads_extraction_plan import (
+    CompiledField,
+    ExtractionPlan,
+    Selector,
+)
+
+if TYPE_CHECKING:
+    from src.infrastructure.datasources.goodreads_parser_metrics import ParserMetrics
+
+NON_TEXT_TAGS = frozenset({"script", "style"})
+"""Tags cujo conteúdo o BeautifulSoup não inclui em `get_text`."""
+
+
+class ParserEngine(ABC):
+    """Interface de um engine de parsing: mantém o documento parseado e executa o plano."""
+
+    name: ClassVar[str]
+    """Nome do engine no `settings.yaml`. Ex.: `lxml`"""
+
+    def __init__(self) -> None:
+        self.document: Any | None = None
+        """Documento parseado pelo engine, reaproveitado entre extrações."""
+
+        self._document_plan: ExtractionPlan | None = None
+        """Plano usado no parsing, quando o documento depende dele (parsing parcial)."""
+
+    def needs_parse(self, plan: ExtractionPlan | None) -> bool:
+        """Indica se o HTML precisa ser (re)parseado para executar o plano."""
+        del plan
+        return self.document is None
+
+    def load(self, html: str, plan: ExtractionPlan | None = None) -> None:
+        """Parseia o HTML e guarda o documento para as próximas extrações."""
+        self.document = self._parse(html, plan)
+        self._document_plan = plan
+
+    def release(self) -> None:
+        """Descarta o documento parseado."""
+        self.document = None
+        self._document_plan = None
+
+    @abstractmethod
+    def _parse(self, html: str, plan: ExtractionPlan | None) -> Any:
+        """Constrói o documento do engine a partir do HTML."""
+
+    @abstractmethod
+    def execute(
+        self, plan: ExtractionPlan, metrics: "ParserMetrics | None" = None
+    ) -> dict[str, Any]:
+        """Executa o plano sobre o documento carregado, registrando as métricas se informadas."""
+
+
+class BeautifulSoupEngine(ParserEngine):
+    """Engine de referência: árvore do BeautifulSoup (parser lxml) e varredura única do plano."""
+
+    name = "beautifulsoup"
+
+    def __init__(self, *, partial_parse: bool = False) -> None:
+        super().__init__()
+        self.partial_parse = partial_parse
+        """Se True, constrói a árvore apenas das regiões usadas pelo plano."""
+
+    def needs_parse(self, plan: ExtractionPlan | None) -> bool:
+        """No parsing parcial, a árvore é refeita se o plano (e portanto as regiões) mudar."""
+        partial = self.partial_parse and plan is not None
+        return self.document is None or (partial and self._document_plan is not plan)
+
+    def release(self) -> None:
+        """Desmonta a árvore antes de descartá-la.
+
+        Os nós do BeautifulSoup se referenciam (pai, irmãos, próximo elemento); sem o
+        `decompose`, cada árvore descartada só é liberada pelo coletor de ciclos, e em lote a
+        memória cresce entre as coletas. A raiz não encadeia os filhos em `next_element`,
+        então cada nó de primeiro nível é desmontado separadamente.
+        """
+        if self.document is not None:
+            for child in list(self.document.contents):
+                child.decompose()
+            self.document.decompose()
+        super().release()
+
+    def _parse(self, html: str, plan: ExtractionPlan | None) -> BeautifulSoup:
+        parse_only = plan.strainer() if self.partial_parse and plan is not None else None
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+    def execute(
+        self, plan: ExtractionPlan, metrics: "ParserMetrics | None" = None
+    ) -> dict[str, Any]:
+        """Executa o plano com a varredura única sobre a árvore do BeautifulSoup."""
+        return plan.execute(self.document, metrics)
+
+
+class LxmlEngine(ParserEngine):
+    """Engine de alto desempenho: árvore do `lxml.html` e seletores traduzidos para XPath."""
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._xpaths: dict[Selector, etree.XPath] = {}
+        """Expressões XPath compiladas por seletor."""
+
+    def _parse(self, html: str, plan: ExtractionPlan | None) -> etree._Element:
+        del plan
+        return lxml_html.document_fromstring(html)
+
+    def _find_all(self, scope: etree._Element, selector: Selector) -> list[etree._Element]:
+        """Busca as ocorrências do seletor abaixo do escopo, na ordem do documento."""
+        xpath = self._xpaths.get(selector)
+        if xpath is None:
+            xpath = self._xpaths[selector] = etree.XPath(selector.xpath)
+        return xpath(scope)
+
+    @classmethod
+    def _strings(cls, element: etree._Element) -> Iterator[str]:
+        """Percorre os textos do elemento como o `get_text` do BeautifulSoup."""
+        if not isinstance(element.tag, str) or element.tag in NON_TEXT_TAGS:
+            return
+        if element.text:
+            yield element.text
+        for child in element:
+            yield from cls._strings(child)
+            if child.tail:
+                yield child.tail
+
+    def _value(
+        self, element: etree._Element, attribute: str | None, separator: str = ""
+    ) -> str | None:
+        """Retorna o atributo pedido (`attr`) ou o texto do elemento."""
+        if attribute is not None:
+            return element.get(attribute)
+        strings = (text.strip() for text in self._strings(element))
+        return separator.join(text for text in strings if text)
+
+    def _scope(self, root: etree._Element, parents: tuple[Selector, ...]) -> etree._Element:
+        """Resolve a cadeia de escopos; sem um elo no documento, mantém o mais interno achado."""
+        scope = root
+        for parent in parents:
+            candidates = self._find_all(scope, parent)
+            if not candidates:
+                break
+            scope = candidates[0]
+        return scope
+
+    def _resolve(self, root: etree._Element, compiled: CompiledField) -> Any:
+        if compiled.parents and compiled.any_parent:
+            outer_scope = self._scope(root, compiled.parents[:-1])
+            for block in self._find_all(outer_scope, compiled.parents[-1]):
+                scoped = self._find_all(block, compiled.selector)
+                value = self._value(scoped[0], compiled.attribute, " ") if scoped else None
+                if value:
+                    return value
+            return None
+
+        elements = self._find_all(self._scope(root, compiled.parents), compiled.selector)
+        if not elements:
+            return None
+        index = compiled.index
+        selected = elements[index] if index is not None and index < len(elements) else elements[0]
+        return self._value(selected, compiled.attribute)
+
+    def execute(
+        self, plan: ExtractionPlan, metrics: "ParserMetrics | None" = None
+    ) -> dict[str, Any]:
+        """Resolve cada campo do plano com as expressões XPath compiladas."""
+        root = self.document
+        if metrics is None:
+            return {compiled.name: self._resolve(root, compiled) for compiled in plan.fields}
+
+        # Sem varredura única, os acertos dos seletores custam uma busca extra cada
+        for selectors in plan.selectors_by_tag.values():
+            for selector in selectors:
+                metrics.record_selector(selector, hit=bool(self._find_all(root, selector)))
+        result: dict[str, Any] = {}
+        for compiled in plan.fields:
+            started = perf_counter()
+            value = result[compiled.name] = self._resolve(root, compiled)
+            metrics.record_field(compiled.name, perf_counter() - started, hit=value is not None)
+        return result
+
+
+PARSER_ENGINES: dict[str, type[ParserEngine]] = {
+    engine.name: engine for engine in (BeautifulSoupEngine, LxmlEngine)
+}
+"""Engines disponíveis, indexados pelo nome usado no `settings.yaml`."""
+
+
+def build_parser_engine(name: str, *, partial_parse: bool = False) -> ParserEngine:
+    """Cria o engine configurado em `goodreads.parser_engine`."""
+    if name == BeautifulSoupEngine.name:
+        return BeautifulSoupEngine(partial_parse=partial_parse)
+    if name in PARSER_ENGINES:
+        return PARSER_ENGINES[name]()
+    msg = f"Engine de parsing desconhecido: '{name}'. Use um de: {sorted(PARSER_ENGINES)}"
+    raise GoodreadsHTMLParserError(msg)
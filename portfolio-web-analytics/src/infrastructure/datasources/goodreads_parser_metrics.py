@@ -0,0 +1,196 @@
+"""Métricas opcionais do GoodreadsParser: tempo por etapa e por campo, acertos dos seletores.
+
+O coletor só existe quando as métricas estão ativas (`goodreads.parser_metrics`); sem ele, o
+parser e os engines seguem o caminho sem instrumentação. As métricas de cada página podem
+ser somadas (`merge`), o que permite agregar um lote parseado em vários processos e exportar
+um único relatório JSON.
+"""
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.datasources.goodreads_extraction_plan import Selector
+
+PARSER_STAGES = ("read", "parse", "structured_data", "extraction")
+"""Etapas medidas: leitura do cache HTML, parsing do DOM, JSON embutido e execução do plano."""
+
+
+@dataclass
+class TimingStats:
+    """Tempo acumulado de uma etapa ou campo."""
+
+    count: int = 0
+    """Medições somadas."""
+
+    seconds: float = 0.0
+    """Tempo total, em segundos."""
+
+    def add(self, seconds: float) -> None:
+        """Soma uma medição."""
+        self.count += 1
+        self.seconds += seconds
+
+    def merge(self, other: "TimingStats") -> None:
+        """Soma as medições de outro coletor."""
+        self.count += other.count
+        self.seconds += other.seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Resumo em milissegundos para o relatório."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.seconds * 1000, 3),
+            "mean_ms": round(self.seconds / self.count * 1000, 4) if self.count else None,
+        }
+
+
+@dataclass
+class HitStats:
+    """Contadores de acertos e faltas de um campo ou seletor."""
+
+    hits: int = 0
+    """Páginas em que o valor (ou elemento) foi encontrado."""
+
+    misses: int = 0
+    """Páginas em que não foi encontrado."""
+
+    def add(self, *, hit: bool) -> None:
+        """Registra uma busca."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def merge(self, other: "HitStats") -> None:
+        """Soma os contadores de outro coletor."""
+        self.hits += other.hits
+        self.misses += other.misses
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Fração das buscas com acerto; None sem buscas."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Resumo para o relatório."""
+        hit_rate = self.hit_rate
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(hit_rate, 4) if hit_rate is not None else None,
+        }
+
+
+@dataclass
+class FieldMetrics:
+    """Métricas de um campo do `parser.yaml`."""
+
+    lookups: HitStats = field(default_factory=HitStats)
+    """Páginas com e sem valor para o campo, somando JSON embutido e DOM."""
+
+    timing: TimingStats = field(default_factory=TimingStats)
+    """Tempo de resolução do campo no DOM (o JSON embutido é medido como etapa)."""
+
+    structured_data: int = 0
+    """Páginas em que o valor veio do JSON embutido, sem consultar o DOM."""
+
+    def merge(self, other: "FieldMetrics") -> None:
+        """Soma as métricas de outro coletor."""
+        self.lookups.merge(other.lookups)
+        self.timing.merge(other.timing)
+        self.structured_data += other.structured_data
+
+    def to_dict(self) -> dict[str, Any]:
+        """Resumo para o relatório."""
+        return {
+            **self.lookups.to_dict(),
+            "structured_data": self.structured_data,
+            "dom": self.timing.to_dict(),
+        }
+
+
+@dataclass
+class ParserMetrics:
+    """Coletor das métricas do parser, agregável entre páginas e processos."""
+
+    pages: int = 0
+    """Páginas extraídas, incluindo as servidas pelo cache de resultados."""
+
+    cache_hits: int = 0
+    """Páginas servidas pelo cache de resultados, sem parsing."""
+
+    stages: dict[str, TimingStats] = field(default_factory=dict)
+    """Tempo por etapa (`PARSER_STAGES`)."""
+
+    fields: dict[str, FieldMetrics] = field(default_factory=dict)
+    """Métricas por campo do `parser.yaml`."""
+
+    selectors: dict[str, HitStats] = field(default_factory=dict)
+    """Páginas em que cada seletor (do campo ou de um `parent`) existe no documento."""
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Registra o tempo de uma etapa da página."""
+        self.stages.setdefault(stage, TimingStats()).add(seconds)
+
+    def _field(self, name: str) -> FieldMetrics:
+        metrics = self.fields.get(name)
+        if metrics is None:
+            metrics = self.fields[name] = FieldMetrics()
+        return metrics
+
+    def record_field(self, name: str, seconds: float, *, hit: bool) -> None:
+        """Registra a resolução de um campo no DOM."""
+        metrics = self._field(name)
+        metrics.lookups.add(hit=hit)
+        metrics.timing.add(seconds)
+
+    def record_structured_field(self, name: str) -> None:
+        """Registra um campo lido do JSON embutido."""
+        metrics = self._field(name)
+        metrics.lookups.add(hit=True)
+        metrics.structured_data += 1
+
+    def record_selector(self, selector: Selector, *, hit: bool) -> None:
+        """Registra se o seletor tem ocorrências no documento, identificado pelo XPath."""
+        self.selectors.setdefault(selector.xpath, HitStats()).add(hit=hit)
+
+    def merge(self, other: "ParserMetrics") -> None:
+        """Soma as métricas de outra página ou processo."""
+        self.pages += other.pages
+        self.cache_hits += other.cache_hits
+        for stage, timing in other.stages.items():
+            self.stages.setdefault(stage, TimingStats()).merge(timing)
+        for name, metrics in other.fields.items():
+            self._field(name).merge(metrics)
+        for xpath, hits in other.selectors.items():
+            self.selectors.setdefault(xpath, HitStats()).merge(hits)
+
+    def failing_fields(self) -> list[str]:
+        """Campos sem valor em alguma página: o primeiro sinal de mudança no HTML."""
+        return [name for name, metrics in self.fields.items() if metrics.lookups.misses]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Relatório completo, pronto para serialização."""
+        return {
+            "pages": self.pages,
+            "cache_hits": self.cache_hits,
+            "stages": {
+                stage: self.stages[stage].to_dict()
+                for stage in PARSER_STAGES
+                if stage in self.stages
+            },
+            "fields": {name: metrics.to_dict() for name, metrics in self.fields.items()},
+            "selectors": {xpath: hits.to_dict() for xpath, hits in sorted(self.selectors.items())},
+            "failing_fields": self.failing_fields(),
+        }
+
+    def export(self, path: Path) -> Path:
+        """Grava o relatório JSON no caminho informado."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+        return path
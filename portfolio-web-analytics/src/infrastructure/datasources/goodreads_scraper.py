@@ -1,22 +1,67 @@
 """Classe para baixar HTML de páginas e salvar localmente."""
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
 import httpx
 
 from src.common.base.base_class import BaseClass
-from src.common.errors.errors import GoodreadsScraperError
+from src.common.errors.errors import GoodreadsScraperError, HtmlCacheError
 from src.config.constants import BRT, HTML_DIR
+from src.infrastructure.cache.html_cache_backend import (
+    HtmlCacheBackend,
+    build_html_cache_backend,
+)
+from src.infrastructure.cache.http_cache_store import HttpCacheStore
+from src.infrastructure.cache.search_index_store import SearchIndexStore
+from src.infrastructure.datasources.crawl_frontier import CrawlFrontier, extract_crawl_links
+from src.infrastructure.datasources.goodreads_search_parser import (
+    GoodreadsSearchParser,
+    GoodreadsSearchResult,
+    canonical_goodreads_url,
+)
 from src.infrastructure.logger import LoggerSingleton
+from src.infrastructure.network.offline_goodreads import (
+    OfflineGoodreadsHandler,
+    build_offline_transport,
+)
+from src.infrastructure.network.rate_limiter import (
+    AsyncRateLimitedTransport,
+    HostRateLimiter,
+    RateLimitedTransport,
+    RequestMetrics,
+    RetryPolicy,
+)
 
 if TYPE_CHECKING:
     from logging import Logger
 
 
+@dataclass
+class BatchDownloadResult:
+    """Resultado de um download em lote de títulos do Goodreads."""
+
+    paths: dict[str, Path] = field(default_factory=dict)
+    """Mapeamento de cada título para o caminho do HTML baixado."""
+
+    failures: dict[str, str] = field(default_factory=dict)
+    """Mapeamento de cada título que falhou para a mensagem de erro."""
+
+    durations: dict[str, float] = field(default_factory=dict)
+    """Tempo (segundos) de cada título, sem a espera pelo limite de concorrência."""
+
+    queue_waits: dict[str, float] = field(default_factory=dict)
+    """Espera (segundos) de cada título por uma vaga no limite de concorrência."""
+
+
 class GoodreadsScraper(BaseClass):
     """Baixa o HTML de uma página e salva em disco."""
 
@@ -53,8 +98,144 @@ class GoodreadsScraper(BaseClass):
         self.fallback_book_url: str = self.goodreads_book_url_base + self.fallback_book_id
         """URL de fallback para o livro: `https://www.goodreads.com/book/show/{book_fallback}`"""
 
-        self.search_results_html_path: Path = self.output_html_directory / "search_results.html"
-        """Caminho do arquivo HTML da busca: `./data/html/search_results.html`"""
+        self.goodreads_search_url_base: str = goodreads_config["search_url_base"]
+        """URL base de pesquisa no Goodreads: `https://www.goodreads.com/search?query=`"""
+
+        self.max_concurrency: int = goodreads_config.get("max_concurrency", 8)
+        """Número máximo de requisições simultâneas no download em lote. Ex.: `8`"""
+
+        self.http_settings: dict[str, Any] = goodreads_config.get("http", {})
+        """Configurações do cliente HTTP (timeouts, pool de conexões e HTTP/2)."""
+
+        self._client: httpx.Client | None = None
+        """Cliente HTTP persistente, criado sob demanda e reutilizado entre as chamadas."""
+
+        rate_limit_settings: dict[str, Any] = goodreads_config.get("rate_limit", {})
+        self.rate_limiter: HostRateLimiter = HostRateLimiter(
+            rate_limit_settings.get("requests_per_second", 0),
+            rate_limit_settings.get("burst", 1),
+        )
+        """Token bucket por host compartilhado pelos clientes síncrono e assíncrono."""
+
+        self.retry_policy: RetryPolicy = RetryPolicy.from_config(goodreads_config.get("retry"))
+        """Política de novas tentativas (backoff exponencial com jitter e `Retry-After`)."""
+
+        self.request_metrics: RequestMetrics = RequestMetrics()
+        """Tempo aguardando o limite/backoff versus tempo de transferência."""
+
+        self.transport_mode: str = goodreads_config.get("transport", "live")
+        """Destino das requisições: `live` (goodreads.com) ou `offline` (páginas salvas)."""
+
+        self._offline_handler: OfflineGoodreadsHandler | None = (
+            OfflineGoodreadsHandler(goodreads_config.get("offline"))
+            if self.transport_mode == "offline"
+            else None
+        )
+        """Substituto offline do Goodreads, usado quando `transport` é `offline`."""
+
+        self.crawl_settings: dict[str, Any] = goodreads_config.get("crawl", {})
+        """Configurações do crawler (limite de páginas, profundidade e links seguidos)."""
+
+        self.search_index: SearchIndexStore = SearchIndexStore(
+            goodreads_config.get("search_cache_seconds", 604800)
+        )
+        """Índice persistente `busca → URL do livro`, que evita repetir buscas conhecidas."""
+
+        self.search_parser: GoodreadsSearchParser = GoodreadsSearchParser()
+        """Parser de todas as linhas da página de resultados de busca."""
+
+        self.cache_store: HttpCacheStore = HttpCacheStore()
+        """Metadados HTTP (ETag, Last-Modified) usados na revalidação do cache."""
+
+        self.cache_backend: HtmlCacheBackend = build_html_cache_backend(
+            goodreads_config.get("cache"), self.output_html_directory
+        )
+        """Backend de armazenamento das páginas (texto puro ou gzip com limite LRU)."""
+
+    def __enter__(self) -> Self:
+        """Permite o uso da classe como gerenciador de contexto."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Fecha o cliente HTTP ao sair do gerenciador de contexto."""
+        self.close()
+
+    def _client_options(self) -> dict[str, Any]:
+        """Monta as opções comuns aos clientes HTTP síncrono e assíncrono."""
+        timeout_seconds = self.http_settings.get("timeout_seconds", 20.0)
+        return {
+            "timeout": httpx.Timeout(
+                timeout_seconds,
+                connect=self.http_settings.get("connect_timeout_seconds", timeout_seconds),
+            ),
+            "follow_redirects": True,
+        }
+
+    def _transport_options(self) -> dict[str, Any]:
+        """Monta as opções do pool de conexões, repassadas ao transport HTTP."""
+        http2 = bool(self.http_settings.get("http2", False))
+        if http2 and find_spec("h2") is None:
+            self.logger.warning("Pacote 'h2' não instalado. Utilizando HTTP/1.1.")
+            http2 = False
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.http_settings.get("max_connections", 20),
+                max_keepalive_connections=self.http_settings.get("max_keepalive_connections", 10),
+                keepalive_expiry=self.http_settings.get("keepalive_expiry_seconds", 30.0),
+            ),
+            "http2": http2,
+        }
+
+    def _build_transport(self) -> httpx.BaseTransport:
+        """Cria o transport síncrono com limite por host e novas tentativas."""
+        inner_transport = (
+            build_offline_transport(self._offline_handler)
+            if self._offline_handler
+            else httpx.HTTPTransport(**self._transport_options())
+        )
+        return RateLimitedTransport(
+            inner_transport,
+            self.rate_limiter,
+            self.retry_policy,
+            self.request_metrics,
+        )
+
+    def _build_async_transport(self) -> httpx.AsyncBaseTransport:
+        """Cria o transport assíncrono com limite por host e novas tentativas."""
+        inner_transport = (
+            build_offline_transport(self._offline_handler, asynchronous=True)
+            if self._offline_handler
+            else httpx.AsyncHTTPTransport(**self._transport_options())
+        )
+        return AsyncRateLimitedTransport(
+            inner_transport,
+            self.rate_limiter,
+            self.retry_policy,
+            self.request_metrics,
+        )
+
+    @property
+    def client(self) -> httpx.Client:
+        """Retorna o cliente HTTP persistente, criando-o na primeira utilização."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(transport=self._build_transport(), **self._client_options())
+            self.logger.info("Cliente HTTP persistente inicializado.")
+        return self._client
+
+    def close(self) -> None:
+        """Fecha o cliente HTTP persistente e grava os índices pendentes (cache e buscas)."""
+        self.cache_store.close()
+        self.search_index.close()
+        if self._client is not None and not self._client.is_closed:
+            self._client.close()
+            self.logger.info("Cliente HTTP persistente encerrado.")
+        self._client = None
 
     def _log_and_raise_exception(
         self, error_message: str, exception_class: type[Exception]
@@ -67,32 +248,23 @@ class GoodreadsScraper(BaseClass):
         """Método auxiliar para tratamento de exceções comuns."""
         self._log_and_raise_exception(error_message, GoodreadsScraperError)
 
-    def _save_html(self, output_path: Path, html: str) -> None:
-        """Salve o conteúdo HTML no caminho especificado."""
-        try:
-            output_path.write_text(html, encoding="utf-8")
-            self.logger.info(f"HTML da busca salvo com sucesso em: '{output_path}'")
-        except OSError:
-            self._log_and_raise_exception(f"Erro ao salvar o HTML em '{output_path}'", OSError)
-
-    def _get_search_results_response(self) -> httpx.Response:
+    def _get_search_results_response(self, search_url: str) -> httpx.Response:
         """Executa o GET na URL de pesquisa e valida as mensagens de retorno possíveis."""
         try:
-            self.logger.info(f"Acessando URL de pesquisa: '{self.goodreads_search_url}'")
-            with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-                response = client.get(self.goodreads_search_url)
-                response.raise_for_status()
+            self.logger.info(f"Acessando URL de pesquisa: '{search_url}'")
+            response = self.client.get(search_url)
+            response.raise_for_status()
         except httpx.HTTPStatusError:
             self._log_and_raise_exception(
                 (
-                    f"Erro HTTP ao acessar a URL de pesquisa: {self.goodreads_search_url} "
+                    f"Erro HTTP ao acessar a URL de pesquisa: {search_url} "
                     f"— código de status HTTP inválido"
                 ),
                 httpx.HTTPStatusError,
             )
         except httpx.RequestError:
             self._log_and_raise_exception(
-                (f"Erro de requisição ao acessar a URL de pesquisa: {self.goodreads_search_url}"),
+                (f"Erro de requisição ao acessar a URL de pesquisa: {search_url}"),
                 httpx.RequestError,
             )
         else:
@@ -102,34 +274,21 @@ class GoodreadsScraper(BaseClass):
                 raise GoodreadsScraperError(msg)
             return response
 
-    def _download_search_results_html(self) -> Path:
-        """Baixe o HTML da página de resultados de busca e salve localmente."""
+    def _extract_first_book_link(self, title: str | None = None) -> str | None:
+        """Resolve o link do livro pelo índice de buscas ou pela página de resultados em memória."""
+        title = title or self.search_book_title
         try:
-            response = self._get_search_results_response()
-            html = response.text
-            self._save_html(self.search_results_html_path, html)
-        except GoodreadsScraperError:
-            self.logger.exception(super()._raise_error())
-            raise
-        else:
-            self.logger.info("Busca no Goodreads realizada e HTML salvo com sucesso.")
-            return self.search_results_html_path
-
-    def _extract_first_book_link(self) -> str | None:
-        """Extrai e limpa o link do primeiro livro dos resultados de busca."""
-        try:
-            html_path = self._download_search_results_html()
-            soup = BeautifulSoup(html_path.read_text(encoding="utf-8"), "lxml")
-
-            first_row = self._find_first_book_row(soup)
-            if not first_row:
-                return None
-
-            first_link = self._find_first_link(first_row)
-            if not first_link:
+            indexed_link = self.search_index.get(title)
+            if indexed_link:
+                self.logger.info(f"Busca encontrada no índice: '{title}' → '{indexed_link}'")
+                return indexed_link
+
+            response = self._get_search_results_response(self.goodreads_search_url_base + title)
+            clean_link = self._parse_book_link(response.text, title)
+            if not clean_link:
                 return None
 
-            clean_link = self._clean_link(first_link)
+            self.search_index.put(title, clean_link)
         except GoodreadsScraperError:
             self.logger.exception(super()._raise_error())
             raise
@@ -137,42 +296,52 @@ class GoodreadsScraper(BaseClass):
             self.logger.info(f"Link do primeiro livro extraído: '{clean_link}'")
             return clean_link
 
-    def _find_first_book_row(self, soup: BeautifulSoup) -> Tag | None:
-        """Encontra a primeira linha de livro nos resultados de busca."""
-        first_row = soup.find("tr", {"itemscope": "", "itemtype": "http://schema.org/Book"})
-        if not isinstance(first_row, Tag):
-            self.logger.warning("Nenhum item encontrado na árvore especificada.")
+    def _parse_book_link(self, html: str, title: str | None = None) -> str | None:
+        """Extrai o link do resultado mais similar ao título a partir do HTML de busca."""
+        best = self.search_parser.best_match(html, title or self.search_book_title)
+        if best is None:
             return None
-        return first_row
-
-    def _find_first_link(self, first_row: Tag) -> str | None:
-        """Encontra o link do primeiro livro na linha especificada."""
-        first_link = first_row.find("a", {"title": True})
-        if not (isinstance(first_link, Tag) and first_link.has_attr("href")):
-            self.logger.warning("Nenhum link válido encontrado no primeiro item.")
-            return None
-        return first_link.get("href")
+        self.logger.info(
+            f"Melhor resultado para '{title or self.search_book_title}': '{best.title}' "
+            f"(similaridade: {best.similarity})"
+        )
+        return best.book_url
 
     def _clean_link(self, href: str) -> str:
         """Limpa o link extraído, removendo parâmetros desnecessários."""
-        raw_link = f"https://www.goodreads.com{href}"
-        return raw_link.split("?", maxsplit=1)[0]
+        return canonical_goodreads_url(href)
+
+    def search_books(self, title: str) -> list[GoodreadsSearchResult]:
+        """Pesquisa o título e retorna todas as linhas da busca, ordenadas por similaridade."""
+        response = self._get_search_results_response(self.goodreads_search_url_base + title)
+        results = self.search_parser.rank_results(self.search_parser.parse(response.text), title)
+        if results:
+            self.search_index.put(title, results[0].book_url)
+            self.search_index.flush()
+        self.logger.info(f"{len(results)} resultado(s) extraído(s) da busca por '{title}'.")
+        return results
 
     def _get_filename_from_url(self, book_link: str) -> str:
         """Extrai o nome do arquivo a partir da URL do Goodreads."""
         if book_link.startswith(self.goodreads_book_url_base):
             return book_link[len(self.goodreads_book_url_base) :].rstrip("/") + ".html"
-        return book_link.rstrip("/").split("/", maxsplit=1)[-1] + ".html"
+        # Demais páginas (ex.: autores) usam o caminho da URL: `author-show-685523.Inio_Asano`
+        path = book_link.split("://", maxsplit=1)[-1].split("/", maxsplit=1)[-1]
+        return path.strip("/").replace("/", "-") + ".html"
 
-    def _is_file_cache_valid(self, file_path: Path) -> bool:
+    def _is_file_cache_valid(self, file_path: Path, url: str | None = None) -> bool:
         """Verifica se o arquivo existe e ainda está dentro do período de cache válido."""
         if not file_path.exists():
             self.logger.warning(f"Arquivo não encontrado: '{file_path}'")
             return False
 
-        last_modified_time = datetime.fromtimestamp(file_path.stat().st_mtime, tz=BRT)
-        current_time = datetime.now(tz=BRT)
-        is_valid = (current_time - last_modified_time).total_seconds() < self.cache_duration_seconds
+        # Prioriza o horário do último download/revalidação registrado nos metadados
+        is_valid = self.cache_store.is_fresh(url, self.cache_duration_seconds) if url else None
+        if is_valid is None:
+            last_modified_time = datetime.fromtimestamp(file_path.stat().st_mtime, tz=BRT)
+            current_time = datetime.now(tz=BRT)
+            elapsed_seconds = (current_time - last_modified_time).total_seconds()
+            is_valid = elapsed_seconds < self.cache_duration_seconds
 
         if is_valid:
             self.logger.info(f"Cache válido encontrado: '{file_path}'")
@@ -181,31 +350,97 @@ class GoodreadsScraper(BaseClass):
 
         return is_valid
 
+    def _expected_length(self, response: httpx.Response) -> int | None:
+        """Retorna o `Content-Length` do corpo decodificado, quando puder ser conferido."""
+        content_length = response.headers.get("Content-Length")
+        # Com `Content-Encoding`, o tamanho informado é o do corpo comprimido em trânsito
+        if content_length is None or response.headers.get("Content-Encoding"):
+            return None
+        return int(content_length)
+
+    def _revalidate_cache(
+        self, book_link: str, output_path: Path, response: httpx.Response
+    ) -> Path:
+        """Renova o TTL do cache quando o servidor responde `304 Not Modified`."""
+        self.cache_store.record_revalidation(book_link, response)
+        self.cache_backend.mark_used(output_path)
+        self.logger.info(f"Conteúdo não modificado, cache revalidado: '{output_path}'")
+        return output_path
+
+    def _store_book_response(
+        self, book_link: str, output_path: Path, response: httpx.Response
+    ) -> Path:
+        """Grava o HTML em blocos (escrita atômica) ou renova o TTL em caso de `304`."""
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return self._revalidate_cache(book_link, output_path, response)
+
+        response.raise_for_status()
+        content_hash = self.cache_backend.write_stream(
+            output_path, response.iter_bytes(), self._expected_length(response)
+        )
+        self.cache_store.record_download(book_link, output_path, response, content_hash)
+        self.logger.info(f"HTML salvo em: '{output_path}'")
+        return output_path
+
+    async def _store_book_response_async(
+        self, book_link: str, output_path: Path, response: httpx.Response
+    ) -> Path:
+        """Versão assíncrona de `_store_book_response`, consumindo o corpo em blocos."""
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return await asyncio.to_thread(self._revalidate_cache, book_link, output_path, response)
+
+        response.raise_for_status()
+        # A escrita e a compressão rodam em threads, sem travar os demais downloads
+        async with self.cache_backend.async_atomic_writer(
+            output_path, self._expected_length(response)
+        ) as writer:
+            async for chunk in response.aiter_bytes():
+                await writer.write(chunk)
+        self.cache_store.record_download(book_link, output_path, response, writer.sha256)
+        self.logger.info(f"HTML salvo em: '{output_path}'")
+        return output_path
+
     def _download_or_use_cache(self, book_link: str) -> Path:
-        """Baixa o HTML ou utiliza o cache válido."""
+        """Baixa o HTML, revalida o cache expirado ou utiliza o cache válido."""
         try:
             filename = self._get_filename_from_url(book_link)
-            output_path = self.output_html_directory / filename
+            output_path = self.cache_backend.path_for(filename)
 
-            if self._is_file_cache_valid(output_path):
+            if self._is_file_cache_valid(output_path, book_link):
+                self.cache_store.record_hit()
+                self.cache_backend.mark_used(output_path)
                 self.logger.info(f"Usando cache válido: '{output_path}'")
                 return output_path
 
-            # Realiza o download caso o cache não seja válido
+            # Realiza o download (ou a revalidação condicional) caso o cache não seja válido
             self.logger.info(f"Cache inválido ou inexistente. Baixando: '{book_link}'")
-            with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-                response = client.get(book_link)
-                response.raise_for_status()
-                html = response.text
+            headers = self.cache_store.conditional_headers(book_link)
+            with self.client.stream("GET", book_link, headers=headers) as response:
+                self._store_book_response(book_link, output_path, response)
 
-            output_path.write_text(html, encoding="utf-8")
-            self.logger.info(f"HTML salvo em: '{output_path}'")
-
-        except (httpx.HTTPStatusError, OSError):
+        except (httpx.HTTPStatusError, HtmlCacheError, OSError):
             self._handle_exceptions(f"Erro ao processar o link: '{book_link}'.")
         else:
             return output_path
 
+    def _log_cache_stats(self) -> None:
+        """Grava os índices e registra os contadores do cache e as métricas de tráfego HTTP."""
+        # Uma única gravação de cada índice por operação (download, lote ou crawl)
+        self.cache_store.flush()
+        self.search_index.flush()
+        stats = self.cache_store.stats
+        self.logger.info(
+            f"Cache HTML: {stats.hits} acerto(s), {stats.revalidations} revalidação(ões), "
+            f"{stats.downloads} download(s) completo(s)."
+        )
+        metrics = self.request_metrics.as_dict()
+        self.logger.info(
+            f"HTTP: {metrics['requests']} requisição(ões), {metrics['retries']} nova(s) "
+            f"tentativa(s), {metrics['throttled_seconds']:.2f}s aguardando limite, "
+            f"{metrics['backoff_seconds']:.2f}s em backoff, "
+            f"{metrics['transfer_seconds']:.2f}s transferindo."
+        )
+
     def execute_download(self) -> Path:
         """Executa o processo de download de HTML e registra as atividades."""
         try:
@@ -217,5 +452,171 @@ class GoodreadsScraper(BaseClass):
             self.logger.exception("Erro durante o download.")
             raise
         else:
+            self._log_cache_stats()
             self.logger.info("Processo de download concluído.")
             return html_path
+
+    @asynccontextmanager
+    async def _concurrency_slot(
+        self, semaphore: asyncio.Semaphore, queue_waits: dict[str, float], title: str
+    ) -> AsyncIterator[None]:
+        """Ocupa uma vaga do limite de concorrência, somando a espera do título em `queue_waits`."""
+        started = time.perf_counter()
+        async with semaphore:
+            queue_waits[title] = queue_waits.get(title, 0.0) + time.perf_counter() - started
+            yield
+
+    async def _download_title_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        title: str,
+        queue_waits: dict[str, float],
+    ) -> Path:
+        """Pesquisa um título e baixa o HTML do livro, respeitando o limite de concorrência."""
+        slot = self._concurrency_slot
+        book_link = self.search_index.get(title)
+        if not book_link:
+            search_url = self.goodreads_search_url_base + title
+            async with slot(semaphore, queue_waits, title):
+                self.logger.info(f"Acessando URL de pesquisa: '{search_url}'")
+                response = await client.get(search_url)
+                response.raise_for_status()
+
+            book_link = self._parse_book_link(response.text, title)
+            if not book_link:
+                msg = f"Nenhum livro encontrado para o título: '{title}'"
+                raise GoodreadsScraperError(msg)
+            self.search_index.put(title, book_link)
+
+        output_path = self.cache_backend.path_for(self._get_filename_from_url(book_link))
+        if self._is_file_cache_valid(output_path, book_link):
+            self.cache_store.record_hit()
+            self.cache_backend.mark_used(output_path)
+            self.logger.info(f"Usando cache válido: '{output_path}'")
+            return output_path
+
+        async with slot(semaphore, queue_waits, title):
+            self.logger.info(f"Cache inválido ou inexistente. Baixando: '{book_link}'")
+            headers = self.cache_store.conditional_headers(book_link)
+            async with client.stream("GET", book_link, headers=headers) as response:
+                return await self._store_book_response_async(book_link, output_path, response)
+
+    async def _download_many_async(self, titles: list[str]) -> BatchDownloadResult:
+        """Baixa os títulos em paralelo com um `httpx.AsyncClient` compartilhado."""
+        result = BatchDownloadResult()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def timed_download(client: httpx.AsyncClient, title: str) -> Path:
+            started = time.perf_counter()
+            try:
+                return await self._download_title_async(
+                    client, semaphore, title, result.queue_waits
+                )
+            finally:
+                # A latência do título não conta a espera na fila do limite de concorrência
+                elapsed = time.perf_counter() - started
+                result.durations[title] = elapsed - result.queue_waits.get(title, 0.0)
+
+        async with httpx.AsyncClient(
+            transport=self._build_async_transport(), **self._client_options()
+        ) as client:
+            outcomes = await asyncio.gather(
+                *(timed_download(client, title) for title in titles),
+                return_exceptions=True,
+            )
+
+        for title, outcome in zip(titles, outcomes, strict=True):
+            if isinstance(outcome, Path):
+                result.paths[title] = outcome
+            elif isinstance(
+                outcome, (httpx.HTTPError, GoodreadsScraperError, HtmlCacheError, OSError)
+            ):
+                self.logger.warning(f"Falha ao baixar o título '{title}': {outcome}")
+                result.failures[title] = str(outcome) or outcome.__class__.__name__
+            else:
+                raise outcome
+        return result
+
+    def execute_download_many(self, titles: Iterable[str]) -> BatchDownloadResult:
+        """Executa o download em lote dos títulos e retorna os caminhos e falhas por título."""
+        unique_titles = list(dict.fromkeys(titles))
+        self.logger.info(
+            f"Iniciando download em lote de {len(unique_titles)} títulos "
+            f"(concorrência máxima: {self.max_concurrency})."
+        )
+        result = asyncio.run(self._download_many_async(unique_titles))
+        self.logger.info(
+            f"Download em lote concluído: {len(result.paths)} sucesso(s), "
+            f"{len(result.failures)} falha(s)."
+        )
+        self._log_cache_stats()
+        return result
+
+    def _crawl_priority(self, kind: str, depth: int) -> int:
+        """Calcula a prioridade na fronteira: busca em largura, livros antes de autores."""
+        return depth * 2 + (1 if kind == "author" else 0)
+
+    def crawl(
+        self,
+        seed_urls: Iterable[str] | None = None,
+        max_pages: int | None = None,
+        frontier: CrawlFrontier | None = None,
+    ) -> dict[str, int]:
+        """Percorre livros e autores a partir das URLs iniciais, retomando crawls interrompidos.
+
+        As URLs ficam numa fronteira SQLite persistente e deduplicada; páginas já processadas
+        não são baixadas novamente. Sem URLs iniciais, usa o livro de `search_book_title`.
+        """
+        max_pages = max_pages or self.crawl_settings.get("max_pages", 100)
+        max_depth: int = self.crawl_settings.get("max_depth", 2)
+        follow_kinds = {
+            kind
+            for kind, enabled in (
+                ("book", self.crawl_settings.get("follow_books", True)),
+                ("author", self.crawl_settings.get("follow_authors", True)),
+            )
+            if enabled
+        }
+        # A fronteira criada aqui é fechada ao final; a recebida fica a cargo de quem a passou
+        frontier_context = (
+            nullcontext(frontier)
+            if frontier is not None
+            else CrawlFrontier(max_attempts=self.crawl_settings.get("max_attempts", 3))
+        )
+        with frontier_context as active_frontier:
+            if seed_urls is None:
+                seed_urls = [self._extract_first_book_link() or self.fallback_book_url]
+            for url in seed_urls:
+                kind = "author" if "/author/show/" in url else "book"
+                active_frontier.add(url, kind, self._crawl_priority(kind, 0), depth=0)
+
+            processed = 0
+            while processed < max_pages and (item := active_frontier.pop_next()) is not None:
+                try:
+                    html_path = self._download_or_use_cache(item.url)
+                    html = self.cache_backend.read_text(html_path)
+                except (GoodreadsScraperError, httpx.HTTPError, OSError) as error:
+                    self.logger.warning(f"Falha ao processar '{item.url}' no crawler: {error}")
+                    active_frontier.mark_failed(item.url, str(error) or error.__class__.__name__)
+                    continue
+
+                if item.depth < max_depth:
+                    depth = item.depth + 1
+                    # A página é varrida uma única vez; os links são agrupados por tipo
+                    links_by_kind: dict[str, list[tuple[str, str]]] = {}
+                    for link in extract_crawl_links(html):
+                        if link[1] in follow_kinds:
+                            links_by_kind.setdefault(link[1], []).append(link)
+                    for kind, links in links_by_kind.items():
+                        active_frontier.add_many(links, self._crawl_priority(kind, depth), depth)
+
+                active_frontier.mark_done(item.url, html_path)
+                processed += 1
+
+            stats = active_frontier.stats()
+            self.logger.info(
+                f"Crawler: {processed} página(s) processada(s) nesta execução. {stats}"
+            )
+            self._log_cache_stats()
+            return stats
@@ -0,0 +1,141 @@
+"""Parsing das páginas de resultados de busca do Goodreads em registros leves."""
+
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+import re
+from typing import TYPE_CHECKING
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+GOODREADS_BASE_URL: str = "https://www.goodreads.com"
+"""URL base do Goodreads: `https://www.goodreads.com`"""
+
+MINIRATING_PATTERN: re.Pattern[str] = re.compile(
+    r"(?P<rating>\d+(?:\.\d+)?)\s+avg rating\s+\W+\s+(?P<count>[\d,]+)\s+rating"
+)
+"""Captura a nota média e o número de avaliações: `4.27 avg rating — 20,395 ratings`"""
+
+BOOK_ROW_STRAINER: SoupStrainer = SoupStrainer("tr", {"itemtype": "http://schema.org/Book"})
+"""Restringe o parsing às linhas de livro, ignorando o restante da página de busca."""
+
+
+def canonical_goodreads_url(href: str) -> str:
+    """Converte um link (relativo ou absoluto) na URL canônica, sem parâmetros de busca."""
+    raw_link = href if href.startswith("http") else f"{GOODREADS_BASE_URL}{href}"
+    return raw_link.split("?", maxsplit=1)[0]
+
+
+@dataclass
+class GoodreadsSearchResult:
+    """Linha da página de resultados de busca (`schema.org/Book`)."""
+
+    rank: int
+    """Posição original do resultado na página (a partir de 1)."""
+
+    title: str
+    """Título do livro. Ex.: `Goodnight Punpun Omnibus, Vol. 1`"""
+
+    book_url: str
+    """URL canônica do livro. Ex.: `https://www.goodreads.com/book/show/25986929-...`"""
+
+    author: str | None = None
+    """Autor(es) separados por vírgula. Ex.: `Inio Asano`"""
+
+    average_rating: float | None = None
+    """Nota média. Ex.: `4.27`"""
+
+    ratings_count: int | None = None
+    """Número de avaliações. Ex.: `20395`"""
+
+    similarity: float = 0.0
+    """Similaridade (0 a 1) entre o título e a busca, preenchida por `rank_results`."""
+
+
+class GoodreadsSearchParser(BaseClass):
+    """Extrai todas as linhas de resultados de busca e as ordena pela similaridade com a busca."""
+
+    def __init__(self) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+    def parse(self, html: str) -> list[GoodreadsSearchResult]:
+        """Extrai todas as linhas de livro da página de resultados de busca."""
+        soup = BeautifulSoup(html, "lxml", parse_only=BOOK_ROW_STRAINER)
+        rows = soup.find_all("tr", {"itemscope": "", "itemtype": "http://schema.org/Book"})
+
+        results: list[GoodreadsSearchResult] = []
+        for rank, row in enumerate(rows, start=1):
+            result = self._parse_row(row, rank)
+            if result is not None:
+                results.append(result)
+
+        if not results:
+            self.logger.warning("Nenhum item encontrado na árvore especificada.")
+        return results
+
+    def _parse_row(self, row: Tag, rank: int) -> GoodreadsSearchResult | None:
+        """Converte uma linha `schema.org/Book` em um registro."""
+        link = row.find("a", class_="bookTitle") or row.find("a", {"title": True})
+        if not (isinstance(link, Tag) and link.has_attr("href")):
+            self.logger.warning(f"Nenhum link válido encontrado no item {rank}.")
+            return None
+
+        authors = [author.get_text(strip=True) for author in row.find_all("a", class_="authorName")]
+        result = GoodreadsSearchResult(
+            rank=rank,
+            title=link.get_text(" ", strip=True) or str(link.get("title", "")),
+            book_url=canonical_goodreads_url(link["href"]),
+            author=", ".join(authors) or None,
+        )
+
+        minirating = row.find("span", class_="minirating")
+        match = (
+            MINIRATING_PATTERN.search(minirating.get_text(" ", strip=True)) if minirating else None
+        )
+        if match:
+            result.average_rating = float(match["rating"])
+            result.ratings_count = int(match["count"].replace(",", ""))
+        return result
+
+    @staticmethod
+    def title_similarity(query: str, title: str) -> float:
+        """Calcula a similaridade entre a busca e o título, aceitando correspondências parciais.
+
+        Usa o maior valor entre a razão do `SequenceMatcher` para o título inteiro e para a
+        melhor janela do título com o tamanho da busca, de modo que `PunPun` corresponda
+        integralmente a `Goodnight Punpun Omnibus, Vol. 1`.
+        """
+        query = " ".join(query.casefold().split())
+        title = " ".join(title.casefold().split())
+        if not query or not title:
+            return 0.0
+
+        best = SequenceMatcher(None, query, title).ratio()
+        window = len(query)
+        for start in range(max(len(title) - window, 0) + 1):
+            if best == 1.0:
+                break
+            ratio = SequenceMatcher(None, query, title[start : start + window]).ratio()
+            best = max(best, ratio)
+        return round(best, 4)
+
+    def rank_results(
+        self, results: list[GoodreadsSearchResult], query: str
+    ) -> list[GoodreadsSearchResult]:
+        """Ordena os resultados pela similaridade com a busca (empates mantêm a ordem original)."""
+        for result in results:
+            result.similarity = self.title_similarity(query, result.title)
+        return sorted(results, key=lambda result: (-result.similarity, result.rank))
+
+    def best_match(self, html: str, query: str) -> GoodreadsSearchResult | None:
+        """Retorna o resultado mais similar à busca, sem baixar páginas adicionais."""
+        ranked = self.rank_results(self.parse(html), query)
+        return ranked[0] if ranked else None
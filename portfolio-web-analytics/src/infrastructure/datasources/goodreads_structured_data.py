@@ -0,0 +1,181 @@
+"""Extração rápida dos dados estruturados embutidos na página de livro do Goodreads.
+
+A página traz um bloco `application/ld+json` (schema.org `Book`) e o payload `__NEXT_DATA__`
+com o estado Apollo da aplicação. Os blocos são localizados por expressão regular, sem
+construir o DOM, e os valores são formatados como o texto que o `parser.yaml` extrairia
+da página (ex.: `20,395ratings`), para que o resultado seja intercambiável com o do DOM.
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import json
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+LD_JSON_PATTERN = re.compile(
+    r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL
+)
+"""Bloco JSON-LD (schema.org) da página."""
+
+NEXT_DATA_PATTERN = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+"""Payload `__NEXT_DATA__` do Next.js com o estado Apollo."""
+
+
+def _html_to_text(fragment: str | None, separator: str = "") -> str | None:
+    """Converte um trecho HTML do JSON no texto que o DOM exibiria."""
+    if not fragment:
+        return None
+    return BeautifulSoup(fragment, "lxml").get_text(separator=separator, strip=True) or None
+
+
+def _as_float(value: Any) -> float | None:
+    """Converte números ou textos numéricos do JSON (ex.: `"4.23"`, `"20,395"`) em `float`."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        value = value.replace(",", "").strip()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value: Any) -> int | None:
+    """Converte contagens do JSON em `int`; valores não numéricos resultam em None."""
+    number = _as_float(value)
+    return int(number) if number is not None and number.is_integer() else None
+
+
+def _format_date(timestamp_ms: int | None) -> str | None:
+    """Formata um timestamp em milissegundos como na página (ex.: `January 1, 2006`)."""
+    if timestamp_ms is None:
+        return None
+    # Os timestamps são meia-noite no horário do Pacífico (07h/08h UTC do mesmo dia)
+    date = datetime.fromtimestamp(timestamp_ms / 1000, tz=UTC)
+    return f"{date:%B} {date.day}, {date.year}"
+
+
+@dataclass
+class GoodreadsStructuredData:
+    """Dados estruturados (JSON-LD e estado Apollo) de uma página de livro do Goodreads."""
+
+    linked_data: dict[str, Any] = field(default_factory=dict)
+    """Objeto `Book` do JSON-LD."""
+
+    apollo_state: dict[str, Any] = field(default_factory=dict)
+    """Estado Apollo do `__NEXT_DATA__`, indexado por referência (ex.: `Book:kca://...`)."""
+
+    @classmethod
+    def from_html(cls, html: str) -> "GoodreadsStructuredData":
+        """Localiza e decodifica os blocos JSON do HTML, ignorando blocos ausentes ou inválidos."""
+        linked_data: dict[str, Any] = {}
+        apollo_state: dict[str, Any] = {}
+
+        for match in LD_JSON_PATTERN.finditer(html):
+            try:
+                candidate = json.loads(match.group(1))
+            except json.JSONDecodeError:
+                continue
+            if isinstance(candidate, dict) and candidate.get("@type") == "Book":
+                linked_data = candidate
+                break
+
+        match = NEXT_DATA_PATTERN.search(html)
+        if match:
+            try:
+                next_data = json.loads(match.group(1))
+                apollo_state = next_data["props"]["pageProps"]["apolloState"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                apollo_state = {}
+
+        return cls(linked_data, apollo_state if isinstance(apollo_state, dict) else {})
+
+    def _deref(self, value: Any) -> dict[str, Any]:
+        """Resolve uma referência Apollo (`{"__ref": ...}`) para o objeto correspondente."""
+        if isinstance(value, dict) and "__ref" in value:
+            value = self.apollo_state.get(value["__ref"])
+        return value if isinstance(value, dict) else {}
+
+    @property
+    def book(self) -> dict[str, Any]:
+        """Objeto `Book` consultado pela página (`getBookByLegacyId`)."""
+        root = self.apollo_state.get("ROOT_QUERY", {})
+        for key, value in root.items():
+            if key.startswith("getBookByLegacyId"):
+                return self._deref(value)
+        return {}
+
+    @property
+    def work(self) -> dict[str, Any]:
+        """Objeto `Work` do livro, com estatísticas e primeira publicação."""
+        return self._deref(self.book.get("work"))
+
+    @property
+    def author(self) -> dict[str, Any]:
+        """Contribuidor principal do livro."""
+        edge = self.book.get("primaryContributorEdge") or {}
+        return self._deref(edge.get("node"))
+
+    def _author(self, linked_key: str, apollo_key: str) -> str | None:
+        # No JSON-LD, `author` pode ser uma lista, um único objeto ou apenas o nome
+        authors = self.linked_data.get("author")
+        first = authors[0] if isinstance(authors, list) and authors else authors
+        if isinstance(first, str):
+            first = {"name": first}
+        if isinstance(first, dict) and isinstance(first.get(linked_key), str):
+            return first[linked_key]
+        value = self.author.get(apollo_key)
+        return value if isinstance(value, str) else None
+
+    def _pages_format(self) -> str | None:
+        details = self.book.get("details") or {}
+        pages = self.linked_data.get("numberOfPages") or details.get("numPages")
+        book_format = self.linked_data.get("bookFormat") or details.get("format")
+        if pages is None or book_format is None:
+            return None
+        return f"{pages} pages, {book_format}"
+
+    def _publication(self) -> str | None:
+        first_published = _format_date((self.work.get("details") or {}).get("publicationTime"))
+        if first_published:
+            return f"First published {first_published}"
+        published = _format_date((self.book.get("details") or {}).get("publicationTime"))
+        return f"Published {published}" if published else None
+
+    def _stat(self, linked_key: str, work_key: str) -> float | None:
+        rating = self.linked_data.get("aggregateRating") or {}
+        stats = self.work.get("stats") or {}
+        value = _as_float(rating.get(linked_key)) if isinstance(rating, dict) else None
+        return value if value is not None else _as_float(stats.get(work_key))
+
+    def _author_stats(self) -> str | None:
+        books = _as_int((self.author.get("works") or {}).get("totalCount"))
+        followers = _as_int((self.author.get("followers") or {}).get("totalCount"))
+        if books is None or followers is None:
+            return None
+        return f"{books:,}books{followers:,}followers"
+
+    def fields(self) -> dict[str, Any]:
+        """Retorna os campos do `parser.yaml` disponíveis nos dados estruturados."""
+        # O JSON-LD traz números também como texto (ex.: `"4.23"`); valores inválidos ficam
+        # de fora e o campo é lido do DOM
+        rating = self._stat("ratingValue", "averageRating")
+        ratings_count = _as_int(self._stat("ratingCount", "ratingsCount"))
+        reviews = _as_int(self._stat("reviewCount", "textReviewsCount"))
+
+        values = {
+            "title": self.linked_data.get("name") or self.book.get("title"),
+            "autor": self._author("name", "name"),
+            "paperback": self._pages_format(),
+            "publication": self._publication(),
+            "ratings_count": f"{ratings_count:,}ratings" if ratings_count is not None else None,
+            "reviews": f"{reviews:,}reviews" if reviews is not None else None,
+            "autor_url": self._author("url", "webUrl"),
+            "rating": f"{rating:.2f}" if rating is not None else None,
+            "autor_stats": self._author_stats(),
+            "author_bio": _html_to_text(self.author.get("description"), separator=" "),
+            "description": _html_to_text(self.book.get("description")),
+        }
+        return {name: value for name, value in values.items() if value is not None}
@@ -0,0 +1,291 @@
+"""Catálogo DuckDB persistente dos datasets do Kaggle, com a tabela `manga` indexada por título.
+
+O banco fica em `data/datasets` e é criado a partir do Parquet tipado (`DatasetColumnarCache`).
+A tabela `manga` guarda o título em minúsculas (`title_lower`) com um índice ART, usado pelo
+DuckDB apenas em igualdades (`lookup`); o filtro por substring (`filter_title`) percorre a
+tabela. Quando a extensão `fts` do DuckDB está disponível, há também um índice de texto
+completo (BM25) sobre `Title`. A conexão é aberta uma única vez e reaproveitada.
+"""
+
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
+import duckdb
+
+from src.common.base.base_class import BaseClass
+from src.common.errors.errors import KaggleDatasetProviderError
+from src.config.constants import KAGGLE_CATALOG_FILE
+from src.infrastructure.cache.dataset_columnar_cache import DatasetColumnarCache, SourceFingerprint
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+CATALOG_VERSION = "1"
+"""Versão do esquema do catálogo; alterá-la recria a tabela `manga`."""
+
+MANGA_TABLE = "manga"
+"""Tabela dos mangás no catálogo."""
+
+INTERNAL_COLUMNS = ("manga_id", "title_lower", "bm25_score")
+"""Colunas do catálogo (e da busca BM25) que não existem no CSV e ficam fora dos registros."""
+
+MATCH_COLUMNS = ("query", "match_type", "similarity")
+"""Colunas da busca em lote que descrevem a correspondência, não a linha do catálogo."""
+
+
+@dataclass(frozen=True)
+class TitleMatch:
+    """Linha do catálogo encontrada para um título buscado em lote."""
+
+    record: dict[str, Any]
+    """Linha da tabela `manga`, com as colunas do CSV."""
+
+    match_type: str
+    """Qualidade da correspondência: `exact`, `prefix` ou `contains`."""
+
+    similarity: float
+    """Similaridade Jaro-Winkler entre o título buscado e o do catálogo (0 a 1)."""
+
+
+class KaggleCatalog(BaseClass):
+    """Mantém o banco DuckDB do catálogo e responde às buscas por título."""
+
+    def __init__(
+        self,
+        database_path: Path = KAGGLE_CATALOG_FILE,
+        dataset_cache: DatasetColumnarCache | None = None,
+    ) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.database_path: Path = Path(database_path)
+        """Arquivo do banco: `./data/datasets/kaggle_catalog.duckdb`"""
+
+        self.dataset_cache: DatasetColumnarCache = dataset_cache or DatasetColumnarCache()
+        """Cache colunar usado como fonte da tabela."""
+
+        self.full_text: bool = False
+        """Indica se o índice de texto completo (`fts`) está disponível nesta conexão."""
+
+        self._connection: duckdb.DuckDBPyConnection | None = None
+        """Conexão aberta no primeiro uso e reaproveitada."""
+
+    def __enter__(self) -> Self:
+        """Permite o uso da classe como gerenciador de contexto."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Fecha a conexão ao sair do gerenciador de contexto."""
+        self.close()
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        """Conexão com o banco do catálogo, aberta uma única vez."""
+        if self._connection is None:
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = duckdb.connect(str(self.database_path))
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS catalog_sources (name VARCHAR PRIMARY KEY, source JSON)"
+            )
+            self.full_text = self._load_full_text() and self._has_full_text_index()
+        return self._connection
+
+    def close(self) -> None:
+        """Fecha a conexão, se aberta."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _load_full_text(self, *, install: bool = False) -> bool:
+        """Carrega a extensão `fts` (instalando-a, se pedido); sem ela, a busca usa `LIKE`."""
+        statements = ("INSTALL fts", "LOAD fts") if install else ("LOAD fts",)
+        try:
+            for statement in statements:
+                self.connection.execute(statement)
+        except duckdb.Error:
+            return False
+        return True
+
+    def _has_full_text_index(self) -> bool:
+        """Indica se o índice `fts` da tabela `manga` já foi criado no banco."""
+        row = self.connection.execute(
+            "SELECT count(*) FROM information_schema.schemata WHERE schema_name = ?",
+            [f"fts_main_{MANGA_TABLE}"],
+        ).fetchone()
+        return bool(row and row[0])
+
+    def _source_of(self, csv_path: Path) -> str:
+        """Identificação do CSV e das versões do cache e do catálogo usada na tabela."""
+        source = asdict(SourceFingerprint.of(csv_path))
+        return json.dumps({**source, "catalog_version": CATALOG_VERSION}, sort_keys=True)
+
+    def is_fresh(self, csv_path: Path) -> bool:
+        """Indica se a tabela `manga` foi criada a partir da versão atual do CSV."""
+        row = self.connection.execute(
+            "SELECT source FROM catalog_sources WHERE name = ?", [MANGA_TABLE]
+        ).fetchone()
+        return row is not None and row[0] == self._source_of(Path(csv_path))
+
+    def refresh(self, csv_path: Path, *, force: bool = False) -> None:
+        """(Re)cria a tabela `manga` e seus índices se o CSV mudou desde a última carga."""
+        csv_path = Path(csv_path)
+        if not force and self.is_fresh(csv_path):
+            return
+
+        parquet_path = self.dataset_cache.ingest(csv_path)
+        connection = self.connection
+        # A instalação (download) da extensão só é tentada ao (re)criar o catálogo
+        full_text = self._load_full_text(install=True)
+        if not full_text:
+            self.logger.warning("Extensão 'fts' do DuckDB indisponível; busca via LIKE.")
+        try:
+            connection.execute("BEGIN TRANSACTION")
+            connection.execute(
+                f"""
+                CREATE OR REPLACE TABLE {MANGA_TABLE} AS
+                SELECT
+                    CAST(row_number() OVER () AS INTEGER) AS manga_id,
+                    *,
+                    lower(Title) AS title_lower
+                FROM read_parquet(?)
+                """,
+                [str(parquet_path)],
+            )
+            connection.execute(f"CREATE INDEX manga_title_lower ON {MANGA_TABLE} (title_lower)")
+            connection.execute(
+                "INSERT OR REPLACE INTO catalog_sources VALUES (?, ?)",
+                [MANGA_TABLE, self._source_of(csv_path)],
+            )
+            connection.execute("COMMIT")
+        except duckdb.Error as e:
+            connection.execute("ROLLBACK")
+            msg = f"Erro ao carregar '{csv_path.name}' no catálogo DuckDB."
+            self.logger.exception(msg)
+            raise KaggleDatasetProviderError(msg) from e
+
+        # O índice `fts` é opcional e criado após o COMMIT; se falhar, a busca usa `LIKE`
+        if full_text:
+            try:
+                connection.execute(
+                    f"PRAGMA create_fts_index('{MANGA_TABLE}', 'manga_id', 'Title', overwrite = 1)"
+                )
+            except duckdb.Error:
+                self.logger.warning("Falha ao criar o índice 'fts'; busca via LIKE.", exc_info=True)
+                full_text = False
+        self.full_text = full_text
+        self.logger.info(f"Catálogo DuckDB atualizado: '{self.database_path}'")
+
+    def _records(self, query: str, parameters: list[Any]) -> list[dict[str, Any]]:
+        """Executa a consulta e retorna as linhas como dicionários, sem as colunas internas."""
+        cursor = self.connection.execute(query, parameters)
+        columns = [description[0] for description in cursor.description]
+        return [
+            {
+                name: value
+                for name, value in zip(columns, row, strict=True)
+                if name not in INTERNAL_COLUMNS
+            }
+            for row in cursor.fetchall()
+        ]
+
+    def lookup(self, title: str) -> list[dict[str, Any]]:
+        """Busca exata (sem diferenciar maiúsculas), servida pelo índice ART de `title_lower`."""
+        return self._records(
+            f"SELECT * FROM {MANGA_TABLE} WHERE title_lower = ?", [title.strip().lower()]
+        )
+
+    def lookup_titles(self, titles: Iterable[str]) -> dict[str, list[TitleMatch]]:
+        """Busca vários títulos em uma única junção SQL sobre a tabela `manga`.
+
+        Cada título casa com as linhas que o contêm (sem diferenciar maiúsculas); as
+        correspondências vêm da melhor para a pior (`exact`, `prefix`, `contains`, depois
+        a similaridade). Títulos sem correspondência ficam com a lista vazia.
+        """
+        queries = list(dict.fromkeys(titles))
+        matches: dict[str, list[TitleMatch]] = {title: [] for title in queries}
+        if not queries:
+            return matches
+
+        cursor = self.connection.execute(
+            f"""
+            WITH queries AS (
+                SELECT DISTINCT query, lower(trim(query)) AS query_lower
+                FROM (SELECT unnest(?::VARCHAR[]) AS query)
+            )
+            SELECT
+                q.query,
+                CASE
+                    WHEN m.title_lower = q.query_lower THEN 'exact'
+                    WHEN starts_with(m.title_lower, q.query_lower) THEN 'prefix'
+                    ELSE 'contains'
+                END AS match_type,
+                jaro_winkler_similarity(q.query_lower, m.title_lower) AS similarity,
+                m.*
+            FROM queries AS q
+            JOIN {MANGA_TABLE} AS m ON contains(m.title_lower, q.query_lower)
+            WHERE q.query_lower <> ''
+            ORDER BY
+                q.query,
+                CASE match_type WHEN 'exact' THEN 0 WHEN 'prefix' THEN 1 ELSE 2 END,
+                similarity DESC,
+                m.Popularity
+            """,
+            [queries],
+        )
+        columns = [description[0] for description in cursor.description]
+        for row in cursor.fetchall():
+            values = dict(zip(columns, row, strict=True))
+            record = {
+                name: value
+                for name, value in values.items()
+                if name not in INTERNAL_COLUMNS and name not in MATCH_COLUMNS
+            }
+            matches[values["query"]].append(
+                TitleMatch(record, values["match_type"], round(values["similarity"], 4))
+            )
+        return matches
+
+    def filter_title(self, text: str, limit: int | None = None) -> list[dict[str, Any]]:
+        """Linhas cujo título contém o texto (sem diferenciar maiúsculas), por popularidade.
+
+        Substring literal em `title_lower` (como o `str.contains` do pandas), independente
+        da extensão `fts`. O índice ART não atende substrings: a consulta percorre a tabela
+        já tipada no banco, sem reler o CSV. Para um título exato, use `lookup`.
+        """
+        return self._records(
+            f"""
+            SELECT * FROM {MANGA_TABLE}
+            WHERE contains(title_lower, ?) ORDER BY Popularity LIMIT ?
+            """,
+            [text.strip().lower(), limit],
+        )
+
+    def search(self, text: str, limit: int | None = 10) -> list[dict[str, Any]]:
+        """Busca ranqueada: BM25 no índice `fts` (por termos) ou, sem ele, `filter_title`.
+
+        Com o `fts`, um título com qualquer termo do texto é candidato; para filtrar por
+        substring de forma determinística, use `filter_title`. Sem `limit`, retorna tudo.
+        A relevância fica em `bm25_score`: o DuckDB não diferencia maiúsculas nos nomes de
+        coluna, e um alias `score` colidiria com a nota `Score` do CSV.
+        """
+        if self.full_text:
+            return self._records(
+                f"""
+                SELECT * FROM (
+                    SELECT *, fts_main_{MANGA_TABLE}.match_bm25(manga_id, ?) AS bm25_score
+                    FROM {MANGA_TABLE}
+                ) WHERE bm25_score IS NOT NULL ORDER BY bm25_score DESC LIMIT ?
+                """,
+                [text, limit],
+            )
+        return self.filter_title(text, limit)
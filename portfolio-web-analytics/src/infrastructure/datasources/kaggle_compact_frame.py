@@ -0,0 +1,183 @@
+"""Representação compacta em memória do dataset de mangás do Kaggle.
+
+Colunas de baixa cardinalidade (`Status`, `Serialization`, `Author`) viram `category` e as
+contagens inteiras são reduzidas ao menor tipo que comporta os valores. As listas de rótulos
+(`Genres`, `Themes`, `Demographics`) viram bitsets NumPy indexados por um vocabulário (um bit
+por rótulo), de modo que consultas como "todos os títulos Seinen psicológicos" são máscaras
+booleanas vetorizadas.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.common.errors.errors import KaggleDatasetProviderError
+from src.infrastructure.cache.dataset_columnar_cache import LIST_ITEM_PATTERN, MANGA_STATUS
+
+COMPACT_CATEGORICAL_COLUMNS: dict[str, tuple[str, ...] | None] = {
+    "Status": MANGA_STATUS,
+    "Serialization": None,
+    "Author": None,
+}
+"""Colunas convertidas para `category`; None infere as categorias dos próprios valores."""
+
+LABEL_COLUMNS = ("Genres", "Themes", "Demographics")
+"""Colunas com listas de rótulos, codificadas como bitsets."""
+
+
+def _label_lists(series: pd.Series) -> pd.Series:
+    """Listas de rótulos a partir do literal Python do CSV ou das listas do cache colunar."""
+    if pd.api.types.is_string_dtype(series):
+        return series.astype("string").str.findall(LIST_ITEM_PATTERN)
+    return series.map(lambda items: [] if items is None else list(items))
+
+
+@dataclass(frozen=True)
+class LabelBitset:
+    """Conjunto de rótulos por linha codificado como bitset (multi-hot empacotado em bytes)."""
+
+    vocabulary: tuple[str, ...]
+    """Rótulos conhecidos, em ordem alfabética; a posição é o bit na linha."""
+
+    bits: np.ndarray
+    """Matriz `uint8` de forma (linhas, ceil(rótulos / 8)), empacotada com `np.packbits`."""
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "LabelBitset":
+        """Codifica uma coluna de listas (ou de literais `"['Action', ...]"`) em uma passada."""
+        exploded = _label_lists(series).reset_index(drop=True).explode().dropna().astype(str)
+        vocabulary = tuple(sorted(exploded.unique()))
+        matrix = np.zeros((len(series), len(vocabulary)), dtype=bool)
+        codes = pd.Categorical(exploded, categories=vocabulary).codes
+        matrix[exploded.index.to_numpy(), codes] = True
+        return cls(vocabulary, np.packbits(matrix, axis=1))
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos bits e pelo vocabulário, em bytes."""
+        return self.bits.nbytes + sum(len(label) for label in self.vocabulary)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Matriz booleana (linhas, rótulos) desempacotada."""
+        return np.unpackbits(self.bits, axis=1, count=len(self.vocabulary)).astype(bool)
+
+    def positions(self, labels: Iterable[str]) -> list[int]:
+        """Bits dos rótulos, sem diferenciar maiúsculas.
+
+        Ex.: `psychological` -> posição de `Psychological`.
+        """
+        index = {label.casefold(): position for position, label in enumerate(self.vocabulary)}
+        positions = []
+        for label in labels:
+            position = index.get(label.casefold())
+            if position is None:
+                msg = f"Rótulo desconhecido: '{label}'. Disponíveis: {', '.join(self.vocabulary)}"
+                raise KaggleDatasetProviderError(msg)
+            positions.append(position)
+        return positions
+
+    def has(self, position: int) -> np.ndarray:
+        """Máscara das linhas com o bit informado, lida direto da coluna de bytes."""
+        return (self.bits[:, position >> 3] & (0x80 >> (position & 7))) != 0
+
+    def mask(self, labels: Iterable[str], *, match_all: bool = True) -> np.ndarray:
+        """Máscara das linhas com todos os rótulos (ou com algum, se `match_all=False`)."""
+        positions = self.positions(labels)
+        if not positions:
+            return np.ones(len(self.bits), dtype=bool)
+        mask = self.has(positions[0])
+        for position in positions[1:]:
+            mask = mask & self.has(position) if match_all else mask | self.has(position)
+        return mask
+
+    def labels_at(self, row: int) -> list[str]:
+        """Rótulos da linha informada (posição, não índice do DataFrame)."""
+        bits = np.unpackbits(self.bits[row], count=len(self.vocabulary))
+        return [self.vocabulary[position] for position in np.flatnonzero(bits)]
+
+    def counts(self) -> pd.Series:
+        """Quantidade de linhas por rótulo, da mais à menos frequente."""
+        return pd.Series(self.matrix.sum(axis=0), index=self.vocabulary).sort_values(
+            ascending=False
+        )
+
+
+@dataclass(frozen=True)
+class CompactMangaFrame:
+    """DataFrame de mangás com tipos compactos e os rótulos em bitsets."""
+
+    frame: pd.DataFrame
+    """Colunas escalares com tipos compactos, sem as colunas de `LABEL_COLUMNS`."""
+
+    labels: dict[str, LabelBitset]
+    """Bitset de rótulos de cada coluna de `LABEL_COLUMNS`."""
+
+    @classmethod
+    def from_dataframe(cls, dataframe: pd.DataFrame) -> "CompactMangaFrame":
+        """Converte o DataFrame do provider (CSV bruto ou cache colunar tipado)."""
+        frame = dataframe.drop(columns=list(LABEL_COLUMNS)).reset_index(drop=True)
+        for column in frame.columns:
+            if pd.api.types.is_integer_dtype(frame[column]):
+                frame[column] = pd.to_numeric(frame[column], downcast="integer")
+        for column, categories in COMPACT_CATEGORICAL_COLUMNS.items():
+            frame[column] = pd.Categorical(frame[column], categories=categories)
+        labels = {column: LabelBitset.from_series(dataframe[column]) for column in LABEL_COLUMNS}
+        return cls(frame, labels)
+
+    def __len__(self) -> int:
+        """Quantidade de linhas."""
+        return len(self.frame)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória total (profunda) da representação compacta, em bytes."""
+        frame_bytes = int(self.frame.memory_usage(deep=True).sum())
+        return frame_bytes + sum(bitset.nbytes for bitset in self.labels.values())
+
+    def mask(
+        self,
+        *,
+        genres: Iterable[str] = (),
+        themes: Iterable[str] = (),
+        demographics: Iterable[str] = (),
+        match_all: bool = True,
+    ) -> np.ndarray:
+        """Máscara das linhas com os rótulos pedidos em cada coluna.
+
+        Ex.: `mask(demographics=["Seinen"], themes=["Psychological"])`. Entre colunas as
+        condições são sempre combinadas com E; `match_all` vale dentro de cada coluna.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, labels in zip(LABEL_COLUMNS, (genres, themes, demographics), strict=True):
+            mask &= self.labels[column].mask(labels, match_all=match_all)
+        return mask
+
+    def select(self, mask: np.ndarray) -> pd.DataFrame:
+        """Linhas da máscara, com as colunas escalares."""
+        return self.frame[mask]
+
+    def memory_report(self, original: pd.DataFrame) -> dict[str, Any]:
+        """Compara a memória (profunda) do DataFrame original com a da representação compacta."""
+        original_usage = original.memory_usage(deep=True, index=False)
+        compact_usage = self.frame.memory_usage(deep=True, index=False)
+        columns = {
+            column: {
+                "original_bytes": int(original_usage[column]),
+                "compact_bytes": int(
+                    self.labels[column].nbytes if column in self.labels else compact_usage[column]
+                ),
+            }
+            for column in original.columns
+        }
+        original_bytes = int(original.memory_usage(deep=True).sum())
+        return {
+            "rows": len(self),
+            "original_mib": round(original_bytes / 1024**2, 2),
+            "compact_mib": round(self.nbytes / 1024**2, 2),
+            "reduction": round(1 - self.nbytes / original_bytes, 4) if original_bytes else None,
+            "columns": columns,
+        }
@@ -1,15 +1,22 @@
 """Módulo responsável pelo download e carregamento de datasets do Kaggle."""
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import duckdb
 import kagglehub
 import pandas as pd
 
 from src.common.base.base_class import BaseClass
 from src.common.errors.errors import KaggleDatasetProviderError
 from src.config.constants import DATASETS_DIR
+from src.infrastructure.cache.dataset_columnar_cache import (
+    DEFAULT_CHUNK_ROWS,
+    DatasetColumnarCache,
+    DatasetQuery,
+)
+from src.infrastructure.datasources.kaggle_catalog import KaggleCatalog, TitleMatch
+from src.infrastructure.datasources.kaggle_compact_frame import CompactMangaFrame
 from src.infrastructure.logger import LoggerSingleton
 
 if TYPE_CHECKING:
@@ -41,6 +48,22 @@ class KaggleDatasetProvider(BaseClass):
         self.datasets_file: list[str] = dataset_config["dataset_files"]
         """Lista de arquivos do dataset a serem baixados. Ex.: `manga.csv`"""
 
+        self.columnar_cache: bool = dataset_config.get("columnar_cache", True)
+        """Se True, `load_dataframe` lê o Parquet tipado gerado a partir do CSV: `True`"""
+
+        self.chunk_rows: int = dataset_config.get("chunk_rows", DEFAULT_CHUNK_ROWS)
+        """Linhas por lote na leitura em streaming (`iter_dataframe`): `100000`"""
+
+        self.dataset_cache = DatasetColumnarCache(dataset_config.get("memory_limit"))
+        """Cache colunar (Parquet) dos CSVs, refeito apenas quando o CSV muda."""
+
+        self.catalog = KaggleCatalog(dataset_cache=self.dataset_cache)
+        """Catálogo DuckDB persistente com a tabela `manga`; a conexão é reaproveitada."""
+
+    def close(self) -> None:
+        """Fecha a conexão com o catálogo DuckDB."""
+        self.catalog.close()
+
     def _is_dataset_cached(self) -> bool:
         """Verifica se todos os arquivos do dataset já existem no cache local."""
         if not self.force_download and self.datasets_path.exists():
@@ -78,16 +101,25 @@ class KaggleDatasetProvider(BaseClass):
             raise
         return self.datasets_path
 
-    def load_dataframe(self, file_name: str) -> pd.DataFrame:
-        """Carrega o arquivo especificado como um DataFrame."""
+    def load_dataframe(self, file_name: str, *, columnar: bool | None = None) -> pd.DataFrame:
+        """Carrega o arquivo especificado como um DataFrame.
+
+        Por padrão (`columnar_cache`), lê o Parquet tipado: contagens numéricas, `Unknown` como
+        nulo, listas reais e `Status` categórico. Com `columnar=False`, lê o CSV bruto.
+        """
         file_path = self.datasets_path / file_name
 
         if not file_path.exists():
             self.download_dataset()
 
         try:
-            dataframe = pd.read_csv(file_path)
+            if self.columnar_cache if columnar is None else columnar:
+                dataframe = self.dataset_cache.read(file_path)
+            else:
+                dataframe = pd.read_csv(file_path)
             self.logger.info(f"Arquivo '{file_name}' carregado com sucesso.")
+        except KaggleDatasetProviderError:
+            raise
         except Exception as e:
             msg = f"Erro ao carregar o arquivo '{file_name}'."
             self.logger.exception(msg)
@@ -95,6 +127,52 @@ class KaggleDatasetProvider(BaseClass):
         else:
             return dataframe
 
+    def load_compact_dataframe(self, file_name: str = "manga.csv") -> CompactMangaFrame:
+        """Carrega o dataset de mangás em representação compacta, com os rótulos em bitsets.
+
+        Colunas de baixa cardinalidade viram `category` e `Genres`/`Themes`/`Demographics`
+        viram bitsets por vocabulário, consultados com `CompactMangaFrame.mask`.
+        """
+        dataframe = self.load_dataframe(file_name)
+        try:
+            compact = CompactMangaFrame.from_dataframe(dataframe)
+        except KeyError as e:
+            msg = f"O arquivo '{file_name}' não tem as colunas do dataset de mangás: {e}"
+            self.logger.exception(msg)
+            raise KaggleDatasetProviderError(msg) from e
+
+        report = compact.memory_report(dataframe)
+        self.logger.info(
+            f"Representação compacta de '{file_name}': {report['original_mib']} MiB -> "
+            f"{report['compact_mib']} MiB."
+        )
+        return compact
+
+    def iter_dataframe(
+        self,
+        file_name: str,
+        query: DatasetQuery | None = None,
+        chunk_rows: int | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Lê o arquivo em lotes tipados, para datasets maiores que a memória disponível.
+
+        Colunas e filtro (`DatasetQuery`) são aplicados pelo DuckDB sobre o Parquet tipado,
+        antes de chegar ao pandas; o pico de memória acompanha `chunk_rows`, não o arquivo.
+        """
+        file_path = self.datasets_path / file_name
+
+        if not file_path.exists():
+            self.download_dataset()
+
+        rows = chunks = 0
+        for chunk in self.dataset_cache.iter_chunks(
+            file_path, query, chunk_rows or self.chunk_rows
+        ):
+            rows += len(chunk)
+            chunks += 1
+            yield chunk
+        self.logger.info(f"Arquivo '{file_name}' lido em {chunks} lotes ({rows} linhas).")
+
     def dataframe_to_json(self, dataframe: pd.DataFrame) -> dict | list[dict]:
         """Converte um DataFrame carregado para um dicionário ou uma lista de dicionários (JSON)."""
         try:
@@ -127,7 +205,7 @@ class KaggleDatasetProvider(BaseClass):
             return filtered_df
 
     def filter_by_manga_name_with_duckdb(self, file_name: str) -> list[dict]:
-        """Filtra o arquivo CSV pelo campo 'Title' com base na variável manga_name usando DuckDB."""
+        """Filtra a tabela `manga` do catálogo DuckDB (recarregada se o CSV mudar) pelo título."""
         file_path = self.datasets_path / file_name
 
         if not file_path.exists():
@@ -136,15 +214,12 @@ class KaggleDatasetProvider(BaseClass):
             raise FileNotFoundError(msg)
 
         try:
-            query = """
-                SELECT *
-                FROM read_csv_auto(?)
-                WHERE Title LIKE ?
-            """
-            result: duckdb.DuckDBPyRelation = duckdb.query(
-                query, (str(file_path), f"%{self.manga_name.lower()}%")
-            )
-            filtered_data = result.to_df().to_dict(orient="records")
+            # O catálogo só é recarregado quando o CSV muda; o filtro (substring, como em
+            # `filter_by_manga_name`) não depende da extensão `fts`
+            self.catalog.refresh(file_path)
+            filtered_data = self.catalog.filter_title(self.manga_name)
+        except KaggleDatasetProviderError:
+            raise
         except Exception as e:
             msg = (
                 f"Erro ao filtrar o arquivo '{file_name}' pelo manga: '{self.manga_name}' "
@@ -157,3 +232,33 @@ class KaggleDatasetProvider(BaseClass):
                 f"Filtragem concluída para o manga: '{self.manga_name}' usando DuckDB."
             )
             return filtered_data
+
+    def lookup_titles(
+        self, titles: Iterable[str], file_name: str = "manga.csv"
+    ) -> dict[str, list[TitleMatch]]:
+        """Busca vários títulos de uma vez, com uma única junção no catálogo DuckDB.
+
+        Retorna, para cada título, as linhas que o contêm com o tipo da correspondência
+        (`exact`, `prefix`, `contains`) e a similaridade, da melhor para a pior.
+        """
+        file_path = self.datasets_path / file_name
+
+        if not file_path.exists():
+            self.download_dataset()
+
+        titles = list(titles)
+        try:
+            self.catalog.refresh(file_path)
+            matches = self.catalog.lookup_titles(titles)
+        except KaggleDatasetProviderError:
+            raise
+        except Exception as e:
+            msg = f"Erro ao buscar {len(titles)} títulos no catálogo DuckDB."
+            self.logger.exception(msg)
+            raise KaggleDatasetProviderError(msg) from e
+        else:
+            found = sum(1 for title_matches in matches.values() if title_matches)
+            self.logger.info(
+                f"Busca em lote concluída: {found}/{len(matches)} títulos encontrados."
+            )
+            return matches
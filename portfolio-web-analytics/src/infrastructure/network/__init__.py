@@ -0,0 +1 @@
+"""Módulo de controle do tráfego HTTP: limite de requisições, novas tentativas e métricas."""
@@ -0,0 +1,108 @@
+"""Substituto offline do Goodreads, servido a partir das páginas salvas em `data/html`.
+
+Permite medir a vazão do scraper sem acessar `goodreads.com`, com latência e erros
+injetados de forma configurável (`goodreads.offline` no `settings.yaml`).
+"""
+
+import asyncio
+from pathlib import Path
+import random
+import re
+import threading
+import time
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+from src.config.constants import HTML_DIR
+
+SEARCH_FIXTURE: Path = HTML_DIR / "search_results.html"
+"""Página de resultados de busca servida pelo substituto: `./data/html/search_results.html`"""
+
+BOOK_FIXTURE: Path = HTML_DIR / "25986929-goodnight-punpun-omnibus-vol-1.html"
+"""Página de livro servida pelo substituto para qualquer `/book/show/{id}`."""
+
+
+class OfflineGoodreadsHandler:
+    """Responde às rotas de busca e de livro com as páginas salvas.
+
+    Os links da página de busca recebem um prefixo derivado da consulta, de modo que cada
+    título pesquisado resolva para uma URL de livro distinta (sem acertos de cache
+    artificiais durante o teste de carga).
+    """
+
+    def __init__(self, offline_config: dict[str, Any] | None = None) -> None:
+        offline_config = offline_config or {}
+
+        self.latency_seconds: float = offline_config.get("latency_ms", 50) / 1000
+        """Latência base de cada resposta. Ex.: `0.05`"""
+
+        self.jitter_seconds: float = offline_config.get("jitter_ms", 20) / 1000
+        """Variação aleatória somada à latência. Ex.: `0.02`"""
+
+        self.error_rate: float = offline_config.get("error_rate", 0.0)
+        """Fração (0 a 1) das respostas substituídas por erro. Ex.: `0.05`"""
+
+        self.error_status: int = offline_config.get("error_status", 503)
+        """Código HTTP das respostas com erro injetado. Ex.: `503`"""
+
+        self.search_html: str = Path(
+            offline_config.get("search_fixture", SEARCH_FIXTURE)
+        ).read_text(encoding="utf-8")
+        """HTML da página de busca servida em `/search`."""
+
+        self.book_html: bytes = Path(offline_config.get("book_fixture", BOOK_FIXTURE)).read_bytes()
+        """HTML da página de livro servida em `/book/show/{id}`."""
+
+        self._random = random.Random(offline_config.get("seed"))  # noqa: S311
+        """Gerador aleatório (semente opcional para execuções reprodutíveis)."""
+
+        self._lock = threading.Lock()
+        """Protege o gerador aleatório entre threads."""
+
+    def _draw(self) -> tuple[float, bool]:
+        """Sorteia a latência e se a resposta deve falhar."""
+        with self._lock:
+            delay = self.latency_seconds + self._random.uniform(0, self.jitter_seconds)
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+    def _respond(self, request: httpx.Request, *, fail: bool) -> httpx.Response:
+        """Monta a resposta para a rota requisitada."""
+        if fail:
+            return httpx.Response(self.error_status, request=request)
+
+        path = request.url.path
+        if path.startswith("/search"):
+            query = request.url.params.get("query") or request.url.params.get("q") or ""
+            prefix = re.sub(r"[^a-z0-9]+", "-", query.casefold()).strip("-") or "offline"
+            html = self.search_html.replace("/book/show/", f"/book/show/{quote(prefix)}-")
+            return httpx.Response(200, text=html, request=request)
+        if path.startswith("/book/show/"):
+            return httpx.Response(
+                200,
+                content=self.book_html,
+                headers={"Content-Type": "text/html; charset=utf-8"},
+                request=request,
+            )
+        return httpx.Response(404, request=request)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Atende requisições do cliente síncrono."""
+        delay, fail = self._draw()
+        time.sleep(delay)
+        return self._respond(request, fail=fail)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Atende requisições do cliente assíncrono."""
+        delay, fail = self._draw()
+        await asyncio.sleep(delay)
+        return self._respond(request, fail=fail)
+
+
+def build_offline_transport(
+    handler: OfflineGoodreadsHandler, *, asynchronous: bool = False
+) -> httpx.MockTransport:
+    """Cria o `httpx.MockTransport` do substituto offline para o cliente informado."""
+    return httpx.MockTransport(handler.handle_async if asynchronous else handler.handle)
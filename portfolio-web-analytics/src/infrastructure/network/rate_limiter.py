@@ -0,0 +1,376 @@
+"""Limite de requisições por host (token bucket), novas tentativas com backoff e métricas.
+
+As classes deste módulo são acopladas aos clientes `httpx` como transports, de modo que
+todas as requisições do scraper (síncronas ou assíncronas) passam pela mesma camada.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+RETRYABLE_TRANSPORT_ERRORS: tuple[type[httpx.TransportError], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+"""Erros de transporte transitórios; os demais (ex.: `UnsupportedProtocol`) não são repetidos."""
+
+
+class TokenBucket:
+    """Token bucket thread-safe, usado tanto por código síncrono quanto assíncrono.
+
+    Cada requisição reserva um token e recebe o tempo de espera necessário; a espera em si
+    é feita pelo chamador (`time.sleep` ou `asyncio.sleep`).
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float) -> None:
+        self.rate_per_second = rate_per_second
+        """Tokens repostos por segundo. Ex.: `2.0`"""
+
+        self.capacity = max(capacity, 1.0)
+        """Quantidade máxima de tokens acumulados (rajada). Ex.: `4`"""
+
+        self._tokens = self.capacity
+        """Tokens disponíveis (negativo quando há reservas pendentes)."""
+
+        self._updated_at = time.monotonic()
+        """Momento da última reposição de tokens."""
+
+        self._blocked_until = 0.0
+        """Momento até o qual o host está bloqueado (ex.: após `Retry-After`)."""
+
+        self._lock = threading.Lock()
+        """Protege o estado do bucket entre threads."""
+
+    def reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos o chamador deve aguardar."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+            self._updated_at = now
+            self._tokens -= 1.0
+
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_second
+            return max(wait, self._blocked_until - now)
+
+    def block_for(self, seconds: float) -> None:
+        """Bloqueia novas requisições ao host pelo período informado."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class HostRateLimiter:
+    """Mantém um token bucket por host."""
+
+    def __init__(self, requests_per_second: float, burst: float) -> None:
+        self.requests_per_second = requests_per_second
+        """Requisições por segundo permitidas por host (`0` desativa o limite)."""
+
+        self.burst = burst
+        """Rajada máxima de requisições por host."""
+
+        self._buckets: dict[str, TokenBucket] = {}
+        """Buckets indexados pelo host."""
+
+        self._lock = threading.Lock()
+        """Protege a criação de buckets entre threads."""
+
+    def bucket_for(self, host: str) -> TokenBucket | None:
+        """Retorna o bucket do host, criando-o na primeira utilização."""
+        if self.requests_per_second <= 0:
+            return None
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+            return self._buckets[host]
+
+
+@dataclass
+class RetryPolicy:
+    """Política de novas tentativas com backoff exponencial, jitter e `Retry-After`."""
+
+    max_attempts: int = 4
+    """Número máximo de tentativas por requisição (incluindo a primeira)."""
+
+    backoff_base_seconds: float = 0.5
+    """Espera base do backoff exponencial."""
+
+    backoff_max_seconds: float = 30.0
+    """Espera máxima entre tentativas."""
+
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+    """Códigos HTTP que disparam uma nova tentativa."""
+
+    @classmethod
+    def from_config(cls, retry_config: dict[str, Any] | None) -> "RetryPolicy":
+        """Cria a política a partir de `goodreads.retry` no `settings.yaml`."""
+        retry_config = retry_config or {}
+        policy = cls()
+        return cls(
+            max_attempts=retry_config.get("max_attempts", policy.max_attempts),
+            backoff_base_seconds=retry_config.get(
+                "backoff_base_seconds", policy.backoff_base_seconds
+            ),
+            backoff_max_seconds=retry_config.get("backoff_max_seconds", policy.backoff_max_seconds),
+            retry_statuses=frozenset(retry_config.get("retry_statuses", policy.retry_statuses)),
+        )
+
+    def should_retry(self, attempt: int, response: httpx.Response | None) -> bool:
+        """Indica se a requisição deve ser repetida (sem resposta = erro de transporte)."""
+        if attempt >= self.max_attempts:
+            return False
+        return response is None or response.status_code in self.retry_statuses
+
+    def retry_after(self, response: httpx.Response | None) -> float | None:
+        """Interpreta o cabeçalho `Retry-After` (segundos ou data HTTP).
+
+        O valor é limitado a `backoff_max_seconds`, para que um servidor não bloqueie o host
+        indefinidamente (ex.: `Retry-After: 86400`).
+        """
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        if value.strip().isdigit():
+            seconds = float(value)
+        else:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            # Datas com fuso `-0000` são devolvidas sem fuso; o padrão HTTP as define em UTC
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=UTC)
+            seconds = max((retry_at - datetime.now(tz=UTC)).total_seconds(), 0.0)
+        return min(seconds, self.backoff_max_seconds)
+
+    def backoff(self, attempt: int) -> float:
+        """Calcula a espera exponencial com jitter completo para a tentativa informada."""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+@dataclass
+class RequestMetrics:
+    """Métricas acumuladas do tráfego HTTP."""
+
+    requests: int = 0
+    """Requisições enviadas (incluindo novas tentativas)."""
+
+    retries: int = 0
+    """Novas tentativas realizadas."""
+
+    throttled_seconds: float = 0.0
+    """Tempo aguardando o limite de requisições (token bucket)."""
+
+    backoff_seconds: float = 0.0
+    """Tempo aguardando entre tentativas (backoff e `Retry-After`)."""
+
+    transfer_seconds: float = 0.0
+    """Tempo efetivo de rede: envio, espera da resposta e leitura do corpo."""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    """Protege os contadores entre threads."""
+
+    def add(self, **values: float) -> None:
+        """Soma os valores informados aos contadores."""
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> dict[str, float]:
+        """Retorna as métricas como dicionário (sem o lock interno)."""
+        with self._lock:
+            return {
+                item.name: getattr(self, item.name)
+                for item in fields(self)
+                if not item.name.startswith("_")
+            }
+
+
+class _TimedByteStream(httpx.SyncByteStream):
+    """Contabiliza o tempo de leitura do corpo da resposta como tempo de transferência."""
+
+    def __init__(self, stream: httpx.SyncByteStream, metrics: RequestMetrics) -> None:
+        self._stream = stream
+        self._metrics = metrics
+
+    def __iter__(self) -> Iterator[bytes]:
+        iterator = iter(self._stream)
+        while True:
+            started = time.perf_counter()
+            chunk = next(iterator, None)
+            self._metrics.add(transfer_seconds=time.perf_counter() - started)
+            if chunk is None:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _AsyncTimedByteStream(httpx.AsyncByteStream):
+    """Versão assíncrona de `_TimedByteStream`."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, metrics: RequestMetrics) -> None:
+        self._stream = stream
+        self._metrics = metrics
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        iterator = aiter(self._stream)
+        while True:
+            started = time.perf_counter()
+            chunk = await anext(iterator, None)
+            self._metrics.add(transfer_seconds=time.perf_counter() - started)
+            if chunk is None:
+                return
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _ResilientTransportMixin:
+    """Lógica comum dos transports síncrono e assíncrono."""
+
+    def _setup(
+        self,
+        limiter: HostRateLimiter,
+        retry_policy: RetryPolicy,
+        metrics: RequestMetrics,
+    ) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.metrics = metrics
+
+    def _next_delay(
+        self, request: httpx.Request, attempt: int, response: httpx.Response | None
+    ) -> float:
+        """Calcula a espera antes da próxima tentativa e bloqueia o host se houver `Retry-After`."""
+        retry_after = self.retry_policy.retry_after(response)
+        delay = retry_after if retry_after is not None else self.retry_policy.backoff(attempt)
+        bucket = self.limiter.bucket_for(request.url.host)
+        if retry_after is not None and bucket is not None:
+            bucket.block_for(retry_after)
+
+        reason = f"HTTP {response.status_code}" if response is not None else "erro de transporte"
+        self.logger.warning(
+            f"Nova tentativa {attempt + 1}/{self.retry_policy.max_attempts} para "
+            f"'{request.url}' em {delay:.2f}s ({reason})."
+        )
+        self.metrics.add(retries=1, backoff_seconds=delay)
+        return delay
+
+
+class RateLimitedTransport(_ResilientTransportMixin, httpx.BaseTransport):
+    """Transport síncrono com limite por host, novas tentativas e métricas."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        limiter: HostRateLimiter,
+        retry_policy: RetryPolicy,
+        metrics: RequestMetrics,
+    ) -> None:
+        self._transport = transport
+        self._setup(limiter, retry_policy, metrics)
+
+    def _throttle(self, request: httpx.Request) -> None:
+        bucket = self.limiter.bucket_for(request.url.host)
+        wait = bucket.reserve() if bucket is not None else 0.0
+        if wait > 0:
+            self.metrics.add(throttled_seconds=wait)
+            time.sleep(wait)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Envia a requisição respeitando o limite do host e repetindo falhas transitórias."""
+        attempt = 1
+        while True:
+            self._throttle(request)
+            started = time.perf_counter()
+            response: httpx.Response | None = None
+            try:
+                response = self._transport.handle_request(request)
+            except RETRYABLE_TRANSPORT_ERRORS:
+                if not self.retry_policy.should_retry(attempt, None):
+                    raise
+            finally:
+                self.metrics.add(requests=1, transfer_seconds=time.perf_counter() - started)
+
+            if response is not None and not self.retry_policy.should_retry(attempt, response):
+                response.stream = _TimedByteStream(response.stream, self.metrics)
+                return response
+
+            delay = self._next_delay(request, attempt, response)
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(_ResilientTransportMixin, httpx.AsyncBaseTransport):
+    """Transport assíncrono com limite por host, novas tentativas e métricas."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: HostRateLimiter,
+        retry_policy: RetryPolicy,
+        metrics: RequestMetrics,
+    ) -> None:
+        self._transport = transport
+        self._setup(limiter, retry_policy, metrics)
+
+    async def _throttle(self, request: httpx.Request) -> None:
+        bucket = self.limiter.bucket_for(request.url.host)
+        wait = bucket.reserve() if bucket is not None else 0.0
+        if wait > 0:
+            self.metrics.add(throttled_seconds=wait)
+            await asyncio.sleep(wait)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Envia a requisição respeitando o limite do host e repetindo falhas transitórias."""
+        attempt = 1
+        while True:
+            await self._throttle(request)
+            started = time.perf_counter()
+            response: httpx.Response | None = None
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRYABLE_TRANSPORT_ERRORS:
+                if not self.retry_policy.should_retry(attempt, None):
+                    raise
+            finally:
+                self.metrics.add(requests=1, transfer_seconds=time.perf_counter() - started)
+
+            if response is not None and not self.retry_policy.should_retry(attempt, response):
+                response.stream = _AsyncTimedByteStream(response.stream, self.metrics)
+                return response
+
+            delay = self._next_delay(request, attempt, response)
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
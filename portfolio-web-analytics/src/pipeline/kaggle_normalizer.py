@@ -0,0 +1,128 @@
+"""Normalização colunar do dataset de mangás do Kaggle, aplicada ao DataFrame inteiro.
+
+Substitui o tratamento linha a linha (`_clean_number` e `ast.literal_eval` por registro) por
+operações vetorizadas do pandas. Aceita tanto o CSV bruto quanto o DataFrame tipado do cache
+colunar (`DatasetColumnarCache`), produzindo as mesmas colunas em ambos os casos.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.cache.dataset_columnar_cache import LIST_ITEM_PATTERN, MANGA_STATUS
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+COUNT_COLUMNS = {
+    "Vote": "vote",
+    "Ranked": "ranked",
+    "Popularity": "popularity",
+    "Members": "members",
+    "Favorite": "favorite",
+    "Volumes": "volumes",
+    "Chapters": "chapters",
+}
+"""Contagens inteiras; valores como `Unknown` viram nulos."""
+
+LIST_COLUMNS = {"Genres": "genres", "Themes": "themes", "Demographics": "demographics"}
+"""Colunas com listas de rótulos."""
+
+TEXT_COLUMNS = {
+    "Title": "title",
+    "Published": "published",
+    "Serialization": "serialization",
+    "Author": "author",
+}
+"""Colunas de texto mantidas como estão."""
+
+PUBLISHED_FORMATS = ("%b %d, %Y", "%b %Y", "%Y")
+"""Formatos das datas de `Published`, do mais ao menos preciso. Ex.: `Mar 15, 2007`"""
+
+
+class KaggleNormalizer(BaseClass):
+    """Converte o DataFrame de mangás em uma tabela tipada, em uma única passada por coluna."""
+
+    def __init__(self) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+    @staticmethod
+    def _counts(series: pd.Series) -> pd.Series:
+        """Contagens como `Int64`, removendo separadores de milhar (`"670,559"`)."""
+        if not pd.api.types.is_numeric_dtype(series):
+            series = pd.to_numeric(
+                series.astype("string").str.replace(",", "", regex=False), errors="coerce"
+            )
+        return series.astype("Int64")
+
+    @staticmethod
+    def _lists(series: pd.Series) -> pd.Series:
+        """Listas de rótulos a partir do literal Python do CSV ou das listas do cache colunar."""
+        if pd.api.types.is_string_dtype(series):
+            return series.astype("string").str.findall(LIST_ITEM_PATTERN).astype(object)
+        return series.map(lambda items: [] if items is None else [str(item) for item in items])
+
+    @staticmethod
+    def _dates(series: pd.Series) -> pd.Series:
+        """Converte `Mar 15, 2007`, `Jul 2008` ou `1986`; outros valores (`?`) viram nulos."""
+        dates = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+        for date_format in PUBLISHED_FORMATS:
+            missing = dates.isna()
+            if not missing.any():
+                break
+            dates[missing] = pd.to_datetime(series[missing], format=date_format, errors="coerce")
+        return dates
+
+    def _published(self, series: pd.Series) -> tuple[pd.Series, pd.Series]:
+        """Separa `Published` em início e fim; sem `to`, o início é também o fim."""
+        published = series.astype("string").str.replace(r"\s+", " ", regex=True).str.strip()
+        parts = published.str.split(" to ", n=1, expand=True)
+        start = parts[0]
+        end = parts[1] if 1 in parts.columns else pd.Series(pd.NA, index=series.index)
+        end = end.where(published.str.contains(" to ", regex=False), start)
+        return self._dates(start), self._dates(end)
+
+    def normalize(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Normaliza todas as linhas: contagens, nulos, listas, status e datas de publicação."""
+        normalized = pd.DataFrame(index=dataframe.index)
+        normalized["title"] = dataframe["Title"].astype("string")
+        normalized["score"] = pd.to_numeric(dataframe["Score"], errors="coerce")
+        for column, name in COUNT_COLUMNS.items():
+            normalized[name] = self._counts(dataframe[column])
+        normalized["status"] = pd.Categorical(
+            dataframe["Status"].astype("string"), categories=MANGA_STATUS
+        )
+        normalized["published"] = dataframe["Published"].astype("string")
+        normalized["published_start"], normalized["published_end"] = self._published(
+            dataframe["Published"]
+        )
+        for column, name in LIST_COLUMNS.items():
+            normalized[name] = self._lists(dataframe[column])
+        for column, name in TEXT_COLUMNS.items():
+            if name not in normalized:
+                normalized[name] = dataframe[column].astype("string")
+
+        self.logger.info(f"Dataset do Kaggle normalizado: {len(normalized)} linhas.")
+        return normalized
+
+    @staticmethod
+    def to_records(normalized: pd.DataFrame) -> list[dict[str, Any]]:
+        """Converte a tabela normalizada em registros serializáveis em JSON.
+
+        Datas viram texto ISO (`2007-03-15`) e valores ausentes viram None.
+        """
+        records = normalized.copy()
+        for column in ("published_start", "published_end"):
+            records[column] = records[column].dt.strftime("%Y-%m-%d")
+        records = records.astype(object).where(records.notna(), None)
+        return [
+            {
+                key: value.item() if isinstance(value, np.generic) else value
+                for key, value in row.items()
+            }
+            for row in records.to_dict(orient="records")
+        ]
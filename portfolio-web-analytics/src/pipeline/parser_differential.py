@@ -0,0 +1,124 @@
+"""Teste diferencial dos engines do `GoodreadsParser` sobre as páginas salvas."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.common.base.base_class import BaseClass
+from src.config.constants import HTML_DIR, PARSER_FILE
+from src.infrastructure.datasources.goodreads_batch_parser import BOOK_PAGE_PATTERN
+from src.infrastructure.datasources.goodreads_parser import GoodreadsParser
+from src.infrastructure.datasources.goodreads_parser_engines import (
+    BeautifulSoupEngine,
+    LxmlEngine,
+)
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+PARSER_VARIANTS: dict[str, Callable[[], dict[str, Any]]] = {
+    "beautifulsoup": lambda: {"engine": BeautifulSoupEngine()},
+    "beautifulsoup_partial": lambda: {"engine": BeautifulSoupEngine(partial_parse=True)},
+    "lxml": lambda: {"engine": LxmlEngine()},
+    "structured_data": lambda: {"engine": LxmlEngine(), "structured_data": True},
+}
+"""Configurações do parser comparadas com a extração por campo (referência)."""
+
+
+@dataclass
+class FieldMismatch:
+    """Campo cujo valor diverge da referência."""
+
+    page: str
+    """Página HTML comparada."""
+
+    variant: str
+    """Configuração do parser que divergiu. Ex.: `lxml`"""
+
+    field: str
+    """Campo do `parser.yaml`."""
+
+    expected: Any
+    """Valor da extração por campo com BeautifulSoup."""
+
+    actual: Any
+    """Valor obtido pela configuração comparada."""
+
+
+@dataclass
+class DifferentialReport:
+    """Resultado consolidado do teste diferencial."""
+
+    pages: int
+    """Páginas comparadas."""
+
+    fields_compared: int
+    """Total de comparações campo a campo."""
+
+    mismatches: list[FieldMismatch] = field(default_factory=list)
+    """Divergências encontradas."""
+
+    elapsed_ms: dict[str, float] = field(default_factory=dict)
+    """Tempo médio por página de cada configuração, em milissegundos."""
+
+    @property
+    def passed(self) -> bool:
+        """Indica se todas as configurações reproduziram a referência."""
+        return not self.mismatches
+
+
+class ParserDifferentialTest(BaseClass):
+    """Executa cada engine sobre um corpus de páginas e compara os campos com a referência."""
+
+    def __init__(self, yaml_path: Path = PARSER_FILE) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        # Registra a inicialização da classe
+        self.logger.info(super()._inicialize_class())
+
+        self.yaml_path: Path = yaml_path
+        """Arquivo de seletores comparado. Ex.: `./src/config/files/parser.yaml`"""
+
+    @staticmethod
+    def corpus(directory: Path = HTML_DIR) -> list[Path]:
+        """Lista as páginas de livro salvas (simples ou comprimidas) no diretório."""
+        return sorted(path for path in directory.iterdir() if BOOK_PAGE_PATTERN.match(path.name))
+
+    def _reference(self, page: Path) -> dict[str, Any]:
+        """Extrai os campos com `find_all` por campo, a implementação de referência."""
+        parser = GoodreadsParser(page)
+        return parser.format_extracted_data(parser.extract_from_yaml_by_field(self.yaml_path))
+
+    def run(self, pages: list[Path] | None = None) -> DifferentialReport:
+        """Compara todas as configurações de `PARSER_VARIANTS` em todas as páginas."""
+        pages = pages if pages is not None else self.corpus()
+        report = DifferentialReport(pages=len(pages), fields_compared=0)
+        elapsed: dict[str, float] = dict.fromkeys(PARSER_VARIANTS, 0.0)
+
+        for page in pages:
+            expected = self._reference(page)
+            for variant, options in PARSER_VARIANTS.items():
+                started = time.perf_counter()
+                actual = GoodreadsParser(page, **options()).run_full_extraction(self.yaml_path)
+                elapsed[variant] += time.perf_counter() - started
+
+                for name, value in expected.items():
+                    report.fields_compared += 1
+                    if actual.get(name) != value:
+                        report.mismatches.append(
+                            FieldMismatch(page.name, variant, name, value, actual.get(name))
+                        )
+
+        report.elapsed_ms = {
+            variant: round(seconds / max(len(pages), 1) * 1000, 2)
+            for variant, seconds in elapsed.items()
+        }
+        self.logger.info(
+            f"Teste diferencial: {report.pages} páginas, {report.fields_compared} comparações, "
+            f"{len(report.mismatches)} divergências."
+        )
+        return report
@@ -0,0 +1,111 @@
+"""Verificação de memória de um `GoodreadsParser` reutilizado ao longo de um lote de páginas."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from src.common.base.base_class import BaseClass
+from src.common.errors.errors import GoodreadsHTMLParserError
+from src.config.constants import HTML_DIR, PARSER_FILE
+from src.infrastructure.datasources.goodreads_batch_parser import GoodreadsBatchParser
+from src.infrastructure.datasources.goodreads_parser import ParserOptions
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+@dataclass
+class MemoryCheckReport:
+    """Memória retida pelo parser ao longo do lote, medida com `tracemalloc`."""
+
+    engine: str
+    """Engine de parsing verificado. Ex.: `beautifulsoup`"""
+
+    pages: int
+    """Páginas processadas."""
+
+    tolerance_kib: float
+    """Crescimento aceito da memória retida após o aquecimento, em KiB."""
+
+    retained_kib: list[float] = field(default_factory=list)
+    """Memória retida em cada amostra, em KiB."""
+
+    peak_kib: list[float] = field(default_factory=list)
+    """Pico de memória entre amostras consecutivas, em KiB."""
+
+    growth_kib: float = 0.0
+    """Maior memória retida menos a da primeira amostra (após o aquecimento), em KiB."""
+
+    @property
+    def flat(self) -> bool:
+        """Indica se a memória retida ficou estável (crescimento dentro da tolerância)."""
+        return self.growth_kib <= self.tolerance_kib
+
+
+class ParserMemoryCheck(BaseClass):
+    """Parseia o mesmo corpus repetidas vezes com um único parser e mede a memória retida."""
+
+    def __init__(
+        self,
+        engine: str = "beautifulsoup",
+        tolerance_kib: float = 256.0,
+        yaml_path: Path = PARSER_FILE,
+    ) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        self.engine: str = engine
+        """Engine de parsing verificado. Ex.: `lxml`"""
+
+        self.tolerance_kib: float = tolerance_kib
+        """Crescimento aceito da memória retida, em KiB: `256`"""
+
+        self.yaml_path: Path = yaml_path
+        """Arquivo de seletores usado na extração: `./src/config/files/parser.yaml`"""
+
+    @staticmethod
+    def corpus(source: Path = HTML_DIR, pages: int = 2000) -> list[Path]:
+        """Repete as páginas da origem (diretório ou arquivo) até completar o total pedido."""
+        html_paths = list(GoodreadsBatchParser.html_paths(source))
+        if not html_paths:
+            msg = f"Nenhuma página encontrada em '{source}'."
+            raise GoodreadsHTMLParserError(msg)
+        return [html_paths[index % len(html_paths)] for index in range(pages)]
+
+    def run(self, pages: list[Path]) -> MemoryCheckReport:
+        """Extrai todas as páginas com o mesmo parser e amostra a memória a cada décimo do lote.
+
+        Sem cache de resultados, para que toda página seja de fato parseada. A primeira
+        amostra (após o aquecimento: plano compilado, caches) é a base da comparação.
+        """
+        parser = ParserOptions(engine=self.engine, parse_cache=False).build_parser()
+        warmup = max(len(pages) // 10, 1)
+        samples: list[tuple[int, int]] = []
+
+        tracemalloc.start()
+        try:
+            for number, page in enumerate(pages, start=1):
+                with parser.load_document(page):
+                    parser.run_full_extraction(self.yaml_path)
+                if number % warmup == 0:
+                    samples.append(tracemalloc.get_traced_memory())
+                    tracemalloc.reset_peak()
+        finally:
+            tracemalloc.stop()
+
+        baseline = samples[0][0] if samples else 0
+        report = MemoryCheckReport(
+            engine=self.engine,
+            pages=len(pages),
+            tolerance_kib=self.tolerance_kib,
+            retained_kib=[round(retained / 1024, 1) for retained, _ in samples],
+            peak_kib=[round(peak / 1024, 1) for _, peak in samples],
+            growth_kib=round((max((r for r, _ in samples), default=0) - baseline) / 1024, 1),
+        )
+        self.logger.info(
+            f"Memória do parser ({self.engine}, {report.pages} páginas): "
+            f"crescimento de {report.growth_kib} KiB (tolerância: {self.tolerance_kib} KiB)."
+        )
+        return report
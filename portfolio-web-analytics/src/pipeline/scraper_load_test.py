@@ -0,0 +1,149 @@
+"""Teste de carga do `GoodreadsScraper` contra o substituto offline do Goodreads."""
+
+from collections.abc import Iterable
+from copy import deepcopy
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from statistics import quantiles
+import tempfile
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.common.base.base_class import BaseClass
+from src.infrastructure.cache.html_cache_backend import build_html_cache_backend
+from src.infrastructure.cache.http_cache_store import HttpCacheStore
+from src.infrastructure.cache.search_index_store import SearchIndexStore
+from src.infrastructure.datasources.goodreads_scraper import GoodreadsScraper
+from src.infrastructure.logger import LoggerSingleton
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+LOAD_TEST_OVERRIDES: dict[str, dict[str, Any]] = {
+    "rate_limit": {"requests_per_second": 0},
+    "retry": {"max_attempts": 1},
+}
+"""Padrões do teste: sem token bucket e sem novas tentativas, para medir o scraper, não a espera."""
+
+
+@dataclass
+class LoadTestReport:
+    """Resultado consolidado de um teste de carga."""
+
+    titles: int
+    """Títulos solicitados."""
+
+    succeeded: int
+    """Títulos baixados com sucesso."""
+
+    failed: int
+    """Títulos com falha após as novas tentativas."""
+
+    concurrency: int
+    """Limite de requisições simultâneas utilizado."""
+
+    elapsed_seconds: float
+    """Duração total do lote."""
+
+    pages_per_second: float
+    """Páginas de livro baixadas por segundo."""
+
+    p50_ms: float
+    """Latência mediana por título (busca + livro, sem a fila de concorrência), em milissegundos."""
+
+    p95_ms: float
+    """Percentil 95 da latência por título, em milissegundos."""
+
+    p99_ms: float
+    """Percentil 99 da latência por título, em milissegundos."""
+
+    queue_p50_ms: float
+    """Espera mediana por título no limite de concorrência, em milissegundos."""
+
+    queue_p95_ms: float
+    """Percentil 95 da espera por título no limite de concorrência, em milissegundos."""
+
+    request_metrics: dict[str, float] = field(default_factory=dict)
+    """Métricas do tráfego HTTP (requisições, novas tentativas, espera e transferência)."""
+
+
+class ScraperLoadTest(BaseClass):
+    """Executa N downloads simultâneos de títulos contra o Goodreads offline e mede a vazão."""
+
+    def __init__(
+        self,
+        goodreads_config: dict[str, Any],
+        titles: int = 100,
+        concurrency: int | None = None,
+        overrides: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
+        """Logger singleton para registrar eventos e erros."""
+
+        # Registra a inicialização da classe
+        self.logger.info(super()._inicialize_class())
+
+        self.titles: int = titles
+        """Quantidade de títulos baixados no teste. Ex.: `100`"""
+
+        self.goodreads_config: dict[str, Any] = deepcopy(goodreads_config)
+        """Cópia das configurações do Goodreads, forçando o transport offline."""
+
+        # Mescla, por seção, os padrões do teste e os valores informados (ex.: `offline`)
+        self.goodreads_config["transport"] = "offline"
+        for layer in (LOAD_TEST_OVERRIDES, overrides or {}):
+            for section, values in layer.items():
+                self.goodreads_config[section] = {
+                    **(self.goodreads_config.get(section) or {}),
+                    **values,
+                }
+        if concurrency:
+            self.goodreads_config["max_concurrency"] = concurrency
+
+    @staticmethod
+    def _cut_points(values: Iterable[float]) -> list[float]:
+        """Calcula os 99 pontos de corte (percentis) dos valores, em segundos."""
+        ordered = sorted(values) or [0.0]
+        if len(ordered) == 1:
+            return ordered * 99
+        return quantiles(ordered, n=100, method="inclusive")
+
+    def _percentile_ms(self, cut_points: list[float], percentile: int) -> float:
+        """Retorna o percentil (1 a 99) em milissegundos a partir dos pontos de corte."""
+        return round(cut_points[percentile - 1] * 1000, 2)
+
+    def run(self) -> LoadTestReport:
+        """Executa o teste com caches temporários (sem acertos de execuções anteriores)."""
+        titles = [f"Load Test Title {index}" for index in range(self.titles)]
+
+        with tempfile.TemporaryDirectory(prefix="goodreads-load-test-") as work_dir:
+            work_path = Path(work_dir)
+            with GoodreadsScraper(self.goodreads_config) as scraper:
+                scraper.search_index = SearchIndexStore(0, work_path / "search_index.json")
+                scraper.cache_store = HttpCacheStore(work_path / "http_cache.json")
+                scraper.cache_backend = build_html_cache_backend(
+                    self.goodreads_config.get("cache"), work_path
+                )
+
+                started = time.perf_counter()
+                result = scraper.execute_download_many(titles)
+                elapsed = time.perf_counter() - started
+
+        cut_points = self._cut_points(result.durations.values())
+        queue_cut_points = self._cut_points(result.queue_waits.values())
+        report = LoadTestReport(
+            titles=len(titles),
+            succeeded=len(result.paths),
+            failed=len(result.failures),
+            concurrency=scraper.max_concurrency,
+            elapsed_seconds=round(elapsed, 3),
+            pages_per_second=round(len(result.paths) / elapsed, 2) if elapsed else 0.0,
+            p50_ms=self._percentile_ms(cut_points, 50),
+            p95_ms=self._percentile_ms(cut_points, 95),
+            p99_ms=self._percentile_ms(cut_points, 99),
+            queue_p50_ms=self._percentile_ms(queue_cut_points, 50),
+            queue_p95_ms=self._percentile_ms(queue_cut_points, 95),
+            request_metrics=scraper.request_metrics.as_dict(),
+        )
+        self.logger.info(f"Teste de carga concluído: {asdict(report)}")
+        return report
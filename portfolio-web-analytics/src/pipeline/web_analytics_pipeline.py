@@ -1,19 +1,31 @@
 """Orquestrador principal: executa scraping, transformação e armazenamento."""
 
-from ast import literal_eval
+from collections.abc import Iterable, Iterator
 import json
 import re
 from typing import TYPE_CHECKING, Any
 
+import pandas as pd
+
 from src.common.base.base_class import BaseClass
 from src.common.echo import echo
-from src.common.errors.errors import ProjectError
-from src.config.constants import DATASETS_DIR, HTML_DIR, OUTPUT_DIR, PARSER_FILE
+from src.common.errors.errors import KaggleDatasetProviderError, ProjectError
+from src.config.constants import (
+    DATASETS_DIR,
+    HTML_DIR,
+    OUTPUT_DIR,
+    PARSER_FILE,
+    PARSER_METRICS_FILE,
+)
+from src.config.constypes import PathLike
 from src.config.settings_manager import SettingsManager
-from src.infrastructure.datasources.goodreads_parser import GoodreadsParser
+from src.infrastructure.datasources.goodreads_batch_parser import GoodreadsBatchParser
+from src.infrastructure.datasources.goodreads_parser import GoodreadsParser, ParserOptions
+from src.infrastructure.datasources.goodreads_parser_metrics import ParserMetrics
 from src.infrastructure.datasources.goodreads_scraper import GoodreadsScraper
 from src.infrastructure.datasources.kaggle_dataset_provider import KaggleDatasetProvider
 from src.infrastructure.logger import LoggerSingleton
+from src.pipeline.kaggle_normalizer import KaggleNormalizer
 
 if TYPE_CHECKING:
     from logging import Logger
@@ -27,7 +39,7 @@ class WebAnalyticsPipeline(BaseClass):
         config_repository: SettingsManager,
         goodreads_repository: GoodreadsScraper,
         kaggle_repository: KaggleDatasetProvider,
-        parser_repository: GoodreadsParser,
+        parser_repository: GoodreadsParser | None = None,
     ):
         self.logger: Logger = LoggerSingleton.logger or LoggerSingleton.get_logger()
         """Logger singleton para registrar eventos e erros."""
@@ -48,7 +60,10 @@ class WebAnalyticsPipeline(BaseClass):
         """Repositório de scraping do Kaggle: `KaggleRepository`"""
 
         self.parser_repository = parser_repository
-        """Repositório de parsing de HTML: `ParserRepository`"""
+        """Parser de HTML reutilizável; sem parser, um é criado pelas opções do `settings.yaml`."""
+
+        self.kaggle_normalizer = KaggleNormalizer()
+        """Normalizador colunar do dataset do Kaggle."""
 
         self.datasets_directory = DATASETS_DIR
         """Diretório onde os datasets serão armazenados, ex: `./data/datasets.`"""
@@ -62,6 +77,9 @@ class WebAnalyticsPipeline(BaseClass):
         self.output_path = self.output_directory / "pipeline_results.json"
         """Caminho do arquivo de saída do pipeline, ex: `./data/output/pipeline_results.json`."""
 
+        self.parser_metrics_path = PARSER_METRICS_FILE
+        """Relatório de métricas do parser, ex: `./data/output/parser_metrics.json`."""
+
     def _abort_pipeline(self, msg: str) -> None:
         self.logger.error(msg)
         raise FileNotFoundError(msg)
@@ -69,6 +87,16 @@ class WebAnalyticsPipeline(BaseClass):
     def _clean_number(self, text: str) -> int:
         return int(re.sub(r"[^\d]", "", text))
 
+    def _export_parser_metrics(self, metrics: ParserMetrics | None) -> None:
+        """Grava o relatório de métricas do parser, se ativas (`goodreads.parser_metrics`)."""
+        if metrics is None:
+            return
+        metrics.export(self.parser_metrics_path)
+        failing = metrics.failing_fields()
+        if failing:
+            self.logger.warning(f"Campos sem valor em parte das páginas: {failing}")
+        self.logger.info(f"Métricas do parser salvas em: '{self.parser_metrics_path}'")
+
     def parse_goodreads(self, data: dict[str, Any]) -> dict[str, Any]:
         """Normaliza e converte os campos extraídos do Goodreads para tipos corretos."""
         return {
@@ -85,26 +113,36 @@ class WebAnalyticsPipeline(BaseClass):
             "description": data["description"],
         }
 
+    def parse_goodreads_pages(
+        self, source: PathLike | Iterable[PathLike] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Parseia em lote as páginas do cache HTML e entrega cada registro normalizado.
+
+        As páginas são distribuídas entre processos (`goodreads.parser_workers`, 0 = um por
+        núcleo); os registros chegam na ordem em que ficam prontos, com o arquivo de origem.
+        """
+        goodreads_settings = self.config_repository.goodreads_settings
+        batch_parser = GoodreadsBatchParser(
+            self.parser_yaml_path,
+            ParserOptions.from_settings(goodreads_settings),
+            max_workers=goodreads_settings.get("parser_workers") or None,
+        )
+        for result in batch_parser.parse(source if source is not None else self.html_directory):
+            if result.record is None:
+                self.logger.warning(f"Falha ao parsear '{result.path}': {result.error}")
+                continue
+            try:
+                normalized = self.parse_goodreads(result.record)
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+                self.logger.warning(f"Campos incompletos em '{result.path}': {e!r}")
+                continue
+            yield {"html_file": result.path.name, **normalized}
+        self._export_parser_metrics(batch_parser.metrics)
+
     def parse_kaggle(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Normaliza e converte os campos extraídos do Kaggle para tipos corretos."""
-        return {
-            "title": data["Title"],
-            "score": data["Score"],
-            "vote": data["Vote"],
-            "ranked": data["Ranked"],
-            "popularity": data["Popularity"],
-            "members": self._clean_number(data["Members"]),
-            "favorite": self._clean_number(data["Favorite"]),
-            "volumes": int(data["Volumes"]),
-            "chapters": int(data["Chapters"]),
-            "status": data["Status"],
-            "published": data["Published"],
-            "genres": literal_eval(data["Genres"]),
-            "themes": literal_eval(data["Themes"]),
-            "demographics": literal_eval(data["Demographics"]),
-            "serialization": data["Serialization"],
-            "author": data["Author"],
-        }
+        """Normaliza e converte os campos de uma linha do Kaggle para tipos corretos."""
+        normalized = self.kaggle_normalizer.normalize(pd.DataFrame([data]))
+        return self.kaggle_normalizer.to_records(normalized)[0]
 
     def run(self) -> None:
         """Executa o pipeline completo: scraping, parsing, análise e exportação dos dados."""
@@ -142,8 +180,12 @@ class WebAnalyticsPipeline(BaseClass):
 
             # 4. Extrair e formatar dados do HTML
             self.logger.info("Extraindo e formatando dados do HTML.")
-            parser = GoodreadsParser(html_path)
-            extracted_data = parser.run_full_extraction(self.parser_yaml_path)
+            parser = self.parser_repository or ParserOptions.from_settings(
+                self.config_repository.goodreads_settings
+            ).build_parser(cache_backend=self.goodreads_repository.cache_backend)
+            with parser.load_document(html_path):
+                extracted_data = parser.run_full_extraction(self.parser_yaml_path)
+            self._export_parser_metrics(parser.metrics)
             goodreads_normalized = self.parse_goodreads(extracted_data)
             self.logger.info("Dados extraídos e normalizados do Goodreads com sucesso.")
 
@@ -152,12 +194,15 @@ class WebAnalyticsPipeline(BaseClass):
             self.kaggle_repository.download_dataset()
             manga_file = self.config_repository.kaggle_settings["dataset_files"][0]
             manga_dataframe = self.kaggle_repository.load_dataframe(manga_file)
-            filtered_dataframe = self.kaggle_repository.filter_by_manga_name(manga_dataframe)
-            kaggle_json = self.kaggle_repository.dataframe_to_json(filtered_dataframe)
-            if isinstance(kaggle_json, list) and kaggle_json:
-                kaggle_normalized = self.parse_kaggle(kaggle_json[0])
-            else:
-                kaggle_normalized = self.parse_kaggle(kaggle_json)
+            normalized_dataframe = self.kaggle_normalizer.normalize(manga_dataframe)
+            filtered_dataframe = self.kaggle_repository.filter_by_manga_name(
+                normalized_dataframe, column="title"
+            )
+            kaggle_records = self.kaggle_normalizer.to_records(filtered_dataframe)
+            if not kaggle_records:
+                msg = f"Manga '{self.kaggle_repository.manga_name}' não encontrado no Kaggle."
+                raise KaggleDatasetProviderError(msg)
+            kaggle_normalized = kaggle_records[0]
             self.logger.info("Dados do Kaggle processados e normalizados com sucesso.")
 
             # 6. Unir dados extraídos
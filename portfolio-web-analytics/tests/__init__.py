@@ -0,0 +1 @@
+"""Testes automatizados do projeto."""
@@ -0,0 +1,32 @@
+"""Isolamento dos erros por página no parsing em lote."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.config.constants import HTML_DIR, PARSER_FILE
+from src.infrastructure.datasources import goodreads_batch_parser
+from src.infrastructure.datasources.goodreads_batch_parser import (
+    GoodreadsBatchParser,
+    _parse_page,
+    _WorkerState,
+)
+from src.infrastructure.datasources.goodreads_parser import ParserOptions
+
+
+def test_unexpected_page_error_is_recorded_for_the_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Um erro inesperado do parser vira o erro da página, sem interromper o lote."""
+    parser = ParserOptions().build_parser()
+
+    def broken_extraction(_yaml_path: Path) -> dict[str, Any]:
+        raise AttributeError("'NoneType' object has no attribute 'text'")
+
+    monkeypatch.setattr(parser, "run_full_extraction", broken_extraction)
+    monkeypatch.setattr(goodreads_batch_parser, "_worker_state", _WorkerState(PARSER_FILE, parser))
+    page = next(GoodreadsBatchParser.html_paths(HTML_DIR))
+
+    result = _parse_page(page)
+
+    assert result.record is None
+    assert result.error == "AttributeError: 'NoneType' object has no attribute 'text'"
@@ -0,0 +1,31 @@
+"""Ordem da fronteira do crawler após falhas de download."""
+
+from pathlib import Path
+
+from src.infrastructure.datasources.crawl_frontier import CrawlFrontier
+
+BOOK_URL = "https://www.goodreads.com/book/show/25986929"
+"""Livro no nível 1 (prioridade `1 * 2 + 0`)."""
+
+OTHER_BOOK_URL = "https://www.goodreads.com/book/show/13587158"
+"""Outro livro do mesmo nível, descoberto depois."""
+
+AUTHOR_URL = "https://www.goodreads.com/author/show/1226"
+"""Autor no nível 1 (prioridade `1 * 2 + 1`)."""
+
+
+def test_failed_url_keeps_its_tier_and_goes_after_fresh_urls(tmp_path: Path) -> None:
+    """Um livro que falhou não vira autor: volta depois dos livros do nível, antes dos autores."""
+    with CrawlFrontier(tmp_path / "frontier.sqlite3", max_attempts=3) as frontier:
+        frontier.add(BOOK_URL, "book", priority=2, depth=1)
+        frontier.add(OTHER_BOOK_URL, "book", priority=2, depth=1)
+        frontier.add(AUTHOR_URL, "author", priority=3, depth=1)
+
+        first = frontier.pop_next()
+        assert first is not None
+        frontier.mark_failed(first.url, "timeout")
+
+        order = [item.url for item in iter(frontier.pop_next, None)]
+
+    assert first.url == BOOK_URL
+    assert order == [OTHER_BOOK_URL, BOOK_URL, AUTHOR_URL]
@@ -0,0 +1,50 @@
+"""Gravação única (`flush`) e recarga dos índices JSON do cache."""
+
+from pathlib import Path
+
+import httpx
+
+from src.infrastructure.cache.http_cache_store import HttpCacheStore
+from src.infrastructure.cache.search_index_store import SearchIndexStore
+
+BOOK_URL = "https://www.goodreads.com/book/show/25986929"
+"""URL canônica usada nas entradas."""
+
+
+def test_search_index_is_written_once_per_flush(tmp_path: Path) -> None:
+    """As inclusões ficam em memória até o `flush`, que grava o arquivo uma única vez."""
+    index_path = tmp_path / "search_index.json"
+    store = SearchIndexStore(3600, index_path)
+
+    store.put("PunPun", BOOK_URL)
+    store.put("Oyasumi Punpun", BOOK_URL)
+    assert not index_path.exists()
+
+    store.flush()
+    written = index_path.stat().st_mtime_ns
+    store.flush()
+
+    assert index_path.stat().st_mtime_ns == written
+    assert SearchIndexStore(3600, index_path).get("punpun") == BOOK_URL
+
+
+def test_http_cache_entries_survive_close(tmp_path: Path) -> None:
+    """O `close` grava as alterações pendentes, incluindo o hash do conteúdo."""
+    index_path = tmp_path / "http_cache.json"
+    response = httpx.Response(200, headers={"ETag": '"v1"'})
+
+    store = HttpCacheStore(index_path)
+    store.record_download(BOOK_URL, tmp_path / "book.html", response, "abc123")
+    store.close()
+
+    entry = HttpCacheStore(index_path).get(BOOK_URL)
+    assert entry is not None
+    assert (entry.etag, entry.content_hash) == ('"v1"', "abc123")
+
+
+def test_corrupted_index_is_recreated(tmp_path: Path) -> None:
+    """Um arquivo inválido é ignorado, e o índice começa vazio."""
+    index_path = tmp_path / "search_index.json"
+    index_path.write_text("{not json", encoding="utf-8")
+
+    assert SearchIndexStore(3600, index_path).get("PunPun") is None
@@ -0,0 +1,76 @@
+"""Buscas por título no catálogo DuckDB dos datasets do Kaggle."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.datasources.kaggle_catalog import KaggleCatalog
+
+MANGA_CSV = """Title,Score,Popularity
+Oyasumi Punpun,9.02,30
+Punpun Punpun Punpun,6.10,900
+Berserk,9.47,1
+Solanin,8.05,120
+"""
+"""Catálogo mínimo: a ordem por nota (`Score`) difere da ordem por relevância."""
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Iterator[KaggleCatalog]:
+    """Catálogo em um banco temporário, carregado a partir do CSV mínimo."""
+    csv_path = tmp_path / "catalog.csv"
+    csv_path.write_text(MANGA_CSV, encoding="utf-8")
+    catalog = KaggleCatalog(tmp_path / "catalog.duckdb")
+    catalog.refresh(csv_path)
+    yield catalog
+    catalog.close()
+
+
+def test_search_orders_by_relevance_not_by_rating(catalog: KaggleCatalog) -> None:
+    """A relevância não colide com a coluna `Score` (nota) do CSV.
+
+    Substitui o `match_bm25` da extensão `fts` por uma macro de relevância determinística
+    (ocorrências do termo no título), para que o teste não dependa do download da extensão.
+    """
+    catalog.connection.execute("CREATE SCHEMA IF NOT EXISTS fts_main_manga")
+    catalog.connection.execute(
+        """
+        CREATE OR REPLACE MACRO fts_main_manga.match_bm25(id, query) AS (
+            SELECT nullif(
+                (length(title_lower) - length(replace(title_lower, lower(query), '')))
+                    / length(query),
+                0
+            )
+            FROM manga AS m WHERE m.manga_id = id
+        )
+        """
+    )
+    catalog.full_text = True
+
+    results = catalog.search("punpun")
+
+    # Pela nota, "Oyasumi Punpun" (9.02) viria primeiro; pela relevância, o título com
+    # três ocorrências do termo vem antes
+    assert [row["Title"] for row in results] == ["Punpun Punpun Punpun", "Oyasumi Punpun"]
+    assert all("bm25_score" not in row for row in results)
+
+
+def test_search_with_full_text_extension(catalog: KaggleCatalog) -> None:
+    """Com a extensão `fts` real, a busca por um termo só retorna títulos que o contêm."""
+    if not catalog.full_text:
+        pytest.skip("Extensão 'fts' do DuckDB indisponível neste ambiente.")
+
+    results = catalog.search("punpun")
+
+    assert {row["Title"] for row in results} == {"Punpun Punpun Punpun", "Oyasumi Punpun"}
+    assert results[0]["Title"] == "Punpun Punpun Punpun"
+
+
+def test_filter_title_is_a_literal_substring(catalog: KaggleCatalog) -> None:
+    """O filtro casa substrings sem diferenciar maiúsculas, por popularidade."""
+    assert [row["Title"] for row in catalog.filter_title("PUNPUN")] == [
+        "Oyasumi Punpun",
+        "Punpun Punpun Punpun",
+    ]
+    assert catalog.filter_title("%") == []
@@ -0,0 +1,45 @@
+"""Chave do cache de resultados do parsing: HTML, `parser.yaml`, opções e versão."""
+
+from pathlib import Path
+
+from src.config.constants import PARSER_FILE
+from src.infrastructure.cache.parse_result_store import ParseResultStore
+from src.infrastructure.datasources.goodreads_parser import PARSER_VERSION, ParserOptions
+
+HTML = "<html><body><h1>Goodnight Punpun</h1></body></html>"
+"""Página mínima usada nas chaves."""
+
+
+def test_options_that_change_the_result_change_the_key() -> None:
+    """Trocar o engine, o JSON embutido ou o parsing parcial não reaproveita resultados."""
+    variants = [
+        ParserOptions(parse_cache=True),
+        ParserOptions(engine="lxml", parse_cache=True),
+        ParserOptions(structured_data=True, parse_cache=True),
+        ParserOptions(partial_parse=True, parse_cache=True),
+    ]
+
+    keys = {options.build_result_store().key_for(HTML, PARSER_FILE) for options in variants}
+
+    assert len(keys) == len(variants)
+
+
+def test_options_without_effect_on_the_result_share_the_key() -> None:
+    """Métricas não alteram o resultado e, portanto, não alteram a chave."""
+    plain = ParserOptions(parse_cache=True).build_result_store()
+    measured = ParserOptions(parse_cache=True, metrics=True).build_result_store()
+
+    assert plain.key_for(HTML, PARSER_FILE) == measured.key_for(HTML, PARSER_FILE)
+
+
+def test_prune_keeps_only_the_current_configuration(tmp_path: Path) -> None:
+    """O `prune` remove as entradas gravadas com outras opções."""
+    current = ParseResultStore(PARSER_VERSION, "engine=lxml", tmp_path)
+    previous = ParseResultStore(PARSER_VERSION, "engine=beautifulsoup", tmp_path)
+    current.put(current.key_for(HTML, PARSER_FILE), {"title": "Punpun"})
+    previous.put(previous.key_for(HTML, PARSER_FILE), {"title": "Punpun"})
+
+    removed = current.prune(PARSER_FILE)
+
+    assert removed == 1
+    assert current.get(current.key_for(HTML, PARSER_FILE)) == {"title": "Punpun"}
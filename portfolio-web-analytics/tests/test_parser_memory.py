@@ -0,0 +1,26 @@
+"""Memória estável de um GoodreadsParser reutilizado ao longo de um lote de páginas."""
+
+import logging
+
+import pytest
+
+from src.pipeline.parser_memory_check import ParserMemoryCheck
+
+PAGES = 300
+"""Páginas parseadas em cada verificação (o corpus salvo é repetido)."""
+
+TOLERANCE_KIB = 256.0
+"""Crescimento aceito da memória retida após o aquecimento, em KiB."""
+
+
+@pytest.mark.parametrize("engine", ["beautifulsoup", "lxml"])
+def test_reused_parser_keeps_memory_flat(engine: str, caplog: pytest.LogCaptureFixture) -> None:
+    """O parser reutilizado não acumula memória entre páginas (documentos são liberados)."""
+    # O pytest guarda cada registro de log capturado; sem isso, a medição os contaria
+    caplog.set_level(logging.WARNING)
+    check = ParserMemoryCheck(engine, TOLERANCE_KIB)
+
+    report = check.run(check.corpus(pages=PAGES))
+
+    assert report.pages == PAGES
+    assert report.flat, f"Memória retida cresceu {report.growth_kib} KiB: {report.retained_kib}"
@@ -0,0 +1,60 @@
+"""Tipos variáveis do JSON-LD nos dados estruturados da página de livro."""
+
+from typing import Any
+
+import pytest
+
+from src.infrastructure.datasources.goodreads_structured_data import GoodreadsStructuredData
+
+
+def _book(**linked_data: Any) -> GoodreadsStructuredData:
+    """Dados estruturados com apenas o objeto `Book` do JSON-LD."""
+    return GoodreadsStructuredData(linked_data={"@type": "Book", **linked_data})
+
+
+def test_numeric_strings_are_formatted_like_numbers() -> None:
+    """Avaliação e contagens em texto (`"4.23"`, `"20,395"`) geram os mesmos campos."""
+    data = _book(
+        aggregateRating={"ratingValue": "4.23", "ratingCount": "20,395", "reviewCount": 1184}
+    )
+
+    fields = data.fields()
+
+    assert fields["rating"] == "4.23"
+    assert fields["ratings_count"] == "20,395ratings"
+    assert fields["reviews"] == "1,184reviews"
+
+
+def test_invalid_rating_is_left_to_the_dom() -> None:
+    """Um valor não numérico fica de fora, para que o campo seja lido do DOM."""
+    data = _book(aggregateRating={"ratingValue": "n/a", "ratingCount": None})
+
+    fields = data.fields()
+
+    assert "rating" not in fields
+    assert "ratings_count" not in fields
+
+
+@pytest.mark.parametrize(
+    ("author", "name", "url"),
+    [
+        (
+            [{"name": "Inio Asano", "url": "https://www.goodreads.com/author/show/1"}],
+            "Inio Asano",
+            "https://www.goodreads.com/author/show/1",
+        ),
+        (
+            {"name": "Inio Asano", "url": "https://www.goodreads.com/author/show/1"},
+            "Inio Asano",
+            "https://www.goodreads.com/author/show/1",
+        ),
+        ("Inio Asano", "Inio Asano", None),
+        ([], None, None),
+    ],
+)
+def test_author_as_list_object_or_name(author: Any, name: str | None, url: str | None) -> None:
+    """O `author` do JSON-LD pode ser uma lista, um único objeto ou apenas o nome."""
+    fields = _book(author=author).fields()
+
+    assert fields.get("autor") == name
+    assert fields.get("autor_url") == url